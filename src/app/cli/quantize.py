@@ -0,0 +1,78 @@
+import sys
+import logging
+import argparse
+from pathlib import Path
+
+from shared.application import config as shared_config
+from shared.infrastructure.service.ml.backend.yolo_backend import YOLOBackendRegistry, YOLO_BACKENDS
+from shared.infrastructure.service.ml.backend.yolo_quantizer import (
+    YOLOQuantizer,
+    YOLOQuantizationReport
+)
+
+from parking.application import config as parking_config
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Quantize YOLO models to INT8 OpenVINO IR using captured frames."
+    )
+    parser.add_argument(
+        "models",
+        nargs="*",
+        type=Path,
+        help="models to quantize, defaults to the configured vehicle and plate models"
+    )
+    parser.add_argument("--frames", type=Path, help="defaults to ML_FRAME_CAPTURE_PATH")
+    parser.add_argument("--task", default="detect")
+    parser.add_argument("--holdout", type=float, default=0.2)
+    parser.add_argument("--iou-threshold", type=float, default=0.5)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+
+    config_ml = shared_config.Ml()
+    frames = args.frames or config_ml.frame_capture_path
+    if frames is None or not frames.is_dir():
+        parser.error("captured frames directory is missing, set --frames or ML_FRAME_CAPTURE_PATH")
+
+    models: list[Path] = args.models
+    if not models:
+        config_parking_ml = parking_config.Ml()
+        models = [
+            config_parking_ml.vehicle_identifier_yolo_model_path,
+            config_parking_ml.plate_identifier_yolo_model_path,
+        ]
+
+    quantizer = YOLOQuantizer(
+        YOLOBackendRegistry(
+            YOLO_BACKENDS,
+            cache_path=config_ml.yolo_backend_cache_path,
+            benchmark_runs=config_ml.yolo_backend_benchmark_runs
+        ),
+        holdout=args.holdout,
+        iou_threshold=args.iou_threshold
+    )
+
+    for model in dict.fromkeys(models):
+        _print_report(quantizer.quantize(model, args.task, frames))
+
+    return 0
+
+
+def _print_report(report: YOLOQuantizationReport, /) -> None:
+    print(
+        f"{report.model}\n"
+        f"  int8 model:        {report.quantized.path}\n"
+        f"  frames:            {report.calibration_frames} calibration, "
+        f"{report.evaluation_frames} evaluation\n"
+        f"  latency:           {report.reference.backend.name} "
+        f"{report.reference_latency.total_seconds() * 1000:.1f} ms, "
+        f"int8 {report.quantized_latency.total_seconds() * 1000:.1f} ms "
+        f"({report.speedup:.2f}x)\n"
+        f"  agreement:         {report.agreement:.3f} "
+        f"(precision {report.precision:.3f}, recall {report.recall:.3f})"
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,22 @@
+import asyncio
+import logging
 from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from typing import Any
 from collections.abc import Callable, AsyncGenerator
 from fastapi import FastAPI
 
+from shared.application.tool.image_cache_snapshot import ImageCacheSnapshot
+from shared.application.tool.readiness import Readiness
+from shared.application.tool.warmup import Warmup
+from shared.infrastructure.tool.cpu_budget import CpuBudget
+
 from kernel.ui.rest.handler.exception import ExceptionHandler
 
 from di.container import Container
 from app.rest.base import create_app
 
+_logger = logging.getLogger(__name__)
+
 def bootstrap() -> FastAPI:
     container = Container()
     app = create_app(
@@ -27,9 +36,47 @@ def _make_lifespan(container: Container) -> Callable[
 ]:
     @asynccontextmanager
     async def lifespan(app: FastAPI) -> AsyncGenerator[Any]:
+        # Process wide thread limits are set before any model is loaded.
+        cpu_budget = await container.get(CpuBudget)
+        cpu_budget.apply()
+
+        snapshot = await container.get(ImageCacheSnapshot) # type: ignore[type-abstract]
+        await snapshot.restore()
+        persisting = asyncio.create_task(snapshot.persist_periodically())
+
+        # Resolving the warm-up builds the models, including any backend export
+        # or benchmark. That runs before serving: dishka holds the container lock
+        # while a factory runs, so doing it in the background would stall every
+        # request, /health included, rather than let it report not_ready.
+        readiness = await container.get(Readiness) # type: ignore[type-abstract]
+        warmup = await container.get(Warmup) # type: ignore[type-abstract]
+        warming = asyncio.create_task(_warm_up(warmup, readiness))
+
         try:
             yield None
         finally:
-            await container.shutdown()
+            tasks = (warming, persisting)
+            for task in tasks:
+                task.cancel()
+
+            for result in await asyncio.gather(*tasks, return_exceptions=True):
+                if isinstance(result, Exception):
+                    _logger.error("Background task failed", exc_info=result)
+
+            try:
+                await snapshot.persist()
+            finally:
+                await container.shutdown()
 
     return lifespan
+
+
+async def _warm_up(warmup: Warmup, readiness: Readiness, /) -> None:
+    try:
+        await warmup.warm_up()
+    except Exception: # pylint: disable=broad-exception-caught
+        _logger.exception("Model warm-up failed")
+        readiness.mark_failed()
+        return
+
+    readiness.mark_ready()
@@ -4,10 +4,14 @@ from di.container.dishka.providers.provider import Provider
 
 from kernel.application.system.handler import check_health
 from kernel.application.system.handler import echo
+from kernel.application.system.handler import collect_cache_stats
+from kernel.application.system.handler import collect_tier_stats
 
 class KernelProvider(Provider):
     app_handlers = provide_all(
         check_health.Handler,
         echo.Handler,
+        collect_cache_stats.Handler,
+        collect_tier_stats.Handler,
         override=False
     )
@@ -1,11 +1,33 @@
-from dishka import provide, provide_all
+from typing import Any
+from collections.abc import AsyncIterator, Callable
+from datetime import timedelta
+
+from dishka import decorate, provide, provide_all
 
 from di.container.dishka.providers.provider import Provider
 
+from shared.application import config as shared_config
 from shared.application.tool.image_cache import ImageCache
+from shared.application.tool.image_cache_registry import ImageCacheRegistry
+from shared.application.tool.image_cache_snapshot import ImageCacheSnapshot
 from shared.application.tool.image_similarity import ImageSimilarity
+from shared.application.tool.worker_pool import WorkerPool
+from shared.application.tool.warmup import Warmup
+from shared.application.tool.tier_stats_registry import TierStatsRegistry
 
 from shared.infrastructure.tool.image_cache.similarity_image_cache import SimilarityImageCache
+from shared.infrastructure.tool.image_cache.sqlite_image_cache import SqliteImageCache
+from shared.infrastructure.tool.image_cache.default_image_cache_registry import (
+    DefaultImageCacheRegistry
+)
+from shared.infrastructure.tool.image_cache.file_image_cache_snapshot import FileImageCacheSnapshot
+from shared.infrastructure.tool.image_cache.noop_image_cache_snapshot import NoopImageCacheSnapshot
+from shared.infrastructure.service.ml.factory.yolo_provider import YOLOMlDetectionFactory
+from shared.infrastructure.tool.cpu_budget import CpuBudget, CpuConsumer
+from shared.infrastructure.tool.tier_stats.tier_counters import TierCounters
+from shared.infrastructure.tool.tier_stats.default_tier_stats_registry import (
+    DefaultTierStatsRegistry
+)
 
 from parking.domain.service.spot.analyzer import SpotAnalyzer
 from parking.domain.service.vehicle.recognizer import VehicleRecognizer
@@ -16,6 +38,7 @@ from parking.application import config
 from parking.application.factory.contract import ContractFactory
 from parking.application.factory.contract_income import ContractIncomeFactory
 from parking.application.handler import analyze_spot
+from parking.application.handler import analyze_spots
 
 from parking.infrastructure.provider.vehicle.identifier import DefaultVehicleIdentifier
 from parking.infrastructure.provider.vehicle.cache_identifier import (
@@ -32,6 +55,8 @@ from parking.infrastructure.provider.plate.cache_identifier import (
 from parking.infrastructure.factory.vehicle.identifier import VehicleIdentifierFactory
 from parking.infrastructure.factory.plate.identifier import PlateIdentifierFactory
 
+from parking.infrastructure.tool.identifier_warmup import IdentifierWarmup
+
 from parking.ui.rest.mapper.request_income import RequestIncomeMapper
 from parking.ui.rest.mapper.contract_response import ContractResponseMapper
 from parking.ui.rest.mapper.request_command import RequestCommandMapper
@@ -58,12 +83,12 @@ class ParkingProvider(Provider):
 
     app_handlers = provide_all(
         analyze_spot.Handler,
+        analyze_spots.Handler,
         override=False
     )
 
     infra_factories = provide_all(
         VehicleIdentifierFactory,
-        PlateIdentifierFactory,
         override=False
     )
 
@@ -71,15 +96,87 @@ class ParkingProvider(Provider):
     def make_config_ml(self) -> config.Ml:
         return config.Ml()
 
+    @decorate
+    def register_cpu_consumers(
+        self,
+        cpu_budget: CpuBudget,
+        config_shared_ml: shared_config.Ml,
+        config_ml: config.Ml
+    ) -> CpuBudget:
+        # Every concurrently running model instance gets its own share.
+        yolo_models = 0
+        if "yolo" in config_ml.vehicle_identifiers:
+            yolo_models += 1
+
+        if {"yolo", "yolo_hyperlpr"} & set(config_ml.plate_identifiers):
+            yolo_models += 1
+
+        hyperlpr_instances = 0
+        if "hyperlpr" in config_ml.plate_identifiers:
+            hyperlpr_instances += (
+                config_ml.plate_identifier_hyperlpr_processes
+                or config_ml.plate_identifier_hyperlpr_replicas
+            )
+
+        if "yolo_hyperlpr" in config_ml.plate_identifiers:
+            hyperlpr_instances += config_ml.plate_identifier_hyperlpr_replicas
+
+        return cpu_budget.with_consumers({
+            "yolo": CpuConsumer(
+                instances=yolo_models * (
+                    config_shared_ml.yolo_processes or config_shared_ml.yolo_replicas
+                ),
+                threads=config_shared_ml.yolo_replica_threads
+            ),
+            "hyperlpr": CpuConsumer(
+                instances=hyperlpr_instances,
+                threads=config_ml.plate_identifier_hyperlpr_threads
+            ),
+        })
+
+    @provide(override=False)
+    async def make_plate_identifier_factory(
+        self,
+        config_ml: config.Ml,
+        yolo_ml_detection_factory: YOLOMlDetectionFactory,
+        worker_pool: WorkerPool,
+        cpu_budget: CpuBudget,
+        hyperlpr_tier_counters: TierCounters
+    ) -> AsyncIterator[PlateIdentifierFactory]:
+        plate_identifier_factory = PlateIdentifierFactory(
+            config_ml,
+            yolo_ml_detection_factory,
+            worker_pool,
+            cpu_budget,
+            hyperlpr_tier_counters
+        )
+        yield plate_identifier_factory
+
+        await plate_identifier_factory.shutdown()
+
+    @provide(override=False)
+    def make_vehicle_identifiers(
+        self,
+        vehicle_identifier_factory: VehicleIdentifierFactory
+    ) -> tuple[VehicleIdentifier, ...]:
+        return vehicle_identifier_factory.make_all()
+
+    @provide(override=False)
+    def make_plate_identifiers(
+        self,
+        plate_identifier_factory: PlateIdentifierFactory
+    ) -> tuple[PlateIdentifier, ...]:
+        return plate_identifier_factory.make_all()
+
     @provide(override=False)
     def make_vehicle_identifier(
         self,
         config_ml: config.Ml,
-        vehicle_identifier_factory: VehicleIdentifierFactory,
+        vehicle_identifiers: tuple[VehicleIdentifier, ...],
         image_cache: ImageCache[CacheVehicleIdentifierResult]
     ) -> VehicleIdentifier:
         default_identifier = DefaultVehicleIdentifier(
-            vehicle_identifier_factory.make_all()
+            vehicle_identifiers
         )
         if not config_ml.vehicle_identifier_cache:
             return default_identifier
@@ -93,11 +190,11 @@ class ParkingProvider(Provider):
     def make_plate_identifier(
         self,
         config_ml: config.Ml,
-        plate_identifier_factory: PlateIdentifierFactory,
+        plate_identifiers: tuple[PlateIdentifier, ...],
         image_cache: ImageCache[CachePlateIdentifierResult]
     ) -> PlateIdentifier:
         default_identifier = DefaultPlateIdentifier(
-            plate_identifier_factory.make_all()
+            plate_identifiers
         )
         if not config_ml.plate_identifier_cache:
             return default_identifier
@@ -111,22 +208,129 @@ class ParkingProvider(Provider):
     def make_vehicle_identifier_image_cache(
         self,
         config_ml: config.Ml,
-        similarity: ImageSimilarity
+        similarity: ImageSimilarity,
+        worker_pool: WorkerPool
     ) -> ImageCache[CacheVehicleIdentifierResult]:
-        return SimilarityImageCache(
-            max_size=1000,
-            tolerance=config_ml.vehicle_identifier_cache_tolerance,
-            similarity=similarity
+        return self._make_identifier_image_cache(
+            config_ml,
+            similarity,
+            worker_pool,
+            name="vehicle_identifier",
+            value_type=CacheVehicleIdentifierResult,
+            max_size=config_ml.vehicle_identifier_cache_size,
+            partition_max_size=config_ml.vehicle_identifier_cache_partition_size,
+            tolerance=config_ml.vehicle_identifier_cache_tolerance
         )
 
     @provide(override=False)
     def make_plate_identifier_image_cache(
         self,
         config_ml: config.Ml,
-        similarity: ImageSimilarity
+        similarity: ImageSimilarity,
+        worker_pool: WorkerPool
     ) -> ImageCache[CachePlateIdentifierResult]:
-        return SimilarityImageCache(
-            max_size=1000,
-            tolerance=config_ml.plate_identifier_cache_tolerance,
-            similarity=similarity
+        return self._make_identifier_image_cache(
+            config_ml,
+            similarity,
+            worker_pool,
+            name="plate_identifier",
+            value_type=CachePlateIdentifierResult,
+            max_size=config_ml.plate_identifier_cache_size,
+            partition_max_size=config_ml.plate_identifier_cache_partition_size,
+            tolerance=config_ml.plate_identifier_cache_tolerance
         )
+
+    @provide(override=False)
+    def make_image_cache_registry(
+        self,
+        vehicle_image_cache: ImageCache[CacheVehicleIdentifierResult],
+        plate_image_cache: ImageCache[CachePlateIdentifierResult]
+    ) -> ImageCacheRegistry:
+        return DefaultImageCacheRegistry({
+            "vehicle_identifier": vehicle_image_cache,
+            "plate_identifier": plate_image_cache,
+        })
+
+    @provide(override=False)
+    def make_hyperlpr_tier_counters(self, config_ml: config.Ml) -> TierCounters:
+        return TierCounters(config_ml.plate_identifier_hyperlpr_detect_levels)
+
+    @provide(override=False)
+    def make_tier_stats_registry(
+        self,
+        hyperlpr_tier_counters: TierCounters
+    ) -> TierStatsRegistry:
+        return DefaultTierStatsRegistry({
+            "plate_identifier_hyperlpr": hyperlpr_tier_counters,
+        })
+
+    @provide(override=False)
+    def make_image_cache_snapshot(
+        self,
+        config_ml: config.Ml,
+        image_cache_registry: ImageCacheRegistry,
+        worker_pool: WorkerPool
+    ) -> ImageCacheSnapshot:
+        if config_ml.identifier_cache_snapshot_path is None:
+            return NoopImageCacheSnapshot()
+
+        return FileImageCacheSnapshot(
+            config_ml.identifier_cache_snapshot_path,
+            image_cache_registry,
+            worker_pool,
+            interval=timedelta(seconds=config_ml.identifier_cache_snapshot_interval),
+            value_types={
+                "vehicle_identifier": CacheVehicleIdentifierResult,
+                "plate_identifier": CachePlateIdentifierResult,
+            }
+        )
+
+    @provide(override=False)
+    def make_warmup(
+        self,
+        config_ml: config.Ml,
+        vehicle_identifiers: tuple[VehicleIdentifier, ...],
+        plate_identifiers: tuple[PlateIdentifier, ...]
+    ) -> Warmup:
+        return IdentifierWarmup(
+            vehicle_identifiers,
+            plate_identifiers,
+            frame_sizes=config_ml.identifier_warmup_frame_sizes
+        )
+
+    def _make_identifier_image_cache(
+        self,
+        config_ml: config.Ml,
+        similarity: ImageSimilarity,
+        worker_pool: WorkerPool,
+        /,
+        *,
+        name: str,
+        value_type: type[Any],
+        max_size: int,
+        partition_max_size: int,
+        tolerance: float
+    ) -> ImageCache[Any]:
+        factories: dict[str, Callable[[], ImageCache[Any]]] = {
+            "memory": lambda: SimilarityImageCache(
+                max_size=max_size,
+                partition_max_size=partition_max_size,
+                tolerance=tolerance,
+                similarity=similarity
+            ),
+            "sqlite": lambda: SqliteImageCache(
+                path=config_ml.identifier_cache_sqlite_path,
+                name=name,
+                value_type=value_type,
+                max_size=max_size,
+                partition_max_size=partition_max_size,
+                tolerance=tolerance,
+                similarity=similarity,
+                worker_pool=worker_pool
+            ),
+        }
+
+        try:
+            return factories[config_ml.identifier_cache_backend]()
+        except KeyError as exc:
+            raise ValueError("Unknown identifier cache backend") from exc
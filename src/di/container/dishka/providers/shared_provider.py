@@ -1,4 +1,6 @@
-from dishka import provide, provide_all
+from collections.abc import AsyncIterator
+
+from dishka import provide
 
 from di.container.dishka.providers.provider import Provider
 
@@ -11,16 +13,23 @@ from shared.application.http.client.protocol import ClientProtocol as HttpClient
 from shared.application.factory.image import ImageFactory
 from shared.application.service.llm.provider import LLMProvider
 from shared.application.tool.image_similarity import ImageSimilarity
+from shared.application.tool.frame_capture import FrameCapture
+from shared.application.tool.readiness import Readiness
 
 from shared.infrastructure.factory.tool.worker_pool import DefaultWorkerPoolFactory
+from shared.infrastructure.tool.readiness import DefaultReadiness
+from shared.infrastructure.tool.cpu_budget import CpuBudget
 from shared.infrastructure.http.client.httpx_protocol import HttpxClientProtocol
 from shared.infrastructure.factory.dt import DefaultDateTimeFactory
 from shared.infrastructure.factory.image import Cv2ImageFactory
 from shared.infrastructure.service.llm.provider import OpenAILLMProvider
 from shared.infrastructure.service.ml.factory.yolo_provider import YOLOMlDetectionFactory
+from shared.infrastructure.service.ml.backend.yolo_backend import YOLOBackendRegistry, YOLO_BACKENDS
 from shared.infrastructure.tool.image_similarity.image_similarity import ImageSimilarityEvaluator
 from shared.infrastructure.tool.image_similarity.dhash_similarity import DHashSimilarity
 from shared.infrastructure.tool.image_similarity.phash_similarity import PHashSimilarity
+from shared.infrastructure.tool.frame_capture.file_frame_capture import FileFrameCapture
+from shared.infrastructure.tool.frame_capture.noop_frame_capture import NoopFrameCapture
 
 class SharedProvider(Provider):
     domain_datetime_factory = provide(
@@ -29,12 +38,6 @@ class SharedProvider(Provider):
         override=False
     )
 
-    app_worker_pool_factory = provide(
-        source=DefaultWorkerPoolFactory,
-        provides=WorkerPoolFactory,
-        override=False
-    )
-
     app_http_client_protocol = provide(
         source=HttpxClientProtocol,
         provides=HttpClientProtocol,
@@ -47,16 +50,30 @@ class SharedProvider(Provider):
         override=False
     )
 
+    app_readiness = provide(
+        source=DefaultReadiness,
+        provides=Readiness,
+        override=False
+    )
+
     app_llm_provider = provide(
         source=OpenAILLMProvider,
         provides=LLMProvider,
         override=False
     )
 
-    infra_factories = provide_all(
-        YOLOMlDetectionFactory,
-        override=False
-    )
+    @provide(override=False)
+    def make_cpu_budget(self, config_cpu: config.Cpu) -> CpuBudget:
+        return CpuBudget(
+            config_cpu.cores,
+            worker_pool_share=config_cpu.worker_pool_share
+        )
+
+    @provide(override=False)
+    def make_worker_pool_factory(self, cpu_budget: CpuBudget) -> WorkerPoolFactory:
+        return DefaultWorkerPoolFactory(
+            max_workers=cpu_budget.worker_pool_threads
+        )
 
     @provide(override=False)
     def make_worker_pool(
@@ -70,11 +87,70 @@ class SharedProvider(Provider):
         self,
         worker_pool: WorkerPool
     ) -> ImageSimilarity:
-        return ImageSimilarityEvaluator((
-            DHashSimilarity(worker_pool),
-            PHashSimilarity(worker_pool),
-        ))
+        return ImageSimilarityEvaluator(
+            (
+                DHashSimilarity(worker_pool),
+                PHashSimilarity(worker_pool),
+            ),
+            worker_pool
+        )
+
+    @provide(override=False)
+    async def make_frame_capture(
+        self,
+        config_ml: config.Ml,
+        worker_pool: WorkerPool
+    ) -> AsyncIterator[FrameCapture]:
+        if config_ml.frame_capture_path is None:
+            yield NoopFrameCapture()
+            return
+
+        frame_capture = FileFrameCapture(
+            config_ml.frame_capture_path,
+            worker_pool,
+            rate=config_ml.frame_capture_rate,
+            max_frames=config_ml.frame_capture_max_frames
+        )
+        yield frame_capture
+
+        await frame_capture.shutdown()
+
+    @provide(override=False)
+    async def make_yolo_ml_detection_factory(
+        self,
+        config_ml: config.Ml,
+        worker_pool_factory: WorkerPoolFactory,
+        worker_pool: WorkerPool,
+        backend_registry: YOLOBackendRegistry,
+        cpu_budget: CpuBudget
+    ) -> AsyncIterator[YOLOMlDetectionFactory]:
+        yolo_ml_detection_factory = YOLOMlDetectionFactory(
+            config_ml,
+            worker_pool_factory,
+            worker_pool,
+            backend_registry,
+            cpu_budget
+        )
+        yield yolo_ml_detection_factory
+
+        await yolo_ml_detection_factory.shutdown()
+
+    @provide(override=False)
+    def make_yolo_backend_registry(
+        self,
+        config_ml: config.Ml
+    ) -> YOLOBackendRegistry:
+        return YOLOBackendRegistry(
+            YOLO_BACKENDS,
+            backend=config_ml.yolo_backend,
+            cache_path=config_ml.yolo_backend_cache_path,
+            benchmark_runs=config_ml.yolo_backend_benchmark_runs
+        )
 
     @provide(override=False)
     def make_config_ml(self) -> config.Ml:
         return config.Ml()
+
+    @provide(override=False)
+    def make_config_cpu(self) -> config.Cpu:
+        return config.Cpu()
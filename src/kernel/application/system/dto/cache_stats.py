@@ -0,0 +1,14 @@
+from shared.application.dto.base import Base
+
+class CacheStats(Base):
+    cache: str
+    partition: str | None
+    size: int
+    hits: int
+    misses: int
+    expirations: int
+    evictions: int
+    comparisons: int
+    hit_rate: float
+    average_comparisons: float
+    average_latency_ms: float
@@ -2,4 +2,5 @@ from enum import Enum
 
 class HealthStatus(str, Enum):
     SUCCESS = "success"
+    NOT_READY = "not_ready"
     FAILURE = "failure"
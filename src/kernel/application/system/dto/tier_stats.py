@@ -0,0 +1,9 @@
+from shared.application.dto.base import Base
+
+class TierStats(Base):
+    source: str
+    tier: str
+    runs: int
+    hits: int
+    hit_rate: float
+    escalation_rate: float
@@ -1,15 +1,24 @@
 from shared.domain.factory.dt import DateTimeFactory
 
+from shared.application.tool.readiness import Readiness, ReadinessState
+
 from kernel.application.system.handler.check_health.query import Query
 from kernel.application.system.dto.health import Health
 from kernel.application.system.dto.health_status import HealthStatus
 
 class Handler:
-    def __init__(self, dt: DateTimeFactory) -> None:
+    _statuses: dict[ReadinessState, HealthStatus] = {
+        ReadinessState.WARMING_UP: HealthStatus.NOT_READY,
+        ReadinessState.READY: HealthStatus.SUCCESS,
+        ReadinessState.FAILED: HealthStatus.FAILURE,
+    }
+
+    def __init__(self, dt: DateTimeFactory, readiness: Readiness) -> None:
         self._dt = dt
+        self._readiness = readiness
 
     async def handle(self, query: Query, /) -> Health:
         return Health(
-            status=HealthStatus.SUCCESS,
+            status=self._statuses[self._readiness.state()],
             time=self._dt.make_current()
         )
@@ -0,0 +1,7 @@
+from kernel.application.system.handler.collect_cache_stats.query import Query
+from kernel.application.system.handler.collect_cache_stats.handler import Handler
+
+__all__ = [
+    "Query",
+    "Handler",
+]
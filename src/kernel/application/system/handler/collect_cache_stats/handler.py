@@ -0,0 +1,37 @@
+from shared.application.tool.image_cache import ImageCacheStats
+from shared.application.tool.image_cache_registry import ImageCacheRegistry
+
+from kernel.application.system.handler.collect_cache_stats.query import Query
+from kernel.application.system.dto.cache_stats import CacheStats
+
+class Handler:
+    def __init__(self, image_cache_registry: ImageCacheRegistry) -> None:
+        self._image_cache_registry = image_cache_registry
+
+    async def handle(self, query: Query, /) -> tuple[CacheStats, ...]:
+        return tuple([
+            self._make_cache_stats(name, stats)
+            for name, cache in self._image_cache_registry.caches().items()
+            for stats in await cache.stats()
+        ])
+
+    def _make_cache_stats(self, name: str, stats: ImageCacheStats, /) -> CacheStats:
+        lookups = stats.hits + stats.misses
+
+        return CacheStats(
+            cache=name,
+            partition=stats.partition,
+            size=stats.size,
+            hits=stats.hits,
+            misses=stats.misses,
+            expirations=stats.expirations,
+            evictions=stats.evictions,
+            comparisons=stats.comparisons,
+            hit_rate=stats.hits / lookups if lookups else 0.0,
+            average_comparisons=stats.comparisons / lookups if lookups else 0.0,
+            average_latency_ms=(
+                stats.latency.total_seconds() * 1000 / lookups
+                if lookups
+                else 0.0
+            )
+        )
@@ -0,0 +1,4 @@
+from shared.application.handler.base.query import Base
+
+class Query(Base):
+    pass
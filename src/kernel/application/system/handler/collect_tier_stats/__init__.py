@@ -0,0 +1,7 @@
+from kernel.application.system.handler.collect_tier_stats.query import Query
+from kernel.application.system.handler.collect_tier_stats.handler import Handler
+
+__all__ = [
+    "Query",
+    "Handler",
+]
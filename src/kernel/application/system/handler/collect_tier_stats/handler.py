@@ -0,0 +1,43 @@
+from shared.application.tool.tier_stats import TierStats as SourceTierStats
+from shared.application.tool.tier_stats_registry import TierStatsRegistry
+
+from kernel.application.system.handler.collect_tier_stats.query import Query
+from kernel.application.system.dto.tier_stats import TierStats
+
+class Handler:
+    def __init__(self, tier_stats_registry: TierStatsRegistry) -> None:
+        self._tier_stats_registry = tier_stats_registry
+
+    async def handle(self, query: Query, /) -> tuple[TierStats, ...]:
+        return tuple(
+            self._make_tier_stats(name, stats, escalations)
+            for name, source in self._tier_stats_registry.sources().items()
+            for stats, escalations in self._with_escalations(source.tier_stats())
+        )
+
+    def _with_escalations(
+        self,
+        tiers: tuple[SourceTierStats, ...],
+        /
+    ) -> tuple[tuple[SourceTierStats, int], ...]:
+        # Whatever ran on the next tier was escalated from this one.
+        return tuple(
+            (stats, tiers[index + 1].runs if index + 1 < len(tiers) else 0)
+            for index, stats in enumerate(tiers)
+        )
+
+    def _make_tier_stats(
+        self,
+        name: str,
+        stats: SourceTierStats,
+        escalations: int,
+        /
+    ) -> TierStats:
+        return TierStats(
+            source=name,
+            tier=stats.tier,
+            runs=stats.runs,
+            hits=stats.hits,
+            hit_rate=stats.hits / stats.runs if stats.runs else 0.0,
+            escalation_rate=escalations / stats.runs if stats.runs else 0.0
+        )
@@ -0,0 +1,28 @@
+from fastapi import APIRouter, status
+
+from di.container import Provide, inject
+
+from kernel.application.system.handler import collect_cache_stats
+from kernel.ui.rest.base.response import Response
+from kernel.ui.rest.system.response.cache_stats import CachesStatsResponse
+
+router = APIRouter()
+
+@router.get(
+    "/cache_stats",
+    status_code=status.HTTP_200_OK,
+    name="Get image cache statistics",
+    description="Returns hit rate, eviction and latency counters of the image caches per partition."
+)
+@inject
+async def get_cache_stats(
+    handler: Provide[collect_cache_stats.Handler]
+) -> Response[CachesStatsResponse]:
+    query = collect_cache_stats.Query()
+    result = await handler.handle(query)
+
+    return Response[CachesStatsResponse](
+        data=CachesStatsResponse(
+            caches=result
+        )
+    )
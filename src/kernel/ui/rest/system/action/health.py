@@ -1,8 +1,9 @@
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Response as HttpResponse, status
 
 from di.container import Provide, inject
 
 from kernel.application.system.handler import check_health
+from kernel.application.system.dto.health_status import HealthStatus
 from kernel.ui.rest.base.response import Response
 from kernel.ui.rest.system.response.health import HealthResponse
 
@@ -12,14 +13,23 @@ router = APIRouter()
     "/health",
     status_code=status.HTTP_200_OK,
     name="Get system health status",
-    description="Checks the health status of the application."
+    description=(
+        "Checks the health status of the application. "
+        "Responds with 503 until the models are warmed up."
+    ),
+    responses={
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": Response[HealthResponse]}
+    }
 )
 @inject
 async def get_health(
+    http_response: HttpResponse,
     handler: Provide[check_health.Handler]
 ) -> Response[HealthResponse]:
     query = check_health.Query()
     result = await handler.handle(query)
+    if result.status != HealthStatus.SUCCESS:
+        http_response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
 
     return Response[HealthResponse](
         data=HealthResponse(
@@ -0,0 +1,28 @@
+from fastapi import APIRouter, status
+
+from di.container import Provide, inject
+
+from kernel.application.system.handler import collect_tier_stats
+from kernel.ui.rest.base.response import Response
+from kernel.ui.rest.system.response.tier_stats import TiersStatsResponse
+
+router = APIRouter()
+
+@router.get(
+    "/tier_stats",
+    status_code=status.HTTP_200_OK,
+    name="Get tiered identifier statistics",
+    description="Returns run, hit and escalation counters of tiered identifiers per tier."
+)
+@inject
+async def get_tier_stats(
+    handler: Provide[collect_tier_stats.Handler]
+) -> Response[TiersStatsResponse]:
+    query = collect_tier_stats.Query()
+    result = await handler.handle(query)
+
+    return Response[TiersStatsResponse](
+        data=TiersStatsResponse(
+            tiers=result
+        )
+    )
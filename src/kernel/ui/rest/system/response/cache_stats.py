@@ -0,0 +1,5 @@
+from kernel.application.system.dto.cache_stats import CacheStats
+from kernel.ui.rest.base.response import BaseResponse
+
+class CachesStatsResponse(BaseResponse):
+    caches: tuple[CacheStats, ...]
@@ -0,0 +1,5 @@
+from kernel.application.system.dto.tier_stats import TierStats
+from kernel.ui.rest.base.response import BaseResponse
+
+class TiersStatsResponse(BaseResponse):
+    tiers: tuple[TierStats, ...]
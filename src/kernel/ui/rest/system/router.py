@@ -2,6 +2,8 @@ from fastapi import APIRouter
 
 from kernel.ui.rest.system.action.health import router as health_router
 from kernel.ui.rest.system.action.echo import router as echo_router
+from kernel.ui.rest.system.action.cache_stats import router as cache_stats_router
+from kernel.ui.rest.system.action.tier_stats import router as tier_stats_router
 
 system_router = APIRouter(
     prefix="/system",
@@ -10,3 +12,5 @@ system_router = APIRouter(
 
 system_router.include_router(health_router)
 system_router.include_router(echo_router)
+system_router.include_router(cache_stats_router)
+system_router.include_router(tier_stats_router)
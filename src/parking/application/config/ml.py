@@ -1,8 +1,11 @@
-from typing import Annotated
+from typing import Annotated, Literal
+from pathlib import Path
 
 from pydantic import field_validator, Field, FilePath, DirectoryPath
 from pydantic_settings import BaseSettings, SettingsConfigDict, NoDecode
 
+from shared.application.config.validator import parse_optional_path
+
 class Ml(BaseSettings):
     model_config = SettingsConfigDict(
         frozen=True,
@@ -13,19 +16,81 @@ class Ml(BaseSettings):
     vehicle_identifiers: Annotated[tuple[str, ...], NoDecode]
     vehicle_identifier_yolo_model_path: FilePath | DirectoryPath
     vehicle_identifier_yolo_threshold: float = Field(default=0.80, gt=0.0, lt=1.0)
+    vehicle_identifier_yolo_image_size: int = Field(default=640, ge=32)
+    vehicle_identifier_yolo_max_detections: int = Field(default=300, gt=0)
+    vehicle_identifier_yolo_mode: Literal["frame", "spot_roi"] = "frame"
+    vehicle_identifier_yolo_roi_image_size: int = Field(default=320, ge=32)
+    vehicle_identifier_yolo_roi_margin: float = Field(default=0.5, ge=0.0)
     vehicle_identifier_cache: bool = True
     vehicle_identifier_cache_tolerance: float = Field(default=0.20, gt=0.0, lt=1.0)
+    vehicle_identifier_cache_size: int = Field(default=10000, gt=0)
+    vehicle_identifier_cache_partition_size: int = Field(default=100, gt=0)
 
     plate_identifiers: Annotated[tuple[str, ...], NoDecode]
     plate_identifier_yolo_model_path: FilePath | DirectoryPath
     plate_identifier_yolo_threshold: float = Field(default=0.01, gt=0.0, lt=1.0)
+    plate_identifier_yolo_image_size: int = Field(default=640, ge=32)
+    plate_identifier_yolo_max_detections: int = Field(default=10, gt=0)
+    plate_identifier_yolo_mode: Literal["vehicle", "frame"] = "vehicle"
+    plate_identifier_yolo_frame_image_size: int = Field(default=1280, ge=32)
+    plate_identifier_yolo_frame_max_detections: int = Field(default=100, gt=0)
+    plate_identifier_yolo_hyperlpr_margin: float = Field(default=0.15, ge=0.0)
     plate_identifier_hyperlpr_threshold: float = Field(default=0.90, gt=0.0, lt=1.0)
+    plate_identifier_hyperlpr_processes: int = Field(default=0, ge=0)
+    plate_identifier_hyperlpr_replicas: int = Field(default=1, ge=1)
+    plate_identifier_hyperlpr_threads: int = Field(default=0, ge=0)
+    plate_identifier_hyperlpr_detect_levels: Annotated[
+        tuple[Literal["low", "high"], ...],
+        NoDecode
+    ] = ("high",)
     plate_identifier_cache: bool = True
     plate_identifier_cache_tolerance: float = Field(default=0.20, gt=0.0, lt=1.0)
+    plate_identifier_cache_size: int = Field(default=10000, gt=0)
+    plate_identifier_cache_partition_size: int = Field(default=100, gt=0)
+
+    identifier_cache_backend: Literal["memory", "sqlite"] = "memory"
+    identifier_cache_sqlite_path: Path = Path("cache/identifier_cache.sqlite3")
+    identifier_cache_snapshot_path: Path | None = None
+    identifier_cache_snapshot_interval: int = Field(default=300, gt=0)
+    identifier_warmup_frame_sizes: Annotated[tuple[tuple[int, int], ...], NoDecode] = (
+        (640, 640),
+    )
 
-    @field_validator('vehicle_identifiers', 'plate_identifiers', mode='before')
+    @field_validator(
+        'vehicle_identifiers',
+        'plate_identifiers',
+        'plate_identifier_hyperlpr_detect_levels',
+        mode='before'
+    )
     @classmethod
-    def parse_vehicle_identifiers(cls, v: str) -> tuple[str, ...]:
+    def parse_vehicle_identifiers(cls, v: str | tuple[str, ...]) -> tuple[str, ...]:
+        if not isinstance(v, str):
+            return v
+
         return tuple(
             x.strip() for x in v.split(",") if x.strip()
         )
+
+    parse_optional_path = field_validator(
+        'identifier_cache_snapshot_path',
+        mode='before'
+    )(parse_optional_path)
+
+    @field_validator('identifier_warmup_frame_sizes', mode='before')
+    @classmethod
+    def parse_identifier_warmup_frame_sizes(
+        cls,
+        v: str | tuple[tuple[int, int], ...]
+    ) -> tuple[tuple[int, int], ...]:
+        if not isinstance(v, str):
+            return v
+
+        sizes: list[tuple[int, int]] = []
+        for x in v.split(","):
+            if not x.strip():
+                continue
+
+            width, _, height = x.strip().lower().partition("x")
+            sizes.append((int(width), int(height)))
+
+        return tuple(sizes)
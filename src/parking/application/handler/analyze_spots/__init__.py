@@ -0,0 +1,7 @@
+from parking.application.handler.analyze_spots.command import Command
+from parking.application.handler.analyze_spots.handler import Handler
+
+__all__ = [
+    "Command",
+    "Handler",
+]
@@ -0,0 +1,10 @@
+from pydantic import Field
+
+from shared.application.handler.base.command import Base
+from shared.application.dto.contract.income import Image
+
+from parking.application.dto.contract.income import Spot
+
+class Command(Base):
+    image: Image
+    spots: tuple[Spot, ...] = Field(min_length=1)
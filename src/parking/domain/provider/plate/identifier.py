@@ -1,5 +1,6 @@
 from typing import Protocol
 
+from shared.domain.vo.base import Id
 from shared.domain.vo.coordinate import Polygon
 from shared.domain.aggregate.image import Image
 
@@ -10,5 +11,14 @@ class PlateIdentifier(Protocol):
         self,
         image: Image,
         vehicle_coordinate: Polygon,
-        /
+        /,
+        spot_id: Id | None = None
     ) -> Plate | None: ...
+
+    async def identify_many(
+        self,
+        image: Image,
+        vehicle_coordinates: tuple[Polygon, ...],
+        /,
+        spot_ids: tuple[Id, ...] | None = None
+    ) -> tuple[Plate | None, ...]: ...
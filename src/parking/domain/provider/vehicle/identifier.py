@@ -1,5 +1,6 @@
 from typing import Protocol
 
+from shared.domain.vo.base import Id
 from shared.domain.vo.coordinate import Polygon
 from shared.domain.aggregate.image import Image
 
@@ -10,5 +11,14 @@ class VehicleIdentifier(Protocol):
         self,
         image: Image,
         spot_coordinate: Polygon,
-        /
+        /,
+        spot_id: Id | None = None
     ) -> VehicleObserved | None: ...
+
+    async def identify_many(
+        self,
+        image: Image,
+        spot_coordinates: tuple[Polygon, ...],
+        /,
+        spot_ids: tuple[Id, ...] | None = None
+    ) -> tuple[VehicleObserved | None, ...]: ...
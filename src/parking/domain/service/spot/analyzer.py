@@ -15,11 +15,29 @@ class SpotAnalyzer:
     async def analyze(self, image: Image, spot: Spot, /) -> ParkingSpot:
         vehicle = await self._vehicle_recognizer.recognize(
             image,
-            spot.coordinate
+            spot.coordinate,
+            spot_id=spot.id
         )
 
         return self._make_parking_spot(spot, vehicle)
 
+    async def analyze_many(
+        self,
+        image: Image,
+        spots: tuple[Spot, ...],
+        /
+    ) -> tuple[ParkingSpot, ...]:
+        vehicles = await self._vehicle_recognizer.recognize_many(
+            image,
+            tuple(spot.coordinate for spot in spots),
+            spot_ids=tuple(spot.id for spot in spots)
+        )
+
+        return tuple(
+            self._make_parking_spot(spot, vehicle)
+            for spot, vehicle in zip(spots, vehicles, strict=True)
+        )
+
     def _make_parking_spot(
         self,
         spot: Spot,
@@ -1,3 +1,4 @@
+from shared.domain.vo.base import Id
 from shared.domain.vo.coordinate import Polygon
 from shared.domain.aggregate.image import Image
 
@@ -19,15 +20,68 @@ class VehicleRecognizer:
         self,
         image: Image,
         spot_coordinate: Polygon,
+        /,
+        spot_id: Id | None = None
+    ) -> Vehicle | None:
+        vehicle_observed = await self._vehicle_identifier.identify(
+            image,
+            spot_coordinate,
+            spot_id=spot_id
+        )
+
+        return await self._recognize_observed(image, vehicle_observed, spot_id)
+
+    async def recognize_many(
+        self,
+        image: Image,
+        spot_coordinates: tuple[Polygon, ...],
+        /,
+        spot_ids: tuple[Id, ...] | None = None
+    ) -> tuple[Vehicle | None, ...]:
+        vehicles_observed = await self._vehicle_identifier.identify_many(
+            image,
+            spot_coordinates,
+            spot_ids=spot_ids
+        )
+
+        observed = [
+            (i, vehicle_observed)
+            for i, vehicle_observed in enumerate(vehicles_observed)
+            if vehicle_observed is not None
+        ]
+        if not observed:
+            return (None,) * len(vehicles_observed)
+
+        plates = await self._plate_identifier.identify_many(
+            image,
+            tuple(vehicle_observed.coordinate for _, vehicle_observed in observed),
+            spot_ids=(
+                tuple(spot_ids[i] for i, _ in observed)
+                if spot_ids is not None
+                else None
+            )
+        )
+
+        vehicles: list[Vehicle | None] = [None] * len(vehicles_observed)
+        for (i, vehicle_observed), plate in zip(observed, plates, strict=True):
+            vehicles[i] = self._make_vehicle(image, vehicle_observed, plate)
+
+        return tuple(vehicles)
+
+    async def _recognize_observed(
+        self,
+        image: Image,
+        vehicle_observed: VehicleObserved | None,
+        spot_id: Id | None,
         /
     ) -> Vehicle | None:
-        vehicle_observed = await self._vehicle_identifier.identify(image, spot_coordinate)
         if vehicle_observed is None:
             return None
 
         plate = await self._plate_identifier.identify(
             image,
-            vehicle_observed.coordinate
+            vehicle_observed.coordinate,
+            spot_id=spot_id
         )
 
         return self._make_vehicle(image, vehicle_observed, plate)
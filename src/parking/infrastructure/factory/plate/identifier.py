@@ -2,12 +2,21 @@ from collections.abc import Callable
 
 from shared.application.tool.worker_pool import WorkerPool
 from shared.infrastructure.service.ml.factory.yolo_provider import YOLOMlDetectionFactory
+from shared.infrastructure.tool.cpu_budget import CpuBudget
+from shared.infrastructure.tool.tier_stats.tier_counters import TierCounters
 
 from parking.domain.provider.plate.identifier import PlateIdentifier
 from parking.application import config
 
 from parking.infrastructure.provider.plate.hyperlpr_identifier import HyperlprPlateIdentifier
+from parking.infrastructure.provider.plate.hyperlpr_recognizer import HyperlprPlateRecognizer
+from parking.infrastructure.provider.plate.process_hyperlpr_identifier import (
+    ProcessHyperlprPlateIdentifier
+)
 from parking.infrastructure.provider.plate.yolo_identifier import YOLOPlateIdentifier
+from parking.infrastructure.provider.plate.yolo_hyperlpr_identifier import (
+    YOLOHyperlprPlateIdentifier
+)
 
 class PlateIdentifierFactory:
     def __init__(
@@ -15,16 +24,23 @@ class PlateIdentifierFactory:
         config_ml: config.Ml,
         yolo_ml_detection_factory: YOLOMlDetectionFactory,
         worker_pool: WorkerPool,
+        cpu_budget: CpuBudget,
+        hyperlpr_tier_counters: TierCounters,
         /
     ) -> None:
         self._config_ml = config_ml
         self._yolo_ml_detection_factory = yolo_ml_detection_factory
         self._worker_pool = worker_pool
+        self._cpu_budget = cpu_budget
+        self._hyperlpr_tier_counters = hyperlpr_tier_counters
+        self._process_identifiers: list[ProcessHyperlprPlateIdentifier] = []
+        self._yolo: YOLOPlateIdentifier | None = None
 
     def make_all(self) -> tuple[PlateIdentifier, ...]:
         factories: dict[str, Callable[[], PlateIdentifier]] = {
             "hyperlpr": self.make_hyperlpr,
             "yolo": self.make_yolo,
+            "yolo_hyperlpr": self.make_yolo_hyperlpr,
         }
 
         try:
@@ -35,18 +51,71 @@ class PlateIdentifierFactory:
         except KeyError as exc:
             raise ValueError("Unknown plate identifier") from exc
 
-    def make_hyperlpr(self) -> HyperlprPlateIdentifier:
-        return HyperlprPlateIdentifier(
-            self._config_ml,
-            self._worker_pool
-        )
+    def make_hyperlpr(self) -> PlateIdentifier:
+        processes = self._config_ml.plate_identifier_hyperlpr_processes
+        if processes > 0:
+            identifier = ProcessHyperlprPlateIdentifier(
+                self._config_ml,
+                self._hyperlpr_tier_counters,
+                processes=processes,
+                threads=self._cpu_budget.threads("hyperlpr")
+            )
+            self._process_identifiers.append(identifier)
+
+            return identifier
+
+        return self._make_hyperlpr()
 
     def make_yolo(self) -> YOLOPlateIdentifier:
+        # The YOLO plate identifier and the localizer of yolo_hyperlpr share
+        # one model, so it is loaded once.
+        if self._yolo is not None:
+            return self._yolo
+
+        image_size = (
+            self._config_ml.plate_identifier_yolo_frame_image_size
+            if self._config_ml.plate_identifier_yolo_mode == "frame"
+            else self._config_ml.plate_identifier_yolo_image_size
+        )
         detection = self._yolo_ml_detection_factory.make(
-            self._config_ml.plate_identifier_yolo_model_path
+            self._config_ml.plate_identifier_yolo_model_path,
+            image_sizes=(image_size,)
         )
 
-        return YOLOPlateIdentifier(
+        self._yolo = YOLOPlateIdentifier(
             self._config_ml,
             detection
         )
+
+        return self._yolo
+
+    def make_yolo_hyperlpr(self) -> YOLOHyperlprPlateIdentifier:
+        # The recognizer runs on small plate crops, so it stays in-process
+        # even when the full HyperLPR pipeline is moved to worker processes.
+        return YOLOHyperlprPlateIdentifier(
+            self._config_ml,
+            self.make_yolo(),
+            HyperlprPlateRecognizer(
+                self._config_ml,
+                self._worker_pool,
+                replicas=self._config_ml.plate_identifier_hyperlpr_replicas,
+                threads=self._cpu_budget.threads("hyperlpr")
+            )
+        )
+
+    async def shutdown(self) -> None:
+        for identifier in self._process_identifiers:
+            await identifier.shutdown()
+
+        self._process_identifiers.clear()
+
+    def _make_hyperlpr(self) -> HyperlprPlateIdentifier:
+        replicas = self._config_ml.plate_identifier_hyperlpr_replicas
+
+        return HyperlprPlateIdentifier(
+            self._config_ml,
+            self._worker_pool,
+            self._hyperlpr_tier_counters,
+            replicas=replicas,
+            threads=self._cpu_budget.threads("hyperlpr")
+        )
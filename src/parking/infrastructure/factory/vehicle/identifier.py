@@ -31,8 +31,14 @@ class VehicleIdentifierFactory:
             raise ValueError("Unknown vehicle identifier") from exc
 
     def make_yolo(self) -> YOLOVehicleIdentifier:
+        image_size = (
+            self._config_ml.vehicle_identifier_yolo_roi_image_size
+            if self._config_ml.vehicle_identifier_yolo_mode == "spot_roi"
+            else self._config_ml.vehicle_identifier_yolo_image_size
+        )
         detection = self._yolo_ml_detection_factory.make(
-            self._config_ml.vehicle_identifier_yolo_model_path
+            self._config_ml.vehicle_identifier_yolo_model_path,
+            image_sizes=(image_size,)
         )
 
         return YOLOVehicleIdentifier(
@@ -0,0 +1,77 @@
+from datetime import timedelta
+from typing import Protocol, TypeVar
+from collections.abc import Callable
+
+from shared.domain.aggregate.image import Image
+from shared.domain.vo.base import Id
+from shared.domain.vo.coordinate import Polygon
+from shared.application.tool.image_cache import ImageCache
+
+_R = TypeVar("_R")
+_R_co = TypeVar("_R_co", covariant=True)
+_T = TypeVar("_T")
+
+class _ManyIdentifier(Protocol[_R_co]):
+    async def identify_many(
+        self,
+        image: Image,
+        coordinates: tuple[Polygon, ...],
+        /,
+        spot_ids: tuple[Id, ...] | None = None
+    ) -> tuple[_R_co, ...]: ...
+
+
+async def identify_many_cached(
+    cache: ImageCache[_T],
+    identifier: _ManyIdentifier[_R],
+    image: Image,
+    coordinates: tuple[Polygon, ...],
+    /,
+    *,
+    spot_ids: tuple[Id, ...] | None,
+    ttl: timedelta,
+    wrap: Callable[[_R], _T],
+    unwrap: Callable[[_T], _R]
+) -> tuple[_R, ...]:
+    # Every coordinate is cached by its crop and partitioned by its spot,
+    # only the misses are identified and stored.
+    cached_images = tuple([
+        await image.crop(coordinate)
+        for coordinate in coordinates
+    ])
+    partitions = (
+        tuple(spot_id.value for spot_id in spot_ids)
+        if spot_ids is not None
+        else None
+    )
+    cached = await cache.get_many(cached_images, partitions=partitions)
+
+    missed = [i for i, item in enumerate(cached) if item is None]
+    if not missed:
+        return tuple(unwrap(item) for item in cached if item is not None)
+
+    identified = await identifier.identify_many(
+        image,
+        tuple(coordinates[i] for i in missed),
+        spot_ids=(
+            tuple(spot_ids[i] for i in missed)
+            if spot_ids is not None
+            else None
+        )
+    )
+    results = dict(zip(missed, identified, strict=True))
+
+    await cache.put_many(
+        tuple((cached_images[i], wrap(result)) for i, result in results.items()),
+        ttl=ttl,
+        partitions=(
+            tuple(partitions[i] for i in missed)
+            if partitions is not None
+            else None
+        )
+    )
+
+    return tuple(
+        results[i] if item is None else unwrap(item)
+        for i, item in enumerate(cached)
+    )
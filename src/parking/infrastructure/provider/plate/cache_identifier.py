@@ -1,13 +1,16 @@
 from dataclasses import dataclass
 from datetime import timedelta
 
+from shared.domain.vo.base import Id
+from shared.domain.vo.coordinate import Polygon
 from shared.domain.aggregate.image import Image
 from shared.application.tool.image_cache import ImageCache
 
-from shared.domain.vo.coordinate import Polygon
 from parking.domain.vo.plate import Plate
 from parking.domain.provider.plate.identifier import PlateIdentifier
 
+from parking.infrastructure.provider.cache_identifier import identify_many_cached
+
 @dataclass(frozen=True, slots=True)
 class CachePlateIdentifierResult:
     result: Plate | None
@@ -31,20 +34,45 @@ class CachePlateIdentifier(PlateIdentifier):
         self,
         image: Image,
         vehicle_coordinate: Polygon,
-        /
+        /,
+        spot_id: Id | None = None
     ) -> Plate | None:
         cached_image = await image.crop(vehicle_coordinate)
-        cached = await self._cache.get(cached_image)
+        partition = spot_id.value if spot_id is not None else None
+        cached = await self._cache.get(cached_image, partition=partition)
         if cached is not None:
             return cached.result
 
-        result = await self._identifier.identify(image, vehicle_coordinate)
+        result = await self._identifier.identify(
+            image,
+            vehicle_coordinate,
+            spot_id=spot_id
+        )
         await self._cache.put(
             cached_image,
             CachePlateIdentifierResult(
                 result=result
             ),
-            ttl=self._cache_ttl
+            ttl=self._cache_ttl,
+            partition=partition
         )
 
         return result
+
+    async def identify_many(
+        self,
+        image: Image,
+        vehicle_coordinates: tuple[Polygon, ...],
+        /,
+        spot_ids: tuple[Id, ...] | None = None
+    ) -> tuple[Plate | None, ...]:
+        return await identify_many_cached(
+            self._cache,
+            self._identifier,
+            image,
+            vehicle_coordinates,
+            spot_ids=spot_ids,
+            ttl=self._cache_ttl,
+            wrap=CachePlateIdentifierResult,
+            unwrap=lambda cached: cached.result
+        )
@@ -0,0 +1,163 @@
+from typing import Any, TypeAlias
+from collections.abc import Sequence
+
+import numpy as np
+
+from cv2.typing import MatLike
+from hyperlpr3.common.typedef import DOUBLE, UNKNOWN # type: ignore
+from hyperlpr3.common.tools_process import get_rotate_crop_image # type: ignore
+from hyperlpr3.inference.recognition import encode_images # type: ignore
+from hyperlpr3.inference.multitask_detect import ( # type: ignore
+    detect_pre_precessing,
+    post_precessing
+)
+
+HyperlprResult: TypeAlias = tuple[str, float, int, tuple[int, int, int, int]]
+
+class HyperlprBatchRecognizer:
+    """
+    Runs the hyperlpr3 recognizer over several plate crops at once.
+
+    Crops are encoded to the recognizer height, padded to the widest one
+    and read in a single session call.
+    """
+
+    _min_plate_length: int = 7
+
+    def __init__(self, model: Any, /) -> None:
+        self._model = model
+
+    def recognize(self, crops: Sequence[MatLike], /) -> list[tuple[str, float] | None]:
+        """Reads single-line plate crops, dropping codes too short to be a plate."""
+        return [
+            (code, confidence) if len(code) >= self._min_plate_length else None
+            for code, confidence in self.read(crops)
+        ]
+
+    def read(self, crops: Sequence[MatLike], /) -> list[tuple[str, float]]:
+        if not crops:
+            return []
+
+        inputs = [
+            encode_images(crop, crop.shape[1] / crop.shape[0], self._model.input_size)
+            for crop in crops
+        ]
+        width = max(data.shape[2] for data in inputs)
+        batch = np.zeros((len(inputs), *inputs[0].shape[:2], width), dtype=np.float32)
+        for index, data in enumerate(inputs):
+            batch[index, :, :, :data.shape[2]] = data
+
+        outputs = _run_session(
+            self._model.session,
+            self._model.output_config.name,
+            self._model.input_config.name,
+            batch
+        )
+
+        return [
+            (text, float(confidence))
+            for text, confidence in self._model.decode(
+                np.argmax(outputs, axis=2),
+                np.max(outputs, axis=2),
+                is_remove_duplicate=True
+            )
+        ]
+
+
+class HyperlprBatchPipeline:
+    """
+    Runs the hyperlpr3 multitask pipeline over several frames at once.
+
+    The letterboxed frames go through the detector in one session call and
+    every plate crop of every frame goes through the recognizer in another,
+    instead of one detector and one recognizer call per frame and plate.
+    Models exported with a fixed batch dimension are fed in chunks of that
+    size. Post-processing mirrors LPRMultiTaskPipeline.run, except that the
+    plate type classifier is skipped because the type is not used here.
+    """
+
+    _min_plate_length: int = 7
+    _double_split: float = 0.4
+
+    def __init__(self, pipeline: Any, /) -> None:
+        self._detector = pipeline.detector
+        self._recognizer = HyperlprBatchRecognizer(pipeline.recognizer)
+
+    def __call__(self, frames: Sequence[MatLike], /) -> list[list[HyperlprResult]]:
+        if not frames:
+            return []
+
+        detections = self._detect(frames)
+
+        crops: list[MatLike] = []
+        plates: list[tuple[int, np.typing.NDArray[Any], int]] = []
+        for index, (frame, outputs) in enumerate(zip(frames, detections, strict=True)):
+            for output in outputs:
+                pad = get_rotate_crop_image(frame, output[5:13].reshape(4, 2).astype(int))
+                if int(output[13]) == DOUBLE:
+                    line = int(pad.shape[0] * self._double_split)
+                    crops.extend((pad[:line], pad[line:]))
+                    plates.append((index, output, 2))
+                else:
+                    crops.append(pad)
+                    plates.append((index, output, 1))
+
+        codes = iter(self._recognizer.read(crops))
+        results: list[list[HyperlprResult]] = [[] for _ in frames]
+        for index, output, parts in plates:
+            recognized = [next(codes) for _ in range(parts)]
+            code = "".join(text for text, _ in recognized)
+            if len(code) < self._min_plate_length:
+                continue
+
+            x1, y1, x2, y2 = output[:4].astype(int).tolist()
+            results[index].append((
+                code,
+                float(np.mean([confidence for _, confidence in recognized])),
+                UNKNOWN,
+                (x1, y1, x2, y2)
+            ))
+
+        return results
+
+    def _detect(self, frames: Sequence[MatLike], /) -> list[np.typing.NDArray[Any]]:
+        inputs: list[np.typing.NDArray[np.float32]] = []
+        transforms: list[tuple[float, int, int]] = []
+        for frame in frames:
+            data, ratio, left, top = detect_pre_precessing(frame, self._detector.input_size)
+            inputs.append(data[0])
+            transforms.append((ratio, left, top))
+
+        outputs = _run_session(
+            self._detector.session,
+            self._detector.outputs_option[0].name,
+            self._detector.input_name,
+            np.stack(inputs)
+        )
+
+        return [
+            post_precessing(outputs[index:index + 1], ratio, left, top)
+            for index, (ratio, left, top) in enumerate(transforms)
+        ]
+
+
+def _run_session(
+    session: Any,
+    output_name: str,
+    input_name: str,
+    batch: np.typing.NDArray[np.float32],
+    /
+) -> np.typing.NDArray[Any]:
+    # Dynamic axes are reported as names or None, fixed ones as ints.
+    size = session.get_inputs()[0].shape[0]
+    if not isinstance(size, int) or size <= 0:
+        return np.asarray(session.run([output_name], {input_name: batch})[0])
+
+    # The last chunk is zero-padded up to the fixed batch size.
+    padded = np.zeros((-(-len(batch) // size) * size, *batch.shape[1:]), dtype=batch.dtype)
+    padded[:len(batch)] = batch
+
+    return np.concatenate([
+        session.run([output_name], {input_name: padded[start:start + size]})[0]
+        for start in range(0, len(padded), size)
+    ])[:len(batch)]
@@ -0,0 +1,81 @@
+from typing import Any
+from dataclasses import dataclass
+from os.path import join
+
+import onnxruntime as ort # type: ignore
+import hyperlpr3 as lpr3 # type: ignore
+
+from hyperlpr3.config.settings import ( # type: ignore
+    _DEFAULT_FOLDER_,
+    onnx_runtime_config
+)
+from hyperlpr3.inference.recognition import PPRCNNRecognitionORT # type: ignore
+
+@dataclass(frozen=True, slots=True)
+class _DetectLevel:
+    level: int
+    detector_model: str
+
+
+_DETECT_LEVELS: dict[str, _DetectLevel] = {
+    "low": _DetectLevel(level=lpr3.DETECT_LEVEL_LOW, detector_model="det_model_path_320x"),
+    "high": _DetectLevel(level=lpr3.DETECT_LEVEL_HIGH, detector_model="det_model_path_640x"),
+}
+
+def make_catcher(detect_level: str = "high", threads: int = 0, /) -> Any:
+    """
+    Builds a catcher for the detect level whose sessions use a fixed thread count.
+
+    hyperlpr3 creates its ONNX Runtime sessions without session options, so
+    with threads > 0 they are replaced by sessions over the same models with
+    intra-op threads pinned and inter-op parallelism disabled.
+    """
+    try:
+        level = _DETECT_LEVELS[detect_level]
+    except KeyError as exc:
+        raise ValueError("Unknown HyperLPR detect level") from exc
+
+    catcher = lpr3.LicensePlateCatcher(
+        detect_level=level.level
+    )
+    if threads <= 0:
+        return catcher
+
+    models = {
+        "detector": level.detector_model,
+        "recognizer": "rec_model_path",
+        "classifier": "cls_model_path",
+    }
+    for component, model in models.items():
+        getattr(catcher.pipeline, component).session = _make_session(model, threads)
+
+    return catcher
+
+
+def make_recognizer(threads: int = 0, /) -> Any:
+    """
+    Builds the plate recognizer alone, without the detector and classifier.
+
+    Its sessions follow the same thread rules as make_catcher.
+    """
+    recognizer = PPRCNNRecognitionORT(
+        join(_DEFAULT_FOLDER_, onnx_runtime_config["rec_model_path"]),
+        input_size=(48, 160)
+    )
+    if threads > 0:
+        recognizer.session = _make_session("rec_model_path", threads)
+
+    return recognizer
+
+
+def _make_session(model: str, threads: int, /) -> Any:
+    options = ort.SessionOptions()
+    options.intra_op_num_threads = threads
+    options.inter_op_num_threads = 1
+    options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+
+    return ort.InferenceSession(
+        join(_DEFAULT_FOLDER_, onnx_runtime_config[model]),
+        options,
+        providers=["CPUExecutionProvider"]
+    )
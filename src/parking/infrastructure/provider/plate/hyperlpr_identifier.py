@@ -1,73 +1,203 @@
+from typing import Any
+from dataclasses import dataclass
+
 from cv2.typing import MatLike
-import hyperlpr3 as lpr3 # type: ignore
 
 from shared.domain.aggregate.image import Image
+from shared.domain.vo.base import Id
 from shared.domain.vo.coordinate import Polygon, BoundingBox
 from shared.domain.enum.country import Country
 
 from shared.application.tool.worker_pool import WorkerPool
 from shared.infrastructure.dto.vo.data import Cv2ImageBinary
+from shared.infrastructure.tool.replica_pool import ReplicaPool
+from shared.infrastructure.tool.tier_stats.tier_counters import TierCounters
 
 from parking.domain.vo.plate import Plate
 from parking.domain.provider.plate.identifier import PlateIdentifier
+from parking.infrastructure.provider.plate.hyperlpr_batch import (
+    HyperlprBatchPipeline,
+    HyperlprResult
+)
+from parking.infrastructure.provider.plate.hyperlpr_catcher import make_catcher
 
 from parking.application import config
 
+@dataclass(frozen=True, slots=True)
+class HyperlprIdentification:
+    plate: Plate | None
+    tier: int
+
+
 class HyperlprPlateIdentifier(PlateIdentifier):
+    """
+    Recognizes plates with a bounded pool of hyperlpr3 catchers.
+
+    Every replica holds one catcher per configured detect level. Levels
+    are tried in order and a crop escalates to the next one only when no
+    plate reached the threshold, with the outcome counted per level.
+    A replica is checked out for the whole call, so no two worker threads
+    ever run the same ONNX sessions concurrently. The *_sync methods take
+    an idle replica without waiting and are meant for callers that own the
+    identifier exclusively, such as a process pool worker.
+    """
+
     _imgsz: int = 640
     _expand_margin: int = 20
 
     def __init__(
         self,
         config_ml: config.Ml,
-        worker_pool: WorkerPool
+        worker_pool: WorkerPool,
+        tier_counters: TierCounters,
+        /,
+        replicas: int = 1,
+        threads: int = 0
     ) -> None:
         self._threshold = config_ml.plate_identifier_hyperlpr_threshold
         self._worker_pool = worker_pool
-        self._catcher = lpr3.LicensePlateCatcher(
-            detect_level=lpr3.DETECT_LEVEL_HIGH
-        )
+        self._tier_counters = tier_counters
+        self._catchers: ReplicaPool[tuple[Any, ...]] = ReplicaPool([
+            tuple(
+                make_catcher(detect_level, threads)
+                for detect_level in config_ml.plate_identifier_hyperlpr_detect_levels
+            )
+            for _ in range(replicas)
+        ])
 
     async def identify(
         self,
         image: Image,
         vehicle_coordinate: Polygon,
-        /
+        /,
+        spot_id: Id | None = None
     ) -> Plate | None:
         vehicle_image = await image.crop(vehicle_coordinate)
 
-        return await self._worker_pool.run(
-            self._do_identify,
-            vehicle_image,
-            vehicle_coordinate
-        )
+        async with self._catchers.acquire() as catchers:
+            identification = await self._worker_pool.run(
+                self._identify_sync,
+                catchers,
+                vehicle_image,
+                vehicle_coordinate
+            )
+
+        self._tier_counters.record(identification.tier, identification.plate is not None)
+
+        return identification.plate
 
-    def _do_identify(
+    async def identify_many(
+        self,
+        image: Image,
+        vehicle_coordinates: tuple[Polygon, ...],
+        /,
+        spot_ids: tuple[Id, ...] | None = None
+    ) -> tuple[Plate | None, ...]:
+        if not vehicle_coordinates:
+            return ()
+
+        vehicle_images = tuple([
+            await image.crop(vehicle_coordinate)
+            for vehicle_coordinate in vehicle_coordinates
+        ])
+
+        async with self._catchers.acquire() as catchers:
+            identifications = await self._worker_pool.run(
+                self._identify_many_sync,
+                catchers,
+                vehicle_images,
+                vehicle_coordinates
+            )
+
+        for identification in identifications:
+            self._tier_counters.record(identification.tier, identification.plate is not None)
+
+        return tuple(identification.plate for identification in identifications)
+
+    def identify_sync(
         self,
         vehicle_image: Image,
         vehicle_coordinate: Polygon,
         /
-    ) -> Plate | None:
+    ) -> HyperlprIdentification:
+        with self._catchers.acquire_nowait() as catchers:
+            return self._identify_sync(
+                catchers,
+                vehicle_image,
+                vehicle_coordinate
+            )
+
+    def identify_many_sync(
+        self,
+        vehicle_images: tuple[Image, ...],
+        vehicle_coordinates: tuple[Polygon, ...],
+        /
+    ) -> tuple[HyperlprIdentification, ...]:
+        with self._catchers.acquire_nowait() as catchers:
+            return self._identify_many_sync(
+                catchers,
+                vehicle_images,
+                vehicle_coordinates
+            )
+
+    def _identify_sync(
+        self,
+        catchers: tuple[Any, ...],
+        vehicle_image: Image,
+        vehicle_coordinate: Polygon,
+        /
+    ) -> HyperlprIdentification:
         frame = self._extract_frame(vehicle_image)
         frame = self._prepare_image(frame)
 
-        response = self._catcher(frame)
+        plate: Plate | None = None
+        tier = 0
+        for tier, catcher in enumerate(catchers):
+            plate = self._process_response(
+                catcher(frame),
+                vehicle_coordinate
+            )
+            if plate is not None:
+                break
 
-        return self._process_response(
-            response,
-            vehicle_coordinate
-        )
+        return HyperlprIdentification(plate=plate, tier=tier)
+
+    def _identify_many_sync(
+        self,
+        catchers: tuple[Any, ...],
+        vehicle_images: tuple[Image, ...],
+        vehicle_coordinates: tuple[Polygon, ...],
+        /
+    ) -> tuple[HyperlprIdentification, ...]:
+        frames = [
+            self._prepare_image(self._extract_frame(vehicle_image))
+            for vehicle_image in vehicle_images
+        ]
+
+        identifications = [
+            HyperlprIdentification(plate=None, tier=0)
+            for _ in frames
+        ]
+        pending = list(range(len(frames)))
+        for tier, catcher in enumerate(catchers):
+            responses = HyperlprBatchPipeline(catcher.pipeline)([
+                frames[i] for i in pending
+            ])
+            for i, response in zip(pending, responses, strict=True):
+                identifications[i] = HyperlprIdentification(
+                    plate=self._process_response(response, vehicle_coordinates[i]),
+                    tier=tier
+                )
+
+            pending = [i for i in pending if identifications[i].plate is None]
+            if not pending:
+                break
+
+        return tuple(identifications)
 
     def _process_response(
         self,
-        response: list[tuple[
-            str, float, int, tuple[
-                int,
-                int,
-                int,
-                int
-            ]
-        ]],
+        response: list[HyperlprResult],
         vehicle_coordinate: Polygon,
         /
     ) -> Plate | None:
@@ -0,0 +1,82 @@
+from typing import Any
+
+from cv2.typing import MatLike
+
+from shared.domain.aggregate.image import Image
+from shared.domain.vo.coordinate import Polygon
+
+from shared.application.tool.worker_pool import WorkerPool
+from shared.infrastructure.dto.vo.data import Cv2ImageBinary
+from shared.infrastructure.tool.replica_pool import ReplicaPool
+
+from parking.infrastructure.provider.plate.hyperlpr_batch import HyperlprBatchRecognizer
+from parking.infrastructure.provider.plate.hyperlpr_catcher import make_recognizer
+
+from parking.application import config
+
+class HyperlprPlateRecognizer:
+    """
+    Reads already localized plates with a bounded pool of hyperlpr3 recognizers.
+
+    Only the recognizer model is loaded, since the plates come from another
+    detector. A replica is checked out for the whole call, so no two worker
+    threads ever run the same ONNX session concurrently.
+    """
+
+    def __init__(
+        self,
+        config_ml: config.Ml,
+        worker_pool: WorkerPool,
+        /,
+        replicas: int = 1,
+        threads: int = 0
+    ) -> None:
+        self._threshold = config_ml.plate_identifier_hyperlpr_threshold
+        self._worker_pool = worker_pool
+        self._recognizers: ReplicaPool[Any] = ReplicaPool([
+            make_recognizer(threads)
+            for _ in range(replicas)
+        ])
+
+    async def recognize_many(
+        self,
+        image: Image,
+        plate_coordinates: tuple[Polygon, ...],
+        /
+    ) -> tuple[str | None, ...]:
+        if not plate_coordinates:
+            return ()
+
+        plate_images = tuple([
+            await image.crop(plate_coordinate)
+            for plate_coordinate in plate_coordinates
+        ])
+
+        async with self._recognizers.acquire() as recognizer:
+            return await self._worker_pool.run(
+                self._recognize_many_sync,
+                recognizer,
+                plate_images
+            )
+
+    def _recognize_many_sync(
+        self,
+        recognizer: Any,
+        plate_images: tuple[Image, ...],
+        /
+    ) -> tuple[str | None, ...]:
+        readings = HyperlprBatchRecognizer(recognizer).recognize([
+            self._extract_frame(plate_image)
+            for plate_image in plate_images
+        ])
+
+        return tuple(
+            reading[0] if reading is not None and reading[1] >= self._threshold else None
+            for reading in readings
+        )
+
+    def _extract_frame(self, image: Image, /) -> MatLike:
+        if isinstance(image.data, Cv2ImageBinary):
+            return image.data.frame()
+
+        raise TypeError("Unsupported image data type for frame extraction.")
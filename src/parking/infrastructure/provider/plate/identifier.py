@@ -1,6 +1,7 @@
+from shared.domain.vo.base import Id
+from shared.domain.vo.coordinate import Polygon
 from shared.domain.aggregate.image import Image
 
-from shared.domain.vo.coordinate import Polygon
 from parking.domain.vo.plate import Plate
 from parking.domain.provider.plate.identifier import PlateIdentifier
 
@@ -12,12 +13,47 @@ class DefaultPlateIdentifier(PlateIdentifier):
         self,
         image: Image,
         vehicle_coordinate: Polygon,
-        /
+        /,
+        spot_id: Id | None = None
     ) -> Plate | None:
         plate: Plate | None = None
         for identifier in self._identifiers:
-            plate = await identifier.identify(image, vehicle_coordinate)
+            plate = await identifier.identify(
+                image,
+                vehicle_coordinate,
+                spot_id=spot_id
+            )
             if plate is not None:
                 return plate
 
         return None
+
+    async def identify_many(
+        self,
+        image: Image,
+        vehicle_coordinates: tuple[Polygon, ...],
+        /,
+        spot_ids: tuple[Id, ...] | None = None
+    ) -> tuple[Plate | None, ...]:
+        plates: list[Plate | None] = [None] * len(vehicle_coordinates)
+        for identifier in self._identifiers:
+            pending = [
+                i for i, plate in enumerate(plates)
+                if plate is None
+            ]
+            if not pending:
+                break
+
+            results = await identifier.identify_many(
+                image,
+                tuple(vehicle_coordinates[i] for i in pending),
+                spot_ids=(
+                    tuple(spot_ids[i] for i in pending)
+                    if spot_ids is not None
+                    else None
+                )
+            )
+            for i, plate in zip(pending, results, strict=True):
+                plates[i] = plate
+
+        return tuple(plates)
@@ -0,0 +1,146 @@
+from functools import partial
+
+import numpy as np
+
+from cv2.typing import MatLike
+
+from shared.domain.aggregate.image import Image
+from shared.domain.vo.base import Id
+from shared.domain.vo.coordinate import Polygon
+
+from shared.infrastructure.dto.vo.data import Cv2ImageBinary
+from shared.infrastructure.tool.noop_worker_pool import NoopWorkerPool
+from shared.infrastructure.tool.process_model_pool import ProcessModelPool
+from shared.infrastructure.tool.tier_stats.tier_counters import TierCounters
+
+from parking.domain.vo.plate import Plate
+from parking.domain.provider.plate.identifier import PlateIdentifier
+
+from parking.application import config
+
+from parking.infrastructure.provider.plate.hyperlpr_identifier import (
+    HyperlprPlateIdentifier,
+    HyperlprIdentification
+)
+
+class ProcessHyperlprPlateIdentifier(PlateIdentifier):
+    def __init__(
+        self,
+        config_ml: config.Ml,
+        tier_counters: TierCounters,
+        /,
+        processes: int = 1,
+        threads: int = 0
+    ) -> None:
+        self._tier_counters = tier_counters
+        self._pool: ProcessModelPool[HyperlprPlateIdentifier] = ProcessModelPool(
+            partial(_make_identifier, config_ml, threads),
+            processes=processes
+        )
+
+    async def identify(
+        self,
+        image: Image,
+        vehicle_coordinate: Polygon,
+        /,
+        spot_id: Id | None = None
+    ) -> Plate | None:
+        vehicle_image = await image.crop(vehicle_coordinate)
+
+        identification = await self._pool.run(
+            _identify,
+            self._extract_frame(vehicle_image),
+            vehicle_coordinate
+        )
+        self._tier_counters.record(identification.tier, identification.plate is not None)
+
+        return identification.plate
+
+    async def identify_many(
+        self,
+        image: Image,
+        vehicle_coordinates: tuple[Polygon, ...],
+        /,
+        spot_ids: tuple[Id, ...] | None = None
+    ) -> tuple[Plate | None, ...]:
+        if not vehicle_coordinates:
+            return ()
+
+        frames = [
+            self._extract_frame(await image.crop(vehicle_coordinate))
+            for vehicle_coordinate in vehicle_coordinates
+        ]
+
+        # The crops travel through the pool's single shared memory block
+        # as one flat buffer and are split back by shape in the worker.
+        identifications = await self._pool.run(
+            _identify_many,
+            np.concatenate([np.ravel(frame) for frame in frames]),
+            tuple(frame.shape for frame in frames),
+            vehicle_coordinates
+        )
+        for identification in identifications:
+            self._tier_counters.record(identification.tier, identification.plate is not None)
+
+        return tuple(identification.plate for identification in identifications)
+
+    async def shutdown(self) -> None:
+        await self._pool.shutdown()
+
+    def _extract_frame(self, image: Image, /) -> MatLike:
+        if isinstance(image.data, Cv2ImageBinary):
+            return image.data.frame()
+
+        raise TypeError("Unsupported image data type for frame extraction.")
+
+
+def _make_identifier(config_ml: config.Ml, threads: int, /) -> HyperlprPlateIdentifier:
+    # Tiers are counted by the parent process from the returned tier.
+    return HyperlprPlateIdentifier(
+        config_ml,
+        NoopWorkerPool(),
+        TierCounters(config_ml.plate_identifier_hyperlpr_detect_levels),
+        threads=threads
+    )
+
+
+def _identify(
+    identifier: HyperlprPlateIdentifier,
+    frame: MatLike,
+    vehicle_coordinate: Polygon,
+    /
+) -> HyperlprIdentification:
+    return identifier.identify_sync(
+        Image(
+            data=Cv2ImageBinary(image=frame),
+            coordinate=vehicle_coordinate
+        ),
+        vehicle_coordinate
+    )
+
+
+def _identify_many(
+    identifier: HyperlprPlateIdentifier,
+    data: MatLike,
+    shapes: tuple[tuple[int, ...], ...],
+    vehicle_coordinates: tuple[Polygon, ...],
+    /
+) -> tuple[HyperlprIdentification, ...]:
+    offsets = np.cumsum([0, *(int(np.prod(shape)) for shape in shapes)])
+
+    return identifier.identify_many_sync(
+        tuple(
+            Image(
+                data=Cv2ImageBinary(image=np.ravel(data)[start:end].reshape(shape)),
+                coordinate=vehicle_coordinate
+            )
+            for start, end, shape, vehicle_coordinate in zip(
+                offsets[:-1],
+                offsets[1:],
+                shapes,
+                vehicle_coordinates,
+                strict=True
+            )
+        ),
+        vehicle_coordinates
+    )
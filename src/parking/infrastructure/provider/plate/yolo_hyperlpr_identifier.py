@@ -0,0 +1,77 @@
+from shared.domain.aggregate.image import Image
+from shared.domain.vo.base import Id
+from shared.domain.vo.coordinate import Polygon
+from shared.domain.enum.country import Country
+
+from parking.domain.vo.plate import Plate
+from parking.domain.provider.plate.identifier import PlateIdentifier
+
+from parking.application import config
+
+from parking.infrastructure.provider.plate.yolo_identifier import YOLOPlateIdentifier
+from parking.infrastructure.provider.plate.hyperlpr_recognizer import HyperlprPlateRecognizer
+
+class YOLOHyperlprPlateIdentifier(PlateIdentifier):
+    """
+    Localizes plates with YOLO and reads them with HyperLPR's recognizer.
+
+    Only the plate box, widened by a share of its height, is handed to the
+    recognizer, so HyperLPR's own detector is never loaded. Plates the recognizer
+    cannot read are still returned with an unknown value, like the plain
+    YOLO identifier does.
+    """
+
+    def __init__(
+        self,
+        config_ml: config.Ml,
+        localizer: YOLOPlateIdentifier,
+        recognizer: HyperlprPlateRecognizer,
+        /
+    ) -> None:
+        self._margin = config_ml.plate_identifier_yolo_hyperlpr_margin
+        self._localizer = localizer
+        self._recognizer = recognizer
+
+    async def identify(
+        self,
+        image: Image,
+        vehicle_coordinate: Polygon,
+        /,
+        spot_id: Id | None = None
+    ) -> Plate | None:
+        plates = await self.identify_many(image, (vehicle_coordinate,))
+
+        return plates[0]
+
+    async def identify_many(
+        self,
+        image: Image,
+        vehicle_coordinates: tuple[Polygon, ...],
+        /,
+        spot_ids: tuple[Id, ...] | None = None
+    ) -> tuple[Plate | None, ...]:
+        plate_coordinates = await self._localizer.locate_many(image, vehicle_coordinates)
+        located = [
+            (i, self._widen(plate_coordinate, vehicle_coordinates[i]))
+            for i, plate_coordinate in enumerate(plate_coordinates)
+            if plate_coordinate is not None
+        ]
+        values = await self._recognizer.recognize_many(
+            image,
+            tuple(plate_coordinate for _, plate_coordinate in located)
+        )
+
+        plates: list[Plate | None] = [None] * len(vehicle_coordinates)
+        for (i, plate_coordinate), value in zip(located, values, strict=True):
+            plates[i] = Plate(
+                value=value if value is not None else "UNKNOWN",
+                country=Country.UNKNOWN,
+                coordinate=plate_coordinate
+            )
+
+        return tuple(plates)
+
+    def _widen(self, plate_coordinate: Polygon, vehicle_coordinate: Polygon, /) -> Polygon:
+        margin = round((plate_coordinate.y2 - plate_coordinate.y1) * self._margin)
+
+        return plate_coordinate.expand(margin, vehicle_coordinate)
@@ -1,4 +1,12 @@
+import asyncio
+
+from collections.abc import Awaitable, Callable
+
+import cv2
+import numpy as np
+
 from shared.domain.aggregate.image import Image
+from shared.domain.vo.base import Id
 from shared.domain.vo.coordinate import Polygon
 from shared.domain.enum.country import Country
 
@@ -11,13 +19,26 @@ from parking.domain.provider.plate.identifier import PlateIdentifier
 from parking.application import config
 
 class YOLOPlateIdentifier(PlateIdentifier):
-    _imgsz: int = 640
+    """
+    Localizes license plates with a YOLO plate model.
+
+    In "vehicle" mode every vehicle crop is a separate detection request.
+    In "frame" mode the plate model runs once on the whole frame and each
+    plate box goes to the vehicle polygon that contains most of it, so the
+    cost no longer grows with the number of vehicles.
+    """
+
     _expand_margin: int = 20
+    _threshold_containment: float = 0.5
 
     _types: tuple[str, ...] = (
         "license_plate",
     )
 
+    _target_types: tuple[detection.Type, ...] = (
+        detection.Type(id=0, name="license_plate"),
+    )
+
     def __init__(
         self,
         config_ml: config.Ml,
@@ -25,64 +46,177 @@ class YOLOPlateIdentifier(PlateIdentifier):
         /
     ) -> None:
         self._threshold = config_ml.plate_identifier_yolo_threshold
+        self._imgsz = config_ml.plate_identifier_yolo_image_size
+        self._max_detections = config_ml.plate_identifier_yolo_max_detections
+        self._frame_imgsz = config_ml.plate_identifier_yolo_frame_image_size
+        self._frame_max_detections = config_ml.plate_identifier_yolo_frame_max_detections
         self._provider = provider
 
+        modes: dict[
+            str,
+            Callable[[Image, tuple[Polygon, ...]], Awaitable[tuple[Polygon | None, ...]]]
+        ] = {
+            "vehicle": self._locate_in_vehicles,
+            "frame": self._locate_in_frame,
+        }
+
+        try:
+            self._locate = modes[config_ml.plate_identifier_yolo_mode]
+        except KeyError as exc:
+            raise ValueError("Unknown plate identifier mode") from exc
+
     async def identify(
         self,
         image: Image,
         vehicle_coordinate: Polygon,
-        /
+        /,
+        spot_id: Id | None = None
     ) -> Plate | None:
+        plates = await self.identify_many(image, (vehicle_coordinate,))
+
+        return plates[0]
+
+    async def identify_many(
+        self,
+        image: Image,
+        vehicle_coordinates: tuple[Polygon, ...],
+        /,
+        spot_ids: tuple[Id, ...] | None = None
+    ) -> tuple[Plate | None, ...]:
+        plate_coordinates = await self.locate_many(image, vehicle_coordinates)
+
+        return tuple(
+            Plate(
+                value="UNKNOWN",
+                country=Country.UNKNOWN,
+                coordinate=plate_coordinate.expand(self._expand_margin, vehicle_coordinate)
+            )
+            if plate_coordinate is not None
+            else None
+            for plate_coordinate, vehicle_coordinate in zip(
+                plate_coordinates,
+                vehicle_coordinates,
+                strict=True
+            )
+        )
+
+    async def locate_many(
+        self,
+        image: Image,
+        vehicle_coordinates: tuple[Polygon, ...],
+        /
+    ) -> tuple[Polygon | None, ...]:
+        if not vehicle_coordinates:
+            return ()
+
+        return await self._locate(image, vehicle_coordinates)
+
+    async def _locate_in_vehicles(
+        self,
+        image: Image,
+        vehicle_coordinates: tuple[Polygon, ...],
+        /
+    ) -> tuple[Polygon | None, ...]:
+        # Concurrent requests are batched by the detection provider.
+        return tuple(await asyncio.gather(*(
+            self._locate_in_vehicle(image, vehicle_coordinate)
+            for vehicle_coordinate in vehicle_coordinates
+        )))
+
+    async def _locate_in_vehicle(
+        self,
+        image: Image,
+        vehicle_coordinate: Polygon,
+        /
+    ) -> Polygon | None:
         vehicle_image = await image.crop(vehicle_coordinate)
         response = await self._provider.predict(detection.Request(
             source=vehicle_image,
-            image_size=self._imgsz
+            image_size=self._imgsz,
+            score_threshold=self._threshold,
+            target_types=self._target_types,
+            max_detections=self._max_detections
         ))
-        result = await self._process_response(vehicle_coordinate, response)
 
-        return result
+        return self._process_response(vehicle_coordinate, response)
 
-    async def _process_response(
+    async def _locate_in_frame(
         self,
-        vehicle_coordinate: Polygon,
-        response: detection.Response,
+        image: Image,
+        vehicle_coordinates: tuple[Polygon, ...],
         /
-    ) -> Plate | None:
-        if len(response.boxes) == 0:
-            return None
+    ) -> tuple[Polygon | None, ...]:
+        response = await self._provider.predict(detection.Request(
+            source=image,
+            image_size=self._frame_imgsz,
+            score_threshold=self._threshold,
+            target_types=self._target_types,
+            max_detections=self._frame_max_detections
+        ))
 
-        best_plate: Plate | None = None
-        best_score: float = 0.0
+        best: list[tuple[float, Polygon] | None] = [None] * len(vehicle_coordinates)
         for box in response.boxes:
-            if box.score < self._threshold:
+            if box.score < self._threshold or box.type.name not in self._types:
                 continue
 
-            plate = await self._identify_license_plate(vehicle_coordinate, box)
-            if plate is None:
+            polygon = box.coordinate.to_polygon()
+            containment = [
+                self._box_containment_ratio(polygon, vehicle_coordinate)
+                for vehicle_coordinate in vehicle_coordinates
+            ]
+            owner = int(np.argmax(containment))
+            if containment[owner] < self._threshold_containment:
+                continue
+
+            current = best[owner]
+            if current is None or box.score > current[0]:
+                best[owner] = (box.score, polygon)
+
+        return tuple(
+            item[1] if item is not None else None
+            for item in best
+        )
+
+    def _process_response(
+        self,
+        vehicle_coordinate: Polygon,
+        response: detection.Response,
+        /
+    ) -> Polygon | None:
+        best_coordinate: Polygon | None = None
+        best_score: float = 0.0
+        for box in response.boxes:
+            if box.score < self._threshold or box.type.name not in self._types:
                 continue
 
             if box.score > best_score:
                 best_score = box.score
-                best_plate = plate
+                best_coordinate = box.coordinate.to_polygon().shift_by(vehicle_coordinate)
 
-        return best_plate
+        return best_coordinate
 
-    async def _identify_license_plate(
+    def _box_containment_ratio(
         self,
+        polygon: Polygon,
         vehicle_coordinate: Polygon,
-        box: detection.Box,
         /
-    ) -> Plate | None:
-        if not box.type.name in self._types:
-            return None
-
-        local_polygon = box.coordinate.to_polygon()
-        global_polygon = local_polygon \
-            .shift_by(vehicle_coordinate) \
-            .expand(self._expand_margin, vehicle_coordinate)
-
-        return Plate(
-            value="UNKNOWN",
-            country=Country.UNKNOWN,
-            coordinate=global_polygon
-        )
+    ) -> float:
+        plate = self._coordinate_to_np_polygon(polygon)
+        vehicle = self._coordinate_to_np_polygon(vehicle_coordinate)
+
+        plate_area = cv2.contourArea(plate)
+        if plate_area <= 0:
+            return 0.0
+
+        intersection_area, _ = cv2.intersectConvexConvex(plate, vehicle)
+        if intersection_area <= 0:
+            return 0.0
+
+        return float(intersection_area / plate_area)
+
+    def _coordinate_to_np_polygon(
+        self,
+        coordinate: Polygon,
+        /
+    ) -> np.typing.NDArray[np.float32]:
+        return np.array(coordinate.to_tuple_list(), dtype=np.float32)
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from datetime import timedelta
 
+from shared.domain.vo.base import Id
 from shared.domain.vo.coordinate import Polygon
 from shared.domain.aggregate.image import Image
 from shared.application.tool.image_cache import ImageCache
@@ -8,6 +9,8 @@ from shared.application.tool.image_cache import ImageCache
 from parking.domain.aggregate.vehicle import VehicleObserved
 from parking.domain.provider.vehicle.identifier import VehicleIdentifier
 
+from parking.infrastructure.provider.cache_identifier import identify_many_cached
+
 @dataclass(frozen=True, slots=True)
 class CacheVehicleIdentifierResult:
     result: VehicleObserved | None
@@ -31,20 +34,45 @@ class CacheVehicleIdentifier(VehicleIdentifier):
         self,
         image: Image,
         spot_coordinate: Polygon,
-        /
+        /,
+        spot_id: Id | None = None
     ) -> VehicleObserved | None:
         cached_image = await image.crop(spot_coordinate)
-        cached = await self._cache.get(cached_image)
+        partition = spot_id.value if spot_id is not None else None
+        cached = await self._cache.get(cached_image, partition=partition)
         if cached is not None:
             return cached.result
 
-        result = await self._identifier.identify(image, spot_coordinate)
+        result = await self._identifier.identify(
+            image,
+            spot_coordinate,
+            spot_id=spot_id
+        )
         await self._cache.put(
             cached_image,
             CacheVehicleIdentifierResult(
                 result=result
             ),
-            ttl=self._cache_ttl
+            ttl=self._cache_ttl,
+            partition=partition
         )
 
         return result
+
+    async def identify_many(
+        self,
+        image: Image,
+        spot_coordinates: tuple[Polygon, ...],
+        /,
+        spot_ids: tuple[Id, ...] | None = None
+    ) -> tuple[VehicleObserved | None, ...]:
+        return await identify_many_cached(
+            self._cache,
+            self._identifier,
+            image,
+            spot_coordinates,
+            spot_ids=spot_ids,
+            ttl=self._cache_ttl,
+            wrap=CacheVehicleIdentifierResult,
+            unwrap=lambda cached: cached.result
+        )
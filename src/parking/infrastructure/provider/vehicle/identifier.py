@@ -1,3 +1,4 @@
+from shared.domain.vo.base import Id
 from shared.domain.vo.coordinate import Polygon
 from shared.domain.aggregate.image import Image
 
@@ -12,12 +13,47 @@ class DefaultVehicleIdentifier(VehicleIdentifier):
         self,
         image: Image,
         spot_coordinate: Polygon,
-        /
+        /,
+        spot_id: Id | None = None
     ) -> VehicleObserved | None:
         vehicle_observed: VehicleObserved | None = None
         for identifier in self._identifiers:
-            vehicle_observed = await identifier.identify(image, spot_coordinate)
+            vehicle_observed = await identifier.identify(
+                image,
+                spot_coordinate,
+                spot_id=spot_id
+            )
             if vehicle_observed is not None:
                 return vehicle_observed
 
         return None
+
+    async def identify_many(
+        self,
+        image: Image,
+        spot_coordinates: tuple[Polygon, ...],
+        /,
+        spot_ids: tuple[Id, ...] | None = None
+    ) -> tuple[VehicleObserved | None, ...]:
+        vehicles_observed: list[VehicleObserved | None] = [None] * len(spot_coordinates)
+        for identifier in self._identifiers:
+            pending = [
+                i for i, vehicle_observed in enumerate(vehicles_observed)
+                if vehicle_observed is None
+            ]
+            if not pending:
+                break
+
+            results = await identifier.identify_many(
+                image,
+                tuple(spot_coordinates[i] for i in pending),
+                spot_ids=(
+                    tuple(spot_ids[i] for i in pending)
+                    if spot_ids is not None
+                    else None
+                )
+            )
+            for i, vehicle_observed in zip(pending, results, strict=True):
+                vehicles_observed[i] = vehicle_observed
+
+        return tuple(vehicles_observed)
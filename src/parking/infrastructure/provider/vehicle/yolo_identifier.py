@@ -1,6 +1,11 @@
+import asyncio
+
+from collections.abc import Awaitable, Callable
+
 import cv2
 import numpy as np
 
+from shared.domain.vo.base import Id
 from shared.domain.vo.coordinate import Polygon
 from shared.domain.aggregate.image import Image
 from shared.application.service.ml.provider.detection import MlDetectionProvider
@@ -13,7 +18,6 @@ from parking.domain.provider.vehicle.identifier import VehicleIdentifier
 from parking.application import config
 
 class YOLOVehicleIdentifier(VehicleIdentifier):
-    _imgsz: int = 640
     _threshold_overlap: float = 0.3
     _expand_margin: int = 40
 
@@ -25,6 +29,14 @@ class YOLOVehicleIdentifier(VehicleIdentifier):
         "truck": VehicleType.TRUCK
     }
 
+    _target_types: tuple[detection.Type, ...] = (
+        detection.Type(id=1, name="bicycle"),
+        detection.Type(id=2, name="car"),
+        detection.Type(id=3, name="motorcycle"),
+        detection.Type(id=5, name="bus"),
+        detection.Type(id=7, name="truck"),
+    )
+
     def __init__(
         self,
         config_ml: config.Ml,
@@ -32,27 +44,99 @@ class YOLOVehicleIdentifier(VehicleIdentifier):
         /
     ) -> None:
         self._threshold = config_ml.vehicle_identifier_yolo_threshold
+        self._imgsz = config_ml.vehicle_identifier_yolo_image_size
+        self._roi_imgsz = config_ml.vehicle_identifier_yolo_roi_image_size
+        self._roi_margin = config_ml.vehicle_identifier_yolo_roi_margin
+        self._max_detections = config_ml.vehicle_identifier_yolo_max_detections
         self._provider = provider
+        self._mode = config_ml.vehicle_identifier_yolo_mode
+
+        modes: dict[str, Callable[[Image, Polygon], Awaitable[VehicleObserved | None]]] = {
+            "frame": self._identify_in_frame,
+            "spot_roi": self._identify_in_roi,
+        }
+
+        try:
+            self._identify = modes[self._mode]
+        except KeyError as exc:
+            raise ValueError("Unknown vehicle identifier mode") from exc
 
     async def identify(
+        self,
+        image: Image,
+        spot_coordinate: Polygon,
+        /,
+        spot_id: Id | None = None
+    ) -> VehicleObserved | None:
+        return await self._identify(image, spot_coordinate)
+
+    async def identify_many(
+        self,
+        image: Image,
+        spot_coordinates: tuple[Polygon, ...],
+        /,
+        spot_ids: tuple[Id, ...] | None = None
+    ) -> tuple[VehicleObserved | None, ...]:
+        if not spot_coordinates:
+            return ()
+
+        if self._mode != "frame":
+            return tuple(await asyncio.gather(*(
+                self._identify(image, spot_coordinate)
+                for spot_coordinate in spot_coordinates
+            )))
+
+        response = await self._provider.predict(self._make_request(image, self._imgsz))
+
+        return tuple([
+            await self._process_response(image, spot_coordinate, response)
+            for spot_coordinate in spot_coordinates
+        ])
+
+    async def _identify_in_frame(
         self,
         image: Image,
         spot_coordinate: Polygon,
         /
     ) -> VehicleObserved | None:
-        response = await self._provider.predict(detection.Request(
-            source=image,
-            image_size=self._imgsz
+        response = await self._provider.predict(self._make_request(image, self._imgsz))
+
+        return await self._process_response(image, spot_coordinate, response)
+
+    async def _identify_in_roi(
+        self,
+        image: Image,
+        spot_coordinate: Polygon,
+        /
+    ) -> VehicleObserved | None:
+        margin = int(max(
+            spot_coordinate.x2 - spot_coordinate.x1,
+            spot_coordinate.y2 - spot_coordinate.y1
+        ) * self._roi_margin)
+        region = spot_coordinate.expand(margin, image.coordinate)
+
+        response = await self._provider.predict(self._make_request(
+            await image.crop(region),
+            self._roi_imgsz
         ))
-        result = await self._process_response(image, spot_coordinate, response)
 
-        return result
+        return await self._process_response(image, spot_coordinate, response, region)
+
+    def _make_request(self, image: Image, imgsz: int, /) -> detection.Request:
+        return detection.Request(
+            source=image,
+            image_size=imgsz,
+            score_threshold=self._threshold,
+            target_types=self._target_types,
+            max_detections=self._max_detections
+        )
 
     async def _process_response(
         self,
         image: Image,
         coordinate: Polygon,
         response: detection.Response,
+        region: Polygon | None = None,
         /
     ) -> VehicleObserved | None:
         if len(response.boxes) == 0:
@@ -64,11 +148,15 @@ class YOLOVehicleIdentifier(VehicleIdentifier):
             if box.score < self._threshold:
                 continue
 
-            overlap = self._box_overlap_ratio(box, coordinate)
+            polygon = box.coordinate.to_polygon()
+            if region is not None:
+                polygon = polygon.shift_by(region)
+
+            overlap = self._box_overlap_ratio(polygon, coordinate)
             if overlap < self._threshold_overlap:
                 continue
 
-            vehicle = self._make_vehicle(image, box)
+            vehicle = self._make_vehicle(image, box, polygon)
             if vehicle is None:
                 continue
 
@@ -83,6 +171,7 @@ class YOLOVehicleIdentifier(VehicleIdentifier):
         self,
         image: Image,
         box: detection.Box,
+        polygon: Polygon,
         /
     ) -> VehicleObserved | None:
         details=VehicleDetails(
@@ -92,10 +181,9 @@ class YOLOVehicleIdentifier(VehicleIdentifier):
         if details.type == VehicleType.UNKNOWN:
             return None
 
-        polygon = box.coordinate.to_polygon().expand(self._expand_margin, image.coordinate)
         vehicle = VehicleObserved(
             details=details,
-            coordinate=polygon,
+            coordinate=polygon.expand(self._expand_margin, image.coordinate),
             score=box.score
         )
 
@@ -103,12 +191,12 @@ class YOLOVehicleIdentifier(VehicleIdentifier):
 
     def _box_overlap_ratio(
         self,
-        box: detection.Box,
+        polygon: Polygon,
         coordinate: Polygon,
         /
     ) -> float:
         spot = self._coordinate_to_np_polygon(coordinate)
-        vehicle = self._coordinate_to_np_polygon(box.coordinate.to_polygon())
+        vehicle = self._coordinate_to_np_polygon(polygon)
 
         vehicle_area = cv2.contourArea(vehicle)
         if vehicle_area <= 0:
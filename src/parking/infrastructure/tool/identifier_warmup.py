@@ -0,0 +1,56 @@
+import numpy as np
+
+from cv2.typing import MatLike
+
+from shared.domain.aggregate.image import Image
+from shared.domain.vo.coordinate import Coordinate, BoundingBox, Polygon
+
+from shared.application.tool.warmup import Warmup
+
+from shared.infrastructure.dto.vo.data import Cv2ImageBinary
+
+from parking.domain.provider.vehicle.identifier import VehicleIdentifier
+from parking.domain.provider.plate.identifier import PlateIdentifier
+
+class IdentifierWarmup(Warmup):
+    """
+    Runs every vehicle and plate identifier once per configured frame size.
+
+    The identifiers are the uncached ones, so the synthetic frames never end
+    up in the image caches. Noise is used instead of a blank frame to keep
+    the models from short-circuiting on an empty input.
+    """
+
+    def __init__(
+        self,
+        vehicle_identifiers: tuple[VehicleIdentifier, ...],
+        plate_identifiers: tuple[PlateIdentifier, ...],
+        /,
+        frame_sizes: tuple[tuple[int, int], ...]
+    ) -> None:
+        self._vehicle_identifiers = vehicle_identifiers
+        self._plate_identifiers = plate_identifiers
+        self._frame_sizes = frame_sizes
+
+    async def warm_up(self) -> None:
+        for width, height in self._frame_sizes:
+            box = BoundingBox(
+                p1=Coordinate(x=0, y=0),
+                p2=Coordinate(x=width, y=height)
+            )
+            image = Image(
+                data=Cv2ImageBinary(image=self._make_frame(width, height)),
+                coordinate=box
+            )
+            coordinate = Polygon.from_bbox(box)
+
+            for vehicle_identifier in self._vehicle_identifiers:
+                await vehicle_identifier.identify(image, coordinate)
+
+            for plate_identifier in self._plate_identifiers:
+                await plate_identifier.identify(image, coordinate)
+
+    def _make_frame(self, width: int, height: int, /) -> MatLike:
+        return np.random.default_rng(0).integers(
+            0, 256, size=(height, width, 3), dtype=np.uint8
+        )
@@ -3,6 +3,7 @@ from parking.application.dto.contract.spot import ParkingSpot, Spot
 from parking.application.dto.contract.plate import Plate
 from parking.application.dto.contract.vehicle import Vehicle, VehicleDetails
 from parking.ui.rest.response.analyze_spot import AnalyzeSpotResponse
+from parking.ui.rest.response.analyze_spots import AnalyzeSpotsResponse
 from parking.ui.rest.response.coordinate import CoordinateResponse, PolygonResponse
 from parking.ui.rest.response.spot import ParkingSpotResponse, SpotResponse
 from parking.ui.rest.response.vehicle import VehicleDetailsResponse, VehicleResponse
@@ -18,6 +19,17 @@ class ContractResponseMapper:
             parking_spot=self.make_parking_spot(parking_spot)
         )
 
+    def make_analyze_spots(
+        self,
+        parking_spots: tuple[ParkingSpot, ...],
+        /
+    ) -> AnalyzeSpotsResponse:
+        return AnalyzeSpotsResponse(
+            parking_spots=tuple(
+                self.make_parking_spot(parking_spot) for parking_spot in parking_spots
+            )
+        )
+
     def make_parking_spot(
         self,
         parking_spot: ParkingSpot,
@@ -1,6 +1,8 @@
 from parking.application.handler import analyze_spot
+from parking.application.handler import analyze_spots
 from parking.ui.rest.mapper.request_income import RequestIncomeMapper
 from parking.ui.rest.request.analyze_spot import AnalyzeSpotRequest
+from parking.ui.rest.request.analyze_spots import AnalyzeSpotsRequest
 
 class RequestCommandMapper:
     def __init__(self, request_mapper: RequestIncomeMapper) -> None:
@@ -18,3 +20,18 @@ class RequestCommandMapper:
             image=image,
             spot=spot
         )
+
+    def make_analyze_spots(
+        self,
+        request: AnalyzeSpotsRequest,
+        /
+    ) -> analyze_spots.Command:
+        image = self._request_mapper.make_image(request.image)
+        spots = tuple(
+            self._request_mapper.make_spot(spot) for spot in request.spots
+        )
+
+        return analyze_spots.Command(
+            image=image,
+            spots=spots
+        )
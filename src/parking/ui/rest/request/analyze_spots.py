@@ -0,0 +1,10 @@
+from pydantic import Field
+
+from kernel.ui.rest.base.request import BaseRequest
+
+from parking.ui.rest.request.image import ImageRequest
+from parking.ui.rest.request.spot import SpotRequest
+
+class AnalyzeSpotsRequest(BaseRequest):
+    image: ImageRequest
+    spots: tuple[SpotRequest, ...] = Field(min_length=1)
@@ -1,5 +1,7 @@
 from shared.application.config.ml import Ml
+from shared.application.config.cpu import Cpu
 
 __all__ = [
     'Ml',
+    'Cpu',
 ]
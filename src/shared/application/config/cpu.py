@@ -0,0 +1,12 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+class Cpu(BaseSettings):
+    model_config = SettingsConfigDict(
+        frozen=True,
+        env_prefix='cpu_',
+        validation_error_cause=True
+    )
+
+    cores: int = Field(default=0, ge=0)
+    worker_pool_share: float = Field(default=0.25, gt=0.0, lt=1.0)
@@ -1,6 +1,10 @@
-from pydantic import field_validator
+from pathlib import Path
+
+from pydantic import field_validator, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from shared.application.config.validator import parse_optional_path
+
 class Ml(BaseSettings):
     model_config = SettingsConfigDict(
         frozen=True,
@@ -9,6 +13,18 @@ class Ml(BaseSettings):
     )
 
     yolo_model_device: str | None = None
+    yolo_detection_cache_size: int = Field(default=32, ge=0)
+    yolo_batch_max_size: int = Field(default=1, ge=1)
+    yolo_batch_window_ms: int = Field(default=5, ge=0)
+    yolo_processes: int = Field(default=0, ge=0)
+    yolo_replicas: int = Field(default=1, ge=1)
+    yolo_replica_threads: int = Field(default=0, ge=0)
+    yolo_backend: str = "auto"
+    yolo_backend_cache_path: Path | None = None
+    yolo_backend_benchmark_runs: int = Field(default=5, ge=1)
+    frame_capture_path: Path | None = None
+    frame_capture_rate: float = Field(default=0.01, ge=0, le=1)
+    frame_capture_max_frames: int = Field(default=1000, ge=0)
 
     @field_validator('yolo_model_device', mode='before')
     @classmethod
@@ -17,3 +33,9 @@ class Ml(BaseSettings):
             return None
 
         return v
+
+    parse_optional_path = field_validator(
+        'yolo_backend_cache_path',
+        'frame_capture_path',
+        mode='before'
+    )(parse_optional_path)
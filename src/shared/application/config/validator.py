@@ -0,0 +1,8 @@
+from pathlib import Path
+
+def parse_optional_path(v: str | Path | None) -> str | Path | None:
+    # An empty environment variable disables the path instead of meaning ".".
+    if isinstance(v, str) and not len(v) > 0:
+        return None
+
+    return v
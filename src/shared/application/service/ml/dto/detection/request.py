@@ -1,4 +1,4 @@
-from pydantic import NonNegativeInt, NonNegativeFloat
+from pydantic import NonNegativeInt, NonNegativeFloat, PositiveInt
 
 from shared.domain.aggregate.image import Image
 from shared.application.dto.base import Base
@@ -9,3 +9,4 @@ class Request(Base):
     image_size: NonNegativeInt | None = None
     score_threshold: NonNegativeFloat | None = None
     target_types: tuple[Type, ...] | None = None
+    max_detections: PositiveInt | None = None
@@ -0,0 +1,6 @@
+from typing import Protocol
+
+from shared.domain.aggregate.image import Image
+
+class FrameCapture(Protocol):
+    async def capture(self, image: Image, /) -> None: ...
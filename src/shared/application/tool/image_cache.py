@@ -1,10 +1,58 @@
-from typing import Protocol, TypeVar
-from datetime import timedelta
+from dataclasses import dataclass
+from typing import Generic, Protocol, TypeVar
+from datetime import timedelta, datetime
 
 from shared.domain.aggregate.image import Image
+from shared.application.tool.image_similarity import ImageFingerprint
 
 _T = TypeVar("_T")
 
+@dataclass(frozen=True, slots=True)
+class ImageCacheRecord(Generic[_T]):
+    fingerprint: ImageFingerprint
+    value: _T
+    partition: str | None
+    expires_at: datetime | None
+
+
+@dataclass(frozen=True, slots=True)
+class ImageCacheStats:
+    partition: str | None
+    size: int
+    hits: int
+    misses: int
+    expirations: int
+    evictions: int
+    comparisons: int
+    latency: timedelta
+
+
 class ImageCache(Protocol[_T]):
-    async def get(self, image: Image, /) -> _T | None: ...
-    async def put(self, image: Image, value: _T, /, ttl: timedelta | None = None) -> None: ...
+    async def get(self, image: Image, /, partition: str | None = None) -> _T | None: ...
+    async def put(
+        self,
+        image: Image,
+        value: _T,
+        /,
+        ttl: timedelta | None = None,
+        partition: str | None = None
+    ) -> None: ...
+
+    async def get_many(
+        self,
+        images: tuple[Image, ...],
+        /,
+        partitions: tuple[str | None, ...] | None = None
+    ) -> tuple[_T | None, ...]: ...
+    async def put_many(
+        self,
+        items: tuple[tuple[Image, _T], ...],
+        /,
+        ttl: timedelta | None = None,
+        partitions: tuple[str | None, ...] | None = None
+    ) -> None: ...
+
+    async def dump(self) -> tuple[ImageCacheRecord[_T], ...]: ...
+    async def load(self, records: tuple[ImageCacheRecord[_T], ...], /) -> None: ...
+
+    async def stats(self) -> tuple[ImageCacheStats, ...]: ...
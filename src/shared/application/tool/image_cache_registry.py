@@ -0,0 +1,7 @@
+from typing import Any, Protocol
+from collections.abc import Mapping
+
+from shared.application.tool.image_cache import ImageCache
+
+class ImageCacheRegistry(Protocol):
+    def caches(self) -> Mapping[str, ImageCache[Any]]: ...
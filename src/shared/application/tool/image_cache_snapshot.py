@@ -0,0 +1,6 @@
+from typing import Protocol
+
+class ImageCacheSnapshot(Protocol):
+    async def restore(self) -> None: ...
+    async def persist(self) -> None: ...
+    async def persist_periodically(self) -> None: ...
@@ -1,7 +1,9 @@
-from typing import Protocol
+from typing import Protocol, TypeAlias
 
 from shared.domain.aggregate.image import Image
 
+ImageFingerprint: TypeAlias = tuple[int, ...]
+
 class ImageSimilarity(Protocol):
     async def similar(
         self,
@@ -10,3 +12,9 @@ class ImageSimilarity(Protocol):
         /,
         tolerance: float
     ) -> bool: ...
+
+    async def fingerprint(self, image: Image, /) -> ImageFingerprint: ...
+
+    def fingerprint_bits(self) -> tuple[int, ...]: ...
+
+    def fingerprint_thresholds(self, tolerance: float, /) -> tuple[int, ...]: ...
@@ -0,0 +1,13 @@
+from enum import Enum
+from typing import Protocol
+
+class ReadinessState(str, Enum):
+    WARMING_UP = "warming_up"
+    READY = "ready"
+    FAILED = "failed"
+
+
+class Readiness(Protocol):
+    def state(self) -> ReadinessState: ...
+    def mark_ready(self) -> None: ...
+    def mark_failed(self) -> None: ...
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from typing import Protocol
+
+@dataclass(frozen=True, slots=True)
+class TierStats:
+    tier: str
+    runs: int
+    hits: int
+
+
+class TierStatsSource(Protocol):
+    def tier_stats(self) -> tuple[TierStats, ...]: ...
@@ -0,0 +1,7 @@
+from typing import Protocol
+from collections.abc import Mapping
+
+from shared.application.tool.tier_stats import TierStatsSource
+
+class TierStatsRegistry(Protocol):
+    def sources(self) -> Mapping[str, TierStatsSource]: ...
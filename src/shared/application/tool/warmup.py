@@ -0,0 +1,4 @@
+from typing import Protocol
+
+class Warmup(Protocol):
+    async def warm_up(self) -> None: ...
@@ -1,4 +1,8 @@
-from typing import Self
+from typing import Any, Self, TypeVar
+from collections.abc import Callable, Hashable
+
+import hashlib
+
 from cv2.typing import MatLike
 
 import cv2
@@ -7,12 +11,17 @@ import numpy as np
 from shared.domain.vo.data import ImageBinary
 from shared.domain.vo.coordinate import BoundingBox, RotatedBoundingBox, Polygon
 
+_R = TypeVar("_R")
+
 class Cv2ImageBinary(ImageBinary):
     _encode_extension: str = ".jpeg"
     _encoded_data: bytes | None = None
+    _digest: bytes | None = None
+    _gray: MatLike | None = None
 
     def __init__(self, *, image: MatLike) -> None:
         self._image = image
+        self._memo: dict[Hashable, Any] = {}
 
     def data(self) -> bytes:
         if self._encoded_data is None:
@@ -24,6 +33,17 @@ class Cv2ImageBinary(ImageBinary):
 
         return self._encoded_data
 
+    def digest(self) -> bytes:
+        if self._digest is None:
+            frame = np.ascontiguousarray(self._image)
+            hasher = hashlib.blake2b(digest_size=16)
+            hasher.update(repr((frame.shape, frame.dtype.str)).encode())
+            hasher.update(frame.data)
+
+            self._digest = hasher.digest()
+
+        return self._digest
+
     async def crop(
         self,
         coordinate: BoundingBox | RotatedBoundingBox | Polygon,
@@ -53,3 +73,20 @@ class Cv2ImageBinary(ImageBinary):
 
     def frame(self) -> MatLike:
         return self._image
+
+    def gray(self) -> MatLike:
+        if self._gray is None:
+            self._gray = cv2.cvtColor(self._image, cv2.COLOR_BGR2GRAY)
+
+        return self._gray
+
+    def memoized(self, key: Hashable, /) -> Any | None:
+        return self._memo.get(key)
+
+    def memoize(self, key: Hashable, factory: Callable[[], _R], /) -> _R:
+        if key not in self._memo:
+            self._memo[key] = factory()
+
+        value: _R = self._memo[key]
+
+        return value
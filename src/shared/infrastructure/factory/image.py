@@ -10,6 +10,7 @@ from shared.domain.vo.coordinate import Coordinate, BoundingBox
 from shared.domain.vo.data import ImageBinary
 
 from shared.application.tool.worker_pool import WorkerPool
+from shared.application.tool.frame_capture import FrameCapture
 from shared.application.http import client as http_client
 from shared.application.factory.image import ImageFactory
 from shared.application.dto.contract import income
@@ -22,10 +23,12 @@ class Cv2ImageFactory(ImageFactory):
     def __init__(
         self,
         http: http_client.ClientProtocol,
-        worker_pool: WorkerPool
+        worker_pool: WorkerPool,
+        frame_capture: FrameCapture
     ) -> None:
         self._http = http
         self._worker_pool = worker_pool
+        self._frame_capture = frame_capture
 
     async def make_from_income(self, image: income.Image, /) -> Image:
         raw_data = await self._extract_raw_bytes(image)
@@ -34,7 +37,10 @@ class Cv2ImageFactory(ImageFactory):
             raw_data
         )
 
-        return self._make_image(cv2_data)
+        result = self._make_image(cv2_data)
+        await self._frame_capture.capture(result)
+
+        return result
 
     async def _extract_raw_bytes(self, image: income.Image, /) -> bytes:
         raw_data: bytes | None = None
@@ -3,9 +3,12 @@ from shared.application.tool.worker_pool import WorkerPool
 from shared.infrastructure.tool.worker_pool import AsyncIOThreadWorkerPool
 
 class DefaultWorkerPoolFactory(WorkerPoolFactory):
+    def __init__(self, *, max_workers: int = 10) -> None:
+        self._max_workers = max_workers
+
     def make(self) -> WorkerPool:
         return AsyncIOThreadWorkerPool(
-            max_workers=10
+            max_workers=self._max_workers
         )
 
     def make_with_limits(self, *, max_workers: int) -> WorkerPool:
@@ -0,0 +1,346 @@
+import os
+import time
+import shutil
+import logging
+import statistics
+import importlib.util
+
+from typing import Any
+from pathlib import Path
+from threading import Lock
+from dataclasses import dataclass
+from collections.abc import Mapping
+
+import numpy as np
+import torch
+
+from ultralytics import YOLO # type: ignore[attr-defined]
+
+_logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True, slots=True)
+class YOLOBackend:
+    name: str
+    runtime: str
+    suffix: str
+    export_format: str | None = None
+    dynamic: bool = False
+    int8: bool = False
+
+    def is_available(self) -> bool:
+        return importlib.util.find_spec(self.runtime) is not None
+
+    def artifact_path(self, model: Path, /, image_size: int | None = None) -> Path:
+        if self.export_format is None:
+            return model
+
+        if self.dynamic or image_size is None:
+            return model.with_name(f"{model.stem}{self.suffix}")
+
+        # Static exports are traced for a single input size.
+        return model.with_name(f"{model.stem}_{image_size}{self.suffix}")
+
+
+@dataclass(frozen=True, slots=True)
+class YOLOArtifact:
+    backend: YOLOBackend
+    path: Path
+
+
+YOLO_BACKENDS: Mapping[str, YOLOBackend] = {
+    backend.name: backend
+    for backend in (
+        YOLOBackend(name="pytorch", runtime="torch", suffix=".pt"),
+        YOLOBackend(
+            name="torchscript",
+            runtime="torch",
+            suffix=".torchscript",
+            export_format="torchscript"
+        ),
+        YOLOBackend(
+            name="onnx",
+            runtime="onnxruntime",
+            suffix=".onnx",
+            export_format="onnx",
+            dynamic=True
+        ),
+        YOLOBackend(
+            name="openvino",
+            runtime="openvino",
+            suffix="_openvino_model",
+            export_format="openvino",
+            dynamic=True
+        ),
+        YOLOBackend(
+            name="openvino_int8",
+            runtime="openvino",
+            suffix="_int8_openvino_model",
+            export_format="openvino",
+            dynamic=True,
+            int8=True
+        ),
+    )
+}
+
+
+class YOLOBackendRegistry:
+    """
+    Picks the inference runtime a YOLO model is served from.
+
+    Exported artifacts are cached next to the model (or in cache_path when the
+    model directory is read-only) and reused on the next start until the model
+    file changes. Without a writable cache location nothing is exported and
+    the model stays on PyTorch. With backend "auto" every available runtime is
+    benchmarked once per model at each image size the model is served with and
+    the fastest one wins; any other value forces that runtime.
+
+    Static exports (TorchScript) only accept the input size they were traced
+    with, so they are exported per image size and skipped for models served at
+    more than one size. INT8 artifacts need a calibration set, so they are
+    never exported or picked automatically here and have to be produced by the
+    quantize command and selected explicitly. Exported runtimes are CPU-only
+    here, so an accelerator device always keeps the PyTorch model.
+    """
+
+    def __init__(
+        self,
+        backends: Mapping[str, YOLOBackend] = YOLO_BACKENDS,
+        /,
+        backend: str = "auto",
+        cache_path: Path | None = None,
+        benchmark_runs: int = 5,
+        image_size: int = 640
+    ) -> None:
+        if backend != "auto" and backend not in backends:
+            raise ValueError("Unknown YOLO backend")
+
+        if benchmark_runs <= 0:
+            raise ValueError("benchmark_runs must be positive")
+
+        self._backends = backends
+        self._backend = backend
+        self._cache_path = cache_path
+        self._benchmark_runs = benchmark_runs
+        self._image_size = image_size
+        self._lock = Lock()
+        self._resolved: dict[
+            tuple[Path, str, str | None, tuple[int, ...]],
+            YOLOArtifact
+        ] = {}
+
+    def resolve(
+        self,
+        model: Path,
+        task: str,
+        device: str | None = None,
+        /,
+        image_sizes: tuple[int, ...] = ()
+    ) -> YOLOArtifact:
+        key = (model, task, device, tuple(sorted(set(image_sizes or (self._image_size,)))))
+        with self._lock:
+            if key not in self._resolved:
+                self._resolved[key] = self._select(*key)
+
+            return self._resolved[key]
+
+    def artifact_path(
+        self,
+        backend: str,
+        model: Path,
+        /,
+        image_size: int | None = None
+    ) -> Path:
+        return self._backends[backend].artifact_path(
+            self._source_path(model),
+            image_size=image_size
+        )
+
+    def export(
+        self,
+        backend: str,
+        model: Path,
+        task: str,
+        /,
+        image_size: int | None = None,
+        **options: Any
+    ) -> YOLOArtifact:
+        selected = self._backends[backend]
+        if selected.export_format is None:
+            return YOLOArtifact(backend=selected, path=model)
+
+        source = self._source_path(model)
+        if source != model:
+            source.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(model, source)
+
+        image_size = image_size or self._image_size
+        exported = Path(YOLO(model=source, task=task).export(
+            format=selected.export_format,
+            imgsz=image_size,
+            dynamic=selected.dynamic,
+            int8=selected.int8,
+            device="cpu",
+            **options
+        ))
+
+        path = selected.artifact_path(source, image_size=image_size)
+        if not selected.dynamic and exported != path:
+            exported.replace(path)
+            exported = path
+
+        return YOLOArtifact(backend=selected, path=exported)
+
+    def _select(
+        self,
+        model: Path,
+        task: str,
+        device: str | None,
+        image_sizes: tuple[int, ...],
+        /
+    ) -> YOLOArtifact:
+        pytorch = YOLOArtifact(backend=self._backends["pytorch"], path=model)
+        if model.suffix != ".pt" or (device is not None and device != "cpu"):
+            return pytorch
+
+        if self._backend != "auto":
+            backend = self._backends[self._backend]
+            if not self._supports(backend, image_sizes):
+                _logger.warning(
+                    "%s backend only serves a single image size, keeping PyTorch for %s (%s)",
+                    backend.name,
+                    model,
+                    ", ".join(map(str, image_sizes))
+                )
+                return pytorch
+
+            return self._export(backend, model, task, image_sizes) or pytorch
+
+        timings: dict[str, float] = {}
+        artifacts: dict[str, YOLOArtifact] = {}
+        for name, backend in self._backends.items():
+            if backend.int8 or not self._supports(backend, image_sizes):
+                continue
+
+            artifact = self._export(backend, model, task, image_sizes)
+            if artifact is None:
+                continue
+
+            try:
+                timings[name] = self._benchmark(artifact, task, image_sizes)
+            except Exception: # pylint: disable=broad-exception-caught
+                _logger.warning(
+                    "Failed to benchmark %s backend for %s", name, model,
+                    exc_info=True
+                )
+                continue
+
+            artifacts[name] = artifact
+
+        if not timings:
+            return pytorch
+
+        fastest = min(timings, key=timings.__getitem__)
+        _logger.info(
+            "Selected %s backend for %s (%s)",
+            fastest,
+            model,
+            ", ".join(f"{name}: {timing * 1000:.1f} ms" for name, timing in timings.items())
+        )
+
+        return artifacts[fastest]
+
+    def _supports(self, backend: YOLOBackend, image_sizes: tuple[int, ...], /) -> bool:
+        return backend.export_format is None or backend.dynamic or len(image_sizes) == 1
+
+    def _export(
+        self,
+        backend: YOLOBackend,
+        model: Path,
+        task: str,
+        image_sizes: tuple[int, ...],
+        /
+    ) -> YOLOArtifact | None:
+        if not backend.is_available():
+            _logger.info("Skipping %s backend: %s is not installed", backend.name, backend.runtime)
+            return None
+
+        if backend.export_format is None:
+            return YOLOArtifact(backend=backend, path=model)
+
+        image_size = image_sizes[0] if not backend.dynamic else None
+        path = self.artifact_path(backend.name, model, image_size=image_size)
+        if path.exists() and path.stat().st_mtime >= model.stat().st_mtime:
+            return YOLOArtifact(backend=backend, path=path)
+
+        if not self._can_export(backend, model, path):
+            return None
+
+        try:
+            return self.export(backend.name, model, task, image_size=image_sizes[0])
+        except Exception: # pylint: disable=broad-exception-caught
+            _logger.warning(
+                "Failed to export %s to %s", model, backend.name,
+                exc_info=True
+            )
+            return None
+
+    def _can_export(self, backend: YOLOBackend, model: Path, path: Path, /) -> bool:
+        if backend.int8:
+            _logger.warning(
+                "No up-to-date %s artifact for %s, run the quantize command",
+                backend.name,
+                model
+            )
+            return False
+
+        if not self._is_writable(path.parent):
+            _logger.warning(
+                "Cannot export %s to %s: %s is not writable, "
+                "set ML_YOLO_BACKEND_CACHE_PATH to a writable directory",
+                model,
+                backend.name,
+                path.parent
+            )
+            return False
+
+        return True
+
+    def _source_path(self, model: Path, /) -> Path:
+        if self._cache_path is None:
+            return model
+
+        return self._cache_path / model.parent.name / model.name
+
+    def _is_writable(self, path: Path, /) -> bool:
+        # The cache directory may not exist yet, its nearest existing parent
+        # decides whether it can be created.
+        while not path.exists() and path != path.parent:
+            path = path.parent
+
+        return os.access(path, os.W_OK)
+
+    def _benchmark(
+        self,
+        artifact: YOLOArtifact,
+        task: str,
+        image_sizes: tuple[int, ...],
+        /
+    ) -> float:
+        model = YOLO(model=artifact.path, task=task)
+        generator = np.random.default_rng(0)
+
+        total = 0.0
+        for image_size in image_sizes:
+            frame = generator.integers(0, 256, (image_size, image_size, 3), dtype=np.uint8)
+
+            timings: list[float] = []
+            with torch.inference_mode():
+                model.predict(source=frame, imgsz=image_size, verbose=False)
+                for _ in range(self._benchmark_runs):
+                    started = time.perf_counter()
+                    model.predict(source=frame, imgsz=image_size, verbose=False)
+                    timings.append(time.perf_counter() - started)
+
+            total += statistics.median(timings)
+
+        return total
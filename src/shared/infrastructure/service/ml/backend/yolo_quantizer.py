@@ -0,0 +1,204 @@
+import json
+import time
+import random
+import statistics
+import tempfile
+from pathlib import Path
+from dataclasses import dataclass
+from datetime import timedelta
+
+import cv2
+import numpy as np
+import torch
+
+from cv2.typing import MatLike
+from ultralytics import YOLO # type: ignore[attr-defined]
+from ultralytics.engine.model import Model
+
+from shared.infrastructure.service.ml.backend.yolo_backend import YOLOArtifact, YOLOBackendRegistry
+
+@dataclass(frozen=True, slots=True)
+class YOLOQuantizationReport:
+    model: Path
+    reference: YOLOArtifact
+    quantized: YOLOArtifact
+    calibration_frames: int
+    evaluation_frames: int
+    reference_latency: timedelta
+    quantized_latency: timedelta
+    precision: float
+    recall: float
+
+    @property
+    def agreement(self) -> float:
+        if self.precision + self.recall == 0:
+            return 0.0
+
+        return 2 * self.precision * self.recall / (self.precision + self.recall)
+
+    @property
+    def speedup(self) -> float:
+        return self.reference_latency / self.quantized_latency
+
+
+class YOLOQuantizer:
+    """
+    Quantizes a YOLO model to INT8 OpenVINO IR from captured frames.
+
+    A share of the frames is held out of calibration and used to compare the
+    INT8 model against the FP32 artifact the backend registry serves today.
+    Agreement counts INT8 boxes that match an FP32 box of the same class with
+    at least iou_threshold overlap, so precision and recall are measured
+    against the FP32 detections rather than ground truth.
+    """
+
+    _frame_suffixes: frozenset[str] = frozenset({".jpg", ".jpeg", ".png", ".bmp"})
+
+    def __init__(
+        self,
+        registry: YOLOBackendRegistry,
+        /,
+        holdout: float = 0.2,
+        iou_threshold: float = 0.5,
+        seed: int = 0
+    ) -> None:
+        if not 0 < holdout < 1:
+            raise ValueError("holdout must be between 0 and 1")
+
+        self._registry = registry
+        self._holdout = holdout
+        self._iou_threshold = iou_threshold
+        self._seed = seed
+
+    def quantize(self, model: Path, task: str, frames: Path, /) -> YOLOQuantizationReport:
+        if model.suffix != ".pt":
+            raise ValueError(f"Only PyTorch .pt models can be quantized: {model}")
+
+        paths = sorted(
+            path for path in frames.iterdir()
+            if path.suffix.lower() in self._frame_suffixes
+        )
+        if len(paths) < 2:
+            raise ValueError(f"Not enough captured frames in {frames}")
+
+        random.Random(self._seed).shuffle(paths)
+        split = max(1, int(len(paths) * self._holdout))
+        evaluation, calibration = paths[:split], paths[split:]
+
+        reference = self._registry.resolve(model, task, "cpu")
+        with tempfile.TemporaryDirectory() as tmp:
+            quantized = self._registry.export(
+                "openvino_int8",
+                model,
+                task,
+                data=str(self._write_dataset(Path(tmp), model, task, calibration)),
+                fraction=1.0
+            )
+
+        reference_model = YOLO(model=reference.path, task=task)
+        quantized_model = YOLO(model=quantized.path, task=task)
+        reference_latency: list[float] = []
+        quantized_latency: list[float] = []
+        matched = reference_count = quantized_count = 0
+        for path in evaluation:
+            frame = cv2.imread(str(path), cv2.IMREAD_COLOR)
+            if frame is None:
+                continue
+
+            expected = self._predict(reference_model, frame, reference_latency)
+            actual = self._predict(quantized_model, frame, quantized_latency)
+
+            matched += self._match(expected, actual)
+            reference_count += len(expected[0])
+            quantized_count += len(actual[0])
+
+        if not reference_latency:
+            raise ValueError(f"No readable evaluation frames in {frames}")
+
+        return YOLOQuantizationReport(
+            model=model,
+            reference=reference,
+            quantized=quantized,
+            calibration_frames=len(calibration),
+            evaluation_frames=len(reference_latency),
+            reference_latency=timedelta(seconds=statistics.median(reference_latency)),
+            quantized_latency=timedelta(seconds=statistics.median(quantized_latency)),
+            precision=matched / quantized_count if quantized_count else 1.0,
+            recall=matched / reference_count if reference_count else 1.0
+        )
+
+    def _write_dataset(
+        self,
+        path: Path,
+        model: Path,
+        task: str,
+        frames: list[Path],
+        /
+    ) -> Path:
+        images = path / "calibration.txt"
+        images.write_text("".join(f"{frame.resolve()}\n" for frame in frames))
+
+        # JSON is valid YAML, which is what ultralytics expects for dataset files.
+        dataset = path / "calibration.yaml"
+        dataset.write_text(json.dumps({
+            "path": str(path),
+            "train": images.name,
+            "val": images.name,
+            "names": YOLO(model=model, task=task).names,
+        }))
+
+        return dataset
+
+    def _predict(
+        self,
+        model: Model,
+        frame: MatLike,
+        latency: list[float],
+        /
+    ) -> tuple[np.typing.NDArray[np.float32], np.typing.NDArray[np.int64]]:
+        if not latency:
+            model.predict(source=frame, verbose=False)
+
+        with torch.inference_mode():
+            started = time.perf_counter()
+            results = model.predict(source=frame, verbose=False)
+            latency.append(time.perf_counter() - started)
+
+        boxes = results[0].boxes
+        if boxes is None or len(boxes) == 0:
+            return np.zeros((0, 4), dtype=np.float32), np.zeros(0, dtype=np.int64)
+
+        return (
+            boxes.xyxy.cpu().numpy().astype(np.float32),
+            boxes.cls.cpu().numpy().astype(np.int64)
+        )
+
+    def _match(
+        self,
+        expected: tuple[np.typing.NDArray[np.float32], np.typing.NDArray[np.int64]],
+        actual: tuple[np.typing.NDArray[np.float32], np.typing.NDArray[np.int64]],
+        /
+    ) -> int:
+        expected_boxes, expected_classes = expected
+        actual_boxes, actual_classes = actual
+        if len(expected_boxes) == 0 or len(actual_boxes) == 0:
+            return 0
+
+        top_left = np.maximum(expected_boxes[:, None, :2], actual_boxes[None, :, :2])
+        bottom_right = np.minimum(expected_boxes[:, None, 2:], actual_boxes[None, :, 2:])
+        intersection = np.prod(np.clip(bottom_right - top_left, 0, None), axis=2)
+        expected_area = np.prod(expected_boxes[:, 2:] - expected_boxes[:, :2], axis=1)
+        actual_area = np.prod(actual_boxes[:, 2:] - actual_boxes[:, :2], axis=1)
+        union = expected_area[:, None] + actual_area[None, :] - intersection
+        iou = np.where(union > 0, intersection / np.maximum(union, 1e-9), 0.0)
+        iou[expected_classes[:, None] != actual_classes[None, :]] = 0.0
+
+        matched = 0
+        while True:
+            row, column = divmod(int(np.argmax(iou)), iou.shape[1])
+            if iou[row, column] < self._iou_threshold:
+                return matched
+
+            matched += 1
+            iou[row, :] = 0.0
+            iou[:, column] = 0.0
@@ -1,25 +1,85 @@
 from pathlib import Path
+from datetime import timedelta
 
+from shared.application import config
 from shared.application.factory.tool.worker_pool import WorkerPoolFactory
+from shared.application.tool.worker_pool import WorkerPool
+from shared.application.service.ml.provider.detection import MlDetectionProvider
 from shared.infrastructure.service.ml.provider.yolo_provider import YOLOMlDetectionProvider
+from shared.infrastructure.service.ml.provider.caching_provider import CachingMlDetectionProvider
+from shared.infrastructure.service.ml.provider.process_provider import ProcessMlDetectionProvider
+from shared.infrastructure.service.ml.backend.yolo_backend import YOLOBackendRegistry
+from shared.infrastructure.tool.cpu_budget import CpuBudget
 
 class YOLOMlDetectionFactory:
     def __init__(
         self,
+        config_ml: config.Ml,
         worker_pool_factory: WorkerPoolFactory,
+        worker_pool: WorkerPool,
+        backend_registry: YOLOBackendRegistry,
+        cpu_budget: CpuBudget,
         /
     ) -> None:
+        self._config_ml = config_ml
         self._worker_pool_factory = worker_pool_factory
+        self._worker_pool = worker_pool
+        self._backend_registry = backend_registry
+        self._cpu_budget = cpu_budget
+        self._process_providers: list[ProcessMlDetectionProvider] = []
 
     def make(
         self,
         model: Path,
         task: str = "detect",
-        device: str | None = None
-    ) -> YOLOMlDetectionProvider:
-        return YOLOMlDetectionProvider(
-            self._worker_pool_factory,
+        device: str | None = None,
+        *,
+        image_sizes: tuple[int, ...] = ()
+    ) -> MlDetectionProvider:
+        if device is None:
+            device = self._config_ml.yolo_model_device
+
+        artifact = self._backend_registry.resolve(
             model,
             task,
-            device
+            device,
+            image_sizes=image_sizes
         )
+        if artifact.backend.export_format is not None:
+            model, device = artifact.path, None
+
+        provider: MlDetectionProvider
+        if self._config_ml.yolo_processes > 0:
+            provider = ProcessMlDetectionProvider(
+                model,
+                task,
+                device,
+                processes=self._config_ml.yolo_processes,
+                threads=self._cpu_budget.threads("yolo")
+            )
+            self._process_providers.append(provider)
+        else:
+            provider = YOLOMlDetectionProvider(
+                self._worker_pool_factory,
+                model,
+                task,
+                device,
+                batch_max_size=self._config_ml.yolo_batch_max_size,
+                batch_window=timedelta(milliseconds=self._config_ml.yolo_batch_window_ms),
+                replicas=self._config_ml.yolo_replicas
+            )
+
+        if self._config_ml.yolo_detection_cache_size == 0:
+            return provider
+
+        return CachingMlDetectionProvider(
+            provider,
+            self._worker_pool,
+            max_size=self._config_ml.yolo_detection_cache_size
+        )
+
+    async def shutdown(self) -> None:
+        for provider in self._process_providers:
+            await provider.shutdown()
+
+        self._process_providers.clear()
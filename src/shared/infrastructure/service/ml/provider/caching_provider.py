@@ -0,0 +1,95 @@
+import asyncio
+
+from collections import OrderedDict
+
+from shared.domain.aggregate.image import Image
+
+from shared.application.tool.worker_pool import WorkerPool
+from shared.application.service.ml.dto import detection
+from shared.application.service.ml.provider.detection import MlDetectionProvider
+
+from shared.infrastructure.dto.vo.data import Cv2ImageBinary
+
+_Key = tuple[
+    bytes,
+    int | None,
+    float | None,
+    tuple[tuple[int, str], ...] | None,
+    int | None
+]
+
+class CachingMlDetectionProvider(MlDetectionProvider):
+    def __init__(
+        self,
+        provider: MlDetectionProvider,
+        worker_pool: WorkerPool,
+        /,
+        max_size: int
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+
+        self._provider = provider
+        self._worker_pool = worker_pool
+        self._max_size = max_size
+        self._responses: OrderedDict[_Key, detection.Response] = OrderedDict()
+        self._pending: dict[_Key, asyncio.Task[detection.Response]] = {}
+
+    async def predict(self, request: detection.Request, /) -> detection.Response:
+        key = await self._get_key(request)
+
+        response = self._responses.get(key)
+        if response is not None:
+            self._responses.move_to_end(key)
+            return response
+
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.create_task(self._predict_and_store(key, request))
+            self._pending[key] = pending
+
+        return await asyncio.shield(pending)
+
+    async def _predict_and_store(
+        self,
+        key: _Key,
+        request: detection.Request,
+        /
+    ) -> detection.Response:
+        try:
+            response = await self._provider.predict(request)
+        finally:
+            self._pending.pop(key, None)
+
+        self._responses[key] = response
+        self._responses.move_to_end(key)
+        if len(self._responses) > self._max_size:
+            self._responses.popitem(last=False)
+
+        return response
+
+    async def _get_key(self, request: detection.Request, /) -> _Key:
+        digest = await self._worker_pool.run(
+            self._get_digest,
+            request.source
+        )
+        target_types = None
+        if request.target_types is not None:
+            target_types = tuple(
+                (target_type.id, target_type.name)
+                for target_type in request.target_types
+            )
+
+        return (
+            digest,
+            request.image_size,
+            request.score_threshold,
+            target_types,
+            request.max_detections
+        )
+
+    def _get_digest(self, image: Image, /) -> bytes:
+        if isinstance(image.data, Cv2ImageBinary):
+            return image.data.digest()
+
+        raise TypeError("Unsupported image data type for frame digest.")
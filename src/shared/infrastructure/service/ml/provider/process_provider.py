@@ -0,0 +1,84 @@
+from pathlib import Path
+from typing import Any
+from functools import partial
+
+import torch
+
+from cv2.typing import MatLike
+
+from shared.domain.aggregate.image import Image
+from shared.domain.vo.coordinate import BoundingBox, RotatedBoundingBox, Polygon
+
+from shared.application.service.ml.dto import detection
+from shared.application.service.ml.provider.detection import MlDetectionProvider
+
+from shared.infrastructure.dto.vo.data import Cv2ImageBinary
+from shared.infrastructure.factory.tool.worker_pool import DefaultWorkerPoolFactory
+from shared.infrastructure.service.ml.provider.yolo_provider import YOLOMlDetectionProvider
+from shared.infrastructure.tool.process_model_pool import ProcessModelPool
+
+class ProcessMlDetectionProvider(MlDetectionProvider):
+    def __init__(
+        self,
+        model: Path,
+        task: str,
+        device: str | None = None,
+        /,
+        processes: int = 1,
+        threads: int = 1
+    ) -> None:
+        self._pool: ProcessModelPool[YOLOMlDetectionProvider] = ProcessModelPool(
+            partial(_make_provider, model, task, device, threads),
+            processes=processes
+        )
+
+    async def predict(self, request: detection.Request, /) -> detection.Response:
+        return await self._pool.run(
+            _predict,
+            self._extract_frame(request.source),
+            request.source.coordinate,
+            request.model_dump(exclude={"source"})
+        )
+
+    async def shutdown(self) -> None:
+        await self._pool.shutdown()
+
+    def _extract_frame(self, image: Image, /) -> MatLike:
+        if isinstance(image.data, Cv2ImageBinary):
+            return image.data.frame()
+
+        raise TypeError("Unsupported image data type for frame extraction.")
+
+
+def _make_provider(
+    model: Path,
+    task: str,
+    device: str | None,
+    threads: int,
+    /
+) -> YOLOMlDetectionProvider:
+    # Each worker process has its own PyTorch intra-op pool.
+    torch.set_num_threads(threads)
+
+    return YOLOMlDetectionProvider(
+        DefaultWorkerPoolFactory(),
+        model,
+        task,
+        device
+    )
+
+
+def _predict(
+    provider: YOLOMlDetectionProvider,
+    frame: MatLike,
+    coordinate: BoundingBox | RotatedBoundingBox | Polygon,
+    fields: dict[str, Any],
+    /
+) -> detection.Response:
+    return provider.predict_sync(detection.Request(
+        source=Image(
+            data=Cv2ImageBinary(image=frame),
+            coordinate=coordinate
+        ),
+        **fields
+    ))
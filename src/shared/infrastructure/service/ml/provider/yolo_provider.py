@@ -1,5 +1,10 @@
+import asyncio
+import logging
+
+from typing import Any
+
 from pathlib import Path
-from threading import Lock
+from datetime import timedelta
 
 import numpy as np
 import torch
@@ -9,7 +14,7 @@ from ultralytics import YOLO # type: ignore[attr-defined]
 from ultralytics.engine.model import Model
 from ultralytics.engine.results import Results
 
-from shared.domain.vo.coordinate import BoundingBox
+from shared.domain.vo.coordinate import BoundingBox, Coordinate
 from shared.domain.aggregate.image import Image
 
 from shared.application.factory.tool.worker_pool import WorkerPoolFactory
@@ -17,6 +22,9 @@ from shared.application.service.ml.dto import detection
 from shared.application.service.ml.provider.detection import MlDetectionProvider
 
 from shared.infrastructure.dto.vo.data import Cv2ImageBinary
+from shared.infrastructure.tool.replica_pool import ReplicaPool
+
+_logger = logging.getLogger(__name__)
 
 class YOLOMlDetectionProvider(MlDetectionProvider):
     def __init__(
@@ -25,30 +33,200 @@ class YOLOMlDetectionProvider(MlDetectionProvider):
         model: Path,
         task: str,
         device: str | None = None,
+        /,
+        *,
+        batch_max_size: int = 1,
+        batch_window: timedelta = timedelta(0),
+        replicas: int = 1
+    ) -> None:
+        if batch_max_size <= 0:
+            raise ValueError("batch_max_size must be positive")
+
+        if replicas <= 0:
+            raise ValueError("replicas must be positive")
+
+        self._worker_pool = worker_pool_factory.make_with_limits(max_workers=replicas)
+        self._replicas: ReplicaPool[Model] = ReplicaPool([
+            self._make_model(model, task, device)
+            for _ in range(replicas)
+        ])
+        self._class_ids: dict[str, int] = {
+            name: class_id for class_id, name in self._replicas.replicas[0].names.items()
+        }
+        self._batch_max_size = batch_max_size
+        self._batch_window = batch_window
+        self._batch: list[tuple[detection.Request, asyncio.Future[detection.Response]]] = []
+        self._batch_timer: asyncio.TimerHandle | None = None
+        self._batch_tasks: set[asyncio.Task[None]] = set()
+        self._unmatched_target_types: set[tuple[str, ...]] = set()
+
+    async def predict(self, request: detection.Request, /) -> detection.Response:
+        if self._batch_max_size == 1:
+            async with self._replicas.acquire() as model:
+                return await self._worker_pool.run(
+                    self._do_predict,
+                    model,
+                    request
+                )
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[detection.Response] = loop.create_future()
+
+        self._batch.append((request, future))
+        if len(self._batch) >= self._batch_max_size:
+            self._flush_batch()
+        elif self._batch_timer is None:
+            self._batch_timer = loop.call_later(
+                self._batch_window.total_seconds(),
+                self._flush_batch
+            )
+
+        return await future
+
+    def _flush_batch(self) -> None:
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._predict_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _predict_batch(
+        self,
+        batch: list[tuple[detection.Request, asyncio.Future[detection.Response]]],
         /
     ) -> None:
-        self._worker_pool = worker_pool_factory.make_with_limits(max_workers=1)
-        self._lock = Lock()
-        self._model: Model = YOLO(model=model, task=task)
+        try:
+            async with self._replicas.acquire() as model:
+                responses = await self._worker_pool.run(
+                    self._do_predict_many,
+                    model,
+                    tuple(request for request, _ in batch)
+                )
+        except Exception as exc: # pylint: disable=broad-exception-caught
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+
+            return
 
+        for (_, future), response in zip(batch, responses, strict=True):
+            if not future.done():
+                future.set_result(response)
+
+    def predict_sync(self, request: detection.Request, /) -> detection.Response:
+        with self._replicas.acquire_nowait() as model:
+            return self._do_predict(model, request)
+
+    def _make_model(self, model: Path, task: str, device: str | None, /) -> Model:
+        replica: Model = YOLO(model=model, task=task)
         if device is not None:
-            self._model.to(device=device)
+            replica.to(device=device)
 
-    async def predict(self, request: detection.Request, /) -> detection.Response:
-        return await self._worker_pool.run(
-            self._do_predict,
-            request
-        )
+        return replica
+
+    def _do_predict(self, model: Model, request: detection.Request, /) -> detection.Response:
+        options = self._get_predict_options(request)
+        if options is None:
+            return self._make_empty_response()
 
-    def _do_predict(self, request: detection.Request, /) -> detection.Response:
         frame = self._extract_frame(request.source)
-        with self._lock:
+        with torch.inference_mode():
+            results = model.predict(
+                source=frame,
+                **dict(options)
+            )
+
+        return self._process_results(request, results)
+
+    def _do_predict_many(
+        self,
+        model: Model,
+        requests: tuple[detection.Request, ...],
+        /
+    ) -> tuple[detection.Response, ...]:
+        responses: list[detection.Response] = [self._make_empty_response()] * len(requests)
+
+        groups: dict[tuple[tuple[str, Any], ...], list[int]] = {}
+        for i, request in enumerate(requests):
+            options = self._get_predict_options(request)
+            if options is not None:
+                groups.setdefault(options, []).append(i)
+
+        for options, indexes in groups.items():
+            frames = [
+                self._extract_frame(requests[i].source)
+                for i in indexes
+            ]
             with torch.inference_mode():
-                results = self._model.predict(
-                    source=frame
+                results = model.predict(
+                    source=frames,
+                    **dict(options)
                 )
 
-        return self._process_results(request, results)
+            if len(results) != len(indexes):
+                raise ValueError("Expected one result per frame from the model.")
+
+            for i, result in zip(indexes, results, strict=True):
+                responses[i] = self._process_results(requests[i], [result])
+
+        return tuple(responses)
+
+    def _get_predict_options(
+        self,
+        request: detection.Request,
+        /
+    ) -> tuple[tuple[str, Any], ...] | None:
+        options: list[tuple[str, Any]] = []
+        if request.image_size is not None:
+            options.append(("imgsz", request.image_size))
+
+        if request.score_threshold is not None:
+            options.append(("conf", request.score_threshold))
+
+        if request.max_detections is not None:
+            options.append(("max_det", request.max_detections))
+
+        if request.target_types is not None:
+            classes = self._get_target_class_ids(request.target_types)
+            if not classes:
+                self._warn_unmatched(request.target_types)
+                return None
+
+            options.append(("classes", classes))
+
+        return tuple(options)
+
+    def _get_target_class_ids(
+        self,
+        target_types: tuple[detection.Type, ...],
+        /
+    ) -> tuple[int, ...]:
+        # Class ids are model specific, so target types are matched by name.
+        return tuple(sorted({
+            self._class_ids[target_type.name]
+            for target_type in target_types
+            if target_type.name in self._class_ids
+        }))
+
+    def _warn_unmatched(self, target_types: tuple[detection.Type, ...], /) -> None:
+        # A renamed model class silently disables detection, so it is logged
+        # once per set of target types rather than on every request.
+        names = tuple(sorted(target_type.name for target_type in target_types))
+        if names in self._unmatched_target_types:
+            return
+
+        self._unmatched_target_types.add(names)
+        _logger.warning(
+            "None of the target types %s is a class of the model %s",
+            names,
+            sorted(self._class_ids)
+        )
 
     def _extract_frame(self, image: Image, /) -> MatLike:
         if isinstance(image.data, Cv2ImageBinary):
@@ -80,41 +258,41 @@ class YOLOMlDetectionProvider(MlDetectionProvider):
             mask &= (conf_scores >= request.score_threshold)
 
         if request.target_types is not None:
-            target_cls = set(t.name for t in request.target_types)
-            mask &= np.isin(class_ids, list(target_cls))
+            mask &= np.isin(class_ids, self._get_target_class_ids(request.target_types))
 
-        idx = np.where(mask)[0]
+        idx = np.flatnonzero(mask)
         if len(idx) == 0:
             return self._make_empty_response()
 
-        response_boxes: list[detection.Box] = []
-        for box_idx in idx:
-            box = boxes[box_idx]
-            xyxy = box.xyxy.cpu().numpy()[0]
-            coordinate = self._to_bounding_box_coordinate(xyxy)
-            class_id = class_ids[box_idx]
-            class_name = results[0].names.get(class_id, "unknown")
-
-            response_boxes.append(detection.Box(
-                type=detection.Type(
-                    id=class_id,
-                    name=class_name
-                ),
-                score=float(conf_scores[box_idx]),
-                coordinate=coordinate
-            ))
+        xyxy = self._detach_as(boxes.xyxy)[idx].astype(np.int64)
+        if (xyxy < 0).any() or (xyxy[:, :2] > xyxy[:, 2:]).any():
+            raise ValueError("Invalid bbox coordinates returned by the model.")
+
+        names = results[0].names
+        types = {
+            class_id: detection.Type(id=class_id, name=names.get(class_id, "unknown"))
+            for class_id in np.unique(class_ids[idx]).tolist()
+        }
 
+        # The coordinates are validated above as whole arrays, so the models
+        # are built without repeating the validation for every box.
         return detection.Response(
             id=None,
-            boxes=tuple(response_boxes)
-        )
-
-    def _to_bounding_box_coordinate(
-        self,
-        xyxy: np.typing.NDArray[np.float32]
-    ) -> BoundingBox:
-        return BoundingBox.from_xyxy(
-            *map(int, xyxy.tolist())
+            boxes=tuple(
+                detection.Box.model_construct(
+                    type=types[class_id],
+                    score=score,
+                    coordinate=BoundingBox.model_construct(
+                        p1=Coordinate.model_construct(x=x1, y=y1),
+                        p2=Coordinate.model_construct(x=x2, y=y2)
+                    )
+                )
+                for (x1, y1, x2, y2), score, class_id in zip(
+                    xyxy.tolist(),
+                    conf_scores[idx].tolist(),
+                    class_ids[idx].tolist()
+                )
+            )
         )
 
     def _detach_as(
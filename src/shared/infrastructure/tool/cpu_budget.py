@@ -0,0 +1,93 @@
+import os
+
+from dataclasses import dataclass
+from collections.abc import Mapping
+
+import cv2
+import torch
+
+@dataclass(frozen=True, slots=True)
+class CpuConsumer:
+    instances: int
+    threads: int = 0
+
+
+class CpuBudget:
+    """
+    Divides the host's cores between the worker pool and model inference.
+
+    The worker pool (decoding, hashing, cropping) gets its share of the
+    cores as threads, and OpenCV runs single-threaded inside them so the
+    pool is the only source of parallelism there. The remaining cores are
+    split into disjoint shares between every concurrently running model
+    instance (replica or worker process) of every consumer; consumers with
+    a fixed thread count are taken out of the split first. Consumers are
+    added by the bounded context that runs them through with_consumers().
+    apply() sets the process wide limits once at startup, worker processes
+    get their share through their initializer.
+    """
+
+    # In-process YOLO replicas share the process wide PyTorch intra-op pool.
+    _torch_consumer: str = "yolo"
+
+    def __init__(
+        self,
+        cores: int = 0,
+        /,
+        worker_pool_share: float = 0.25,
+        consumers: Mapping[str, CpuConsumer] | None = None
+    ) -> None:
+        if not 0 < worker_pool_share < 1:
+            raise ValueError("worker_pool_share must be between 0 and 1")
+
+        self._cores = cores if cores > 0 else self._detect_cores()
+        self._worker_pool_share = worker_pool_share
+        self._worker_pool_threads = max(1, round(self._cores * worker_pool_share))
+        self._consumers = dict(consumers or {})
+
+        fixed = sum(
+            consumer.instances * consumer.threads
+            for consumer in self._consumers.values()
+        )
+        shared = sum(
+            consumer.instances
+            for consumer in self._consumers.values()
+            if consumer.threads == 0
+        )
+        self._shared_threads = max(1, (self.inference_threads - fixed) // max(1, shared))
+
+    @property
+    def cores(self) -> int:
+        return self._cores
+
+    @property
+    def worker_pool_threads(self) -> int:
+        return self._worker_pool_threads
+
+    @property
+    def inference_threads(self) -> int:
+        return max(1, self._cores - self._worker_pool_threads)
+
+    def threads(self, consumer: str, /) -> int:
+        try:
+            return self._consumers[consumer].threads or self._shared_threads
+        except KeyError as exc:
+            raise ValueError("Unknown CPU consumer") from exc
+
+    def with_consumers(self, consumers: Mapping[str, CpuConsumer], /) -> "CpuBudget":
+        return CpuBudget(
+            self._cores,
+            worker_pool_share=self._worker_pool_share,
+            consumers={**self._consumers, **consumers}
+        )
+
+    def apply(self) -> None:
+        cv2.setNumThreads(1)
+        if self._torch_consumer in self._consumers:
+            torch.set_num_threads(self.threads(self._torch_consumer))
+
+    def _detect_cores(self) -> int:
+        if hasattr(os, "sched_getaffinity"):
+            return len(os.sched_getaffinity(0))
+
+        return os.cpu_count() or 1
@@ -0,0 +1,116 @@
+import os
+import uuid
+import asyncio
+import random
+import logging
+import tempfile
+from pathlib import Path
+
+import cv2
+
+from cv2.typing import MatLike
+
+from shared.domain.aggregate.image import Image
+
+from shared.application.tool.frame_capture import FrameCapture
+from shared.application.tool.worker_pool import WorkerPool
+
+from shared.infrastructure.dto.vo.data import Cv2ImageBinary
+
+_logger = logging.getLogger(__name__)
+
+class FileFrameCapture(FrameCapture):
+    """
+    Samples decoded frames to a directory as JPEG files.
+
+    The captured frames are the calibration set for model quantization, so
+    only a fraction of the traffic is kept and capturing stops once the
+    directory holds max_frames images. Frames are written by background tasks
+    so a request never waits on the disk; at most max_pending writes are in
+    flight and sampled frames beyond that are dropped.
+    """
+
+    _suffix: str = ".jpg"
+    _quality: int = 95
+
+    def __init__(
+        self,
+        path: Path,
+        worker_pool: WorkerPool,
+        /,
+        rate: float,
+        max_frames: int,
+        max_pending: int = 4
+    ) -> None:
+        if not 0 <= rate <= 1:
+            raise ValueError("rate must be between 0 and 1")
+
+        self._path = path
+        self._worker_pool = worker_pool
+        self._rate = rate
+        self._max_frames = max_frames
+        self._max_pending = max_pending
+        self._count: int | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def capture(self, image: Image, /) -> None:
+        if random.random() >= self._rate:
+            return
+
+        if not isinstance(image.data, Cv2ImageBinary):
+            return
+
+        if self._count is not None and self._count >= self._max_frames:
+            return
+
+        if len(self._tasks) >= self._max_pending:
+            return
+
+        task = asyncio.create_task(self._capture(image.data.frame()))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def shutdown(self) -> None:
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _capture(self, frame: MatLike, /) -> None:
+        if self._count is None:
+            count = await self._worker_pool.run(self._count_frames)
+            if self._count is None:
+                self._count = count
+
+        if self._count >= self._max_frames:
+            return
+
+        self._count += 1
+        try:
+            await self._worker_pool.run(self._write, frame)
+        except (OSError, ValueError):
+            self._count -= 1
+            _logger.warning("Failed to capture frame to %s", self._path, exc_info=True)
+
+    def _count_frames(self) -> int:
+        if not self._path.is_dir():
+            return 0
+
+        return sum(1 for _ in self._path.glob(f"*{self._suffix}"))
+
+    def _write(self, frame: MatLike, /) -> None:
+        ok, data = cv2.imencode(
+            self._suffix,
+            frame,
+            (cv2.IMWRITE_JPEG_QUALITY, self._quality)
+        )
+        if not ok:
+            raise ValueError("cv2 failed to encode the frame.")
+
+        self._path.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self._path, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data.tobytes())
+
+            os.replace(tmp, self._path / f"{uuid.uuid4().hex}{self._suffix}")
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
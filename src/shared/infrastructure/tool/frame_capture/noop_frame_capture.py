@@ -0,0 +1,7 @@
+from shared.domain.aggregate.image import Image
+
+from shared.application.tool.frame_capture import FrameCapture
+
+class NoopFrameCapture(FrameCapture):
+    async def capture(self, image: Image, /) -> None:
+        pass
@@ -0,0 +1,12 @@
+from typing import Any
+from collections.abc import Mapping
+
+from shared.application.tool.image_cache import ImageCache
+from shared.application.tool.image_cache_registry import ImageCacheRegistry
+
+class DefaultImageCacheRegistry(ImageCacheRegistry):
+    def __init__(self, caches: Mapping[str, ImageCache[Any]], /) -> None:
+        self._caches = dict(caches)
+
+    def caches(self) -> Mapping[str, ImageCache[Any]]:
+        return self._caches
@@ -0,0 +1,224 @@
+import os
+import json
+import asyncio
+import logging
+import tempfile
+from typing import Any
+from datetime import timedelta, datetime, UTC
+from pathlib import Path
+from collections.abc import Mapping
+
+import numpy as np
+
+from pydantic import TypeAdapter
+
+from shared.application.tool.image_cache import ImageCacheRecord
+from shared.application.tool.image_cache_registry import ImageCacheRegistry
+from shared.application.tool.image_cache_snapshot import ImageCacheSnapshot
+from shared.application.tool.worker_pool import WorkerPool
+
+_logger = logging.getLogger(__name__)
+
+class FileImageCacheSnapshot(ImageCacheSnapshot):
+    """
+    Persists image caches to one file per cache.
+
+    The file holds a JSON header with partitions and expiry times, the
+    values as JSON validated against the cache value type, and the
+    fingerprints as a raw little-endian uint64 matrix that is read in one
+    call and converted column by column. Nothing is unpickled, so a
+    snapshot file can only ever produce values of the declared type.
+    """
+
+    _magic: bytes = b"SPCSNAP2"
+    _version: int = 2
+    _word_bits: int = 64
+    _word_dtype: str = "<u8"
+    _suffix: str = ".snapshot"
+
+    def __init__(
+        self,
+        path: Path,
+        registry: ImageCacheRegistry,
+        worker_pool: WorkerPool,
+        /,
+        interval: timedelta,
+        value_types: Mapping[str, type[Any]]
+    ) -> None:
+        self._path = path
+        self._registry = registry
+        self._worker_pool = worker_pool
+        self._interval = interval
+        self._values: dict[str, TypeAdapter[list[Any]]] = {
+            name: TypeAdapter(list[value_type]) # type: ignore[valid-type]
+            for name, value_type in value_types.items()
+        }
+
+    async def restore(self) -> None:
+        for name, cache in self._registry.caches().items():
+            path = self._make_path(name)
+            if not path.is_file():
+                continue
+
+            try:
+                records = await self._worker_pool.run(self._read, path, self._values[name])
+            except (OSError, KeyError, TypeError, ValueError):
+                _logger.warning("Skipping unreadable image cache snapshot %s", path, exc_info=True)
+                continue
+
+            await cache.load(records)
+
+    async def persist(self) -> None:
+        for name, cache in self._registry.caches().items():
+            path = self._make_path(name)
+            records = await cache.dump()
+
+            try:
+                await self._worker_pool.run(self._write, path, records, self._values[name])
+            except (OSError, ValueError):
+                _logger.warning("Failed to write image cache snapshot %s", path, exc_info=True)
+
+    async def persist_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval.total_seconds())
+            try:
+                await self.persist()
+            except Exception: # pylint: disable=broad-exception-caught
+                _logger.exception("Periodic image cache snapshot failed")
+
+    def _make_path(self, name: str, /) -> Path:
+        return self._path / f"{name}{self._suffix}"
+
+    def _write(
+        self,
+        path: Path,
+        records: tuple[ImageCacheRecord[Any], ...],
+        values: TypeAdapter[list[Any]],
+        /
+    ) -> None:
+        words = self._words(records)
+        matrix = np.zeros((len(records), sum(words)), dtype=self._word_dtype)
+        for row, record in enumerate(records):
+            matrix[row] = np.frombuffer(
+                self._pack(record.fingerprint, words),
+                dtype=self._word_dtype
+            )
+
+        data = values.dump_json([record.value for record in records])
+        header = json.dumps({
+            "version": self._version,
+            "rows": len(records),
+            "words": words,
+            "partitions": [record.partition for record in records],
+            "expires_at": [
+                record.expires_at.timestamp() if record.expires_at is not None else None
+                for record in records
+            ],
+            "values_size": len(data),
+        }).encode()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(self._magic)
+                file.write(len(header).to_bytes(8, "little"))
+                file.write(header)
+                file.write(data)
+                file.write(b"\0" * self._padding(len(self._magic) + 8 + len(header) + len(data)))
+                file.write(matrix.tobytes())
+                file.flush()
+                os.fsync(file.fileno())
+
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _read(
+        self,
+        path: Path,
+        values: TypeAdapter[list[Any]],
+        /
+    ) -> tuple[ImageCacheRecord[Any], ...]:
+        with path.open("rb") as file:
+            if file.read(len(self._magic)) != self._magic:
+                raise ValueError(f"Not an image cache snapshot: {path}")
+
+            size = int.from_bytes(file.read(8), "little")
+            header = json.loads(file.read(size))
+            if header["version"] != self._version:
+                raise ValueError(f"Unsupported image cache snapshot version: {header['version']}")
+
+            rows: int = header["rows"]
+            words: tuple[int, ...] = tuple(header["words"])
+            decoded = values.validate_json(file.read(header["values_size"]))
+
+            file.seek(self._padding(file.tell()), os.SEEK_CUR)
+            matrix = np.fromfile(file, dtype=self._word_dtype, count=rows * sum(words))
+
+        if len(decoded) != rows or len(matrix) != rows * sum(words):
+            raise ValueError(f"Truncated image cache snapshot: {path}")
+
+        return tuple(
+            ImageCacheRecord(
+                fingerprint=fingerprint,
+                value=value,
+                partition=partition,
+                expires_at=(
+                    datetime.fromtimestamp(expires_at, UTC)
+                    if expires_at is not None
+                    else None
+                )
+            )
+            for fingerprint, value, partition, expires_at in zip(
+                self._unpack(matrix.reshape(rows, sum(words)), words),
+                decoded,
+                header["partitions"],
+                header["expires_at"],
+                strict=True
+            )
+        )
+
+    def _words(self, records: tuple[ImageCacheRecord[Any], ...], /) -> tuple[int, ...]:
+        if not records:
+            return ()
+
+        return tuple(
+            max(1, -(-max(
+                record.fingerprint[i].bit_length()
+                for record in records
+            ) // self._word_bits))
+            for i in range(len(records[0].fingerprint))
+        )
+
+    def _pack(self, fingerprint: tuple[int, ...], words: tuple[int, ...], /) -> bytes:
+        return b"".join(
+            component.to_bytes(component_words * self._word_bits // 8, "little")
+            for component, component_words in zip(fingerprint, words, strict=True)
+        )
+
+    def _unpack(
+        self,
+        matrix: np.typing.NDArray[np.uint64],
+        words: tuple[int, ...],
+        /
+    ) -> list[tuple[int, ...]]:
+        # Whole columns go through tolist() instead of one int per word.
+        components: list[list[int]] = []
+        start = 0
+        for component_words in words:
+            column = matrix[:, start].tolist()
+            for word in range(1, component_words):
+                column = [
+                    value | high << (self._word_bits * word)
+                    for value, high in zip(column, matrix[:, start + word].tolist())
+                ]
+
+            components.append(column)
+            start += component_words
+
+        return list(zip(*components))
+
+    def _padding(self, size: int, /) -> int:
+        return -size % (self._word_bits // 8)
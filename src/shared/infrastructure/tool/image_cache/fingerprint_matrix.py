@@ -0,0 +1,146 @@
+from typing import Generic, TypeVar
+from collections.abc import Hashable, Sequence
+
+import numpy as np
+
+from shared.application.tool.image_similarity import ImageFingerprint
+
+_K = TypeVar("_K", bound=Hashable)
+
+class FingerprintMatrix(Generic[_K]):
+    """
+    Fingerprints packed into a contiguous uint64 matrix, one row per slot, so
+    many probes can be matched against all rows with one XOR + popcount pass.
+    """
+
+    _block_rows: int = 16384
+    _initial_rows: int = 64
+    _word_bits: int = 64
+
+    __slots__ = (
+        "_words",
+        "_thresholds",
+        "_capacity",
+        "_rows",
+        "_used",
+        "_slots",
+        "_keys",
+        "_free",
+    )
+
+    def __init__(
+        self,
+        bits: tuple[int, ...],
+        thresholds: tuple[int, ...],
+        /,
+        capacity: int
+    ) -> None:
+        if len(bits) != len(thresholds):
+            raise ValueError("bits and thresholds must have the same length")
+
+        rows = min(capacity, self._initial_rows)
+
+        self._words = tuple(-(-component_bits // self._word_bits) for component_bits in bits)
+        self._thresholds = np.array(thresholds, dtype=np.int64)
+        self._capacity = capacity
+        self._rows = np.zeros((rows, sum(self._words)), dtype=np.uint64)
+        self._used = np.zeros(rows, dtype=bool)
+        self._slots: dict[_K, int] = {}
+        self._keys: list[_K | None] = [None] * rows
+        self._free = list(range(rows - 1, -1, -1))
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def add(self, key: _K, fingerprint: ImageFingerprint, /) -> None:
+        slot = self._slots.get(key)
+        if slot is None:
+            if not self._free:
+                self._grow()
+
+            slot = self._free.pop()
+            self._slots[key] = slot
+            self._keys[slot] = key
+
+        self._rows[slot] = self._pack(fingerprint)
+        self._used[slot] = True
+
+    def remove(self, key: _K, fingerprint: ImageFingerprint, /) -> None:
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            return
+
+        self._keys[slot] = None
+        self._used[slot] = False
+        self._free.append(slot)
+
+    def match(
+        self,
+        fingerprints: Sequence[ImageFingerprint],
+        /
+    ) -> tuple[tuple[_K, ...], ...]:
+        if not fingerprints:
+            return ()
+
+        probes = np.stack([self._pack(fingerprint) for fingerprint in fingerprints])
+        matches: list[list[_K]] = [[] for _ in fingerprints]
+
+        for start in range(0, len(self._rows), self._block_rows):
+            used = self._used[start:start + self._block_rows]
+            if not used.any():
+                continue
+
+            rows = self._rows[start:start + self._block_rows]
+            counts = np.bitwise_count(probes[:, None, :] ^ rows[None, :, :])
+            distances = np.add.reduceat(
+                counts,
+                self._offsets(),
+                axis=2,
+                dtype=np.int64
+            )
+            matched = (distances <= self._thresholds).any(axis=2) & used
+
+            for probe, slot in zip(*np.nonzero(matched)):
+                key = self._keys[start + int(slot)]
+                if key is not None:
+                    matches[int(probe)].append(key)
+
+        return tuple(tuple(keys) for keys in matches)
+
+    def _grow(self) -> None:
+        rows = len(self._rows)
+        if rows >= self._capacity:
+            raise OverflowError("Fingerprint matrix is full.")
+
+        grown = min(self._capacity, rows * 2)
+        self._rows = np.concatenate((
+            self._rows,
+            np.zeros((grown - rows, self._rows.shape[1]), dtype=np.uint64)
+        ))
+        self._used = np.concatenate((
+            self._used,
+            np.zeros(grown - rows, dtype=bool)
+        ))
+        self._keys.extend([None] * (grown - rows))
+        self._free.extend(range(grown - 1, rows - 1, -1))
+
+    def _pack(self, fingerprint: ImageFingerprint, /) -> np.typing.NDArray[np.uint64]:
+        mask = (1 << self._word_bits) - 1
+
+        return np.array(
+            [
+                (value >> (self._word_bits * i)) & mask
+                for value, words in zip(fingerprint, self._words, strict=True)
+                for i in range(words)
+            ],
+            dtype=np.uint64
+        )
+
+    def _offsets(self) -> list[int]:
+        offsets: list[int] = []
+        offset = 0
+        for words in self._words:
+            offsets.append(offset)
+            offset += words
+
+        return offsets
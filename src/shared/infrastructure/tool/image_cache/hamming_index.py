@@ -0,0 +1,138 @@
+import math
+
+from typing import Generic, TypeVar
+from collections.abc import Hashable, Sequence
+from itertools import combinations
+
+from shared.application.tool.image_similarity import ImageFingerprint
+
+_K = TypeVar("_K", bound=Hashable)
+
+_Chunk = tuple[int, int, tuple[int, ...]]
+
+class HammingIndex(Generic[_K]):
+    """
+    Multi-index hashing over fingerprint components. Each component is split
+    into m disjoint bit chunks; any fingerprint within threshold r of the probe
+    differs in at least one chunk by no more than r // m bits, so only those
+    chunk neighbours have to be looked up.
+    """
+
+    __slots__ = (
+        "_layouts",
+        "_tables",
+        "_keys",
+        "_match_all",
+    )
+
+    def __init__(
+        self,
+        bits: tuple[int, ...],
+        thresholds: tuple[int, ...],
+        /,
+        capacity: int
+    ) -> None:
+        if len(bits) != len(thresholds):
+            raise ValueError("bits and thresholds must have the same length")
+
+        self._layouts: tuple[tuple[_Chunk, ...], ...] = tuple(
+            self._make_layout(component_bits, threshold, capacity)
+            for component_bits, threshold in zip(bits, thresholds)
+        )
+        self._tables: tuple[tuple[dict[int, set[_K]], ...], ...] = tuple(
+            tuple({} for _ in layout)
+            for layout in self._layouts
+        )
+        self._keys: set[_K] = set()
+        self._match_all = any(
+            threshold >= component_bits
+            for component_bits, threshold in zip(bits, thresholds)
+        )
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: _K, fingerprint: ImageFingerprint, /) -> None:
+        self._keys.add(key)
+        for chunk, table, _ in self._iter_chunks(fingerprint):
+            table.setdefault(chunk, set()).add(key)
+
+    def remove(self, key: _K, fingerprint: ImageFingerprint, /) -> None:
+        self._keys.discard(key)
+        for chunk, table, _ in self._iter_chunks(fingerprint):
+            bucket = table.get(chunk)
+            if bucket is None:
+                continue
+
+            bucket.discard(key)
+            if not bucket:
+                del table[chunk]
+
+    def candidates(self, fingerprint: ImageFingerprint, /) -> set[_K]:
+        if self._match_all:
+            return set(self._keys)
+
+        result: set[_K] = set()
+        for chunk, table, flips in self._iter_chunks(fingerprint):
+            for flip in flips:
+                bucket = table.get(chunk ^ flip)
+                if bucket is not None:
+                    result |= bucket
+
+        return result
+
+    def match(
+        self,
+        fingerprints: Sequence[ImageFingerprint],
+        /
+    ) -> tuple[tuple[_K, ...], ...]:
+        return tuple(
+            tuple(self.candidates(fingerprint))
+            for fingerprint in fingerprints
+        )
+
+    def _iter_chunks(
+        self,
+        fingerprint: ImageFingerprint,
+        /
+    ) -> list[tuple[int, dict[int, set[_K]], tuple[int, ...]]]:
+        return [
+            ((value >> shift) & mask, table, flips)
+            for value, layout, tables in zip(
+                fingerprint,
+                self._layouts,
+                self._tables,
+                strict=True
+            )
+            for (shift, mask, flips), table in zip(layout, tables)
+        ]
+
+    def _make_layout(
+        self,
+        bits: int,
+        threshold: int,
+        capacity: int,
+        /
+    ) -> tuple[_Chunk, ...]:
+        if threshold < 0 or threshold >= bits:
+            return ()
+
+        # Chunks about log2(capacity) bits wide keep buckets close to one entry.
+        chunks = round(bits / max(1.0, math.log2(max(2, capacity))))
+        chunks = min(max(1, chunks), threshold + 1)
+        radius = threshold // chunks
+        width, remainder = divmod(bits, chunks)
+
+        layout: list[_Chunk] = []
+        shift = 0
+        for i in range(chunks):
+            chunk_width = width + (1 if i < remainder else 0)
+            flips = tuple(
+                sum(1 << position for position in positions)
+                for distance in range(radius + 1)
+                for positions in combinations(range(chunk_width), distance)
+            )
+            layout.append((shift, (1 << chunk_width) - 1, flips))
+            shift += chunk_width
+
+        return tuple(layout)
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from datetime import timedelta
+
+from shared.application.tool.image_cache import ImageCacheStats
+
+@dataclass(slots=True)
+class ImageCacheCounters:
+    hits: int = 0
+    misses: int = 0
+    expirations: int = 0
+    evictions: int = 0
+    comparisons: int = 0
+    latency: float = 0.0
+
+    def make_stats(self, partition: str | None, size: int, /) -> ImageCacheStats:
+        return ImageCacheStats(
+            partition=partition,
+            size=size,
+            hits=self.hits,
+            misses=self.misses,
+            expirations=self.expirations,
+            evictions=self.evictions,
+            comparisons=self.comparisons,
+            latency=timedelta(seconds=self.latency)
+        )
@@ -0,0 +1,13 @@
+import asyncio
+
+from shared.application.tool.image_cache_snapshot import ImageCacheSnapshot
+
+class NoopImageCacheSnapshot(ImageCacheSnapshot):
+    async def restore(self) -> None:
+        pass
+
+    async def persist(self) -> None:
+        pass
+
+    async def persist_periodically(self) -> None:
+        await asyncio.Future()
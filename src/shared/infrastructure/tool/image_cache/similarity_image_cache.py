@@ -1,91 +1,377 @@
+import time
 from dataclasses import dataclass
 from typing import Generic, TypeVar
 from datetime import timedelta, datetime, UTC
 from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from itertools import count
 from asyncio import Lock
 
 from shared.domain.aggregate.image import Image
-from shared.application.tool.image_cache import ImageCache
-from shared.application.tool.image_similarity import ImageSimilarity
+from shared.application.tool.image_cache import ImageCache, ImageCacheRecord, ImageCacheStats
+from shared.application.tool.image_similarity import ImageSimilarity, ImageFingerprint
+
+from shared.infrastructure.tool.image_cache.hamming_index import HammingIndex
+from shared.infrastructure.tool.image_cache.fingerprint_matrix import FingerprintMatrix
+from shared.infrastructure.tool.image_cache.image_cache_counters import ImageCacheCounters
 
 _T = TypeVar("_T")
 
 @dataclass(frozen=True, slots=True)
 class _SimilarityImageCacheEntry(Generic[_T]):
-    image: Image
+    fingerprint: ImageFingerprint
     value: _T
     expires_at: datetime | None
 
 
+class _SimilarityImageCacheSegment(Generic[_T]):
+    """
+    One LRU partition of the cache. Small segments keep their fingerprints in
+    a FingerprintMatrix, where a vectorized scan beats index probing; large
+    ones switch to a HammingIndex so lookups stay sub-linear. Either way a
+    single structure serves both single and batch lookups.
+    """
+
+    _matrix_max_capacity: int = 4096
+
+    __slots__ = (
+        "_thresholds",
+        "_counters",
+        "_entries",
+        "_lookup",
+        "_recency",
+        "_ticks",
+    )
+
+    def __init__(
+        self,
+        bits: tuple[int, ...],
+        thresholds: tuple[int, ...],
+        counters: ImageCacheCounters,
+        /,
+        capacity: int
+    ) -> None:
+        self._thresholds = thresholds
+        self._counters = counters
+        self._entries: OrderedDict[
+            ImageFingerprint,
+            _SimilarityImageCacheEntry[_T]
+        ] = OrderedDict()
+        self._lookup: (
+            FingerprintMatrix[ImageFingerprint]
+            | HammingIndex[ImageFingerprint]
+        )
+        if capacity <= self._matrix_max_capacity:
+            # One spare row for the entry inserted before the eviction.
+            self._lookup = FingerprintMatrix(bits, thresholds, capacity=capacity + 1)
+        else:
+            self._lookup = HammingIndex(bits, thresholds, capacity=capacity)
+        self._recency: dict[ImageFingerprint, int] = {}
+        self._ticks = count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[_SimilarityImageCacheEntry[_T]]:
+        return iter(self._entries.values())
+
+    @property
+    def counters(self) -> ImageCacheCounters:
+        return self._counters
+
+    def match(
+        self,
+        fingerprints: list[ImageFingerprint],
+        /
+    ) -> tuple[tuple[ImageFingerprint, ...], ...]:
+        return self._lookup.match(fingerprints)
+
+    def select(
+        self,
+        fingerprint: ImageFingerprint,
+        candidates: Iterable[ImageFingerprint],
+        now: datetime,
+        /
+    ) -> _T | None:
+        found: ImageFingerprint | None = None
+        for key in candidates:
+            entry = self._entries.get(key)
+            if entry is None:
+                continue
+
+            if entry.expires_at is not None and entry.expires_at <= now:
+                self.remove(key)
+                self._counters.expirations += 1
+                continue
+
+            self._counters.comparisons += 1
+            if not self._is_similar(fingerprint, entry.fingerprint):
+                continue
+
+            if found is None or self._recency[key] > self._recency[found]:
+                found = key
+
+        if found is None:
+            self._counters.misses += 1
+            return None
+
+        self._counters.hits += 1
+        self._touch(found)
+
+        return self._entries[found].value
+
+    def insert(self, entry: _SimilarityImageCacheEntry[_T], /) -> None:
+        key = entry.fingerprint
+        if key not in self._entries:
+            self._lookup.add(key, entry.fingerprint)
+
+        self._entries[key] = entry
+        self._touch(key)
+
+    def evict(self) -> None:
+        self.remove(next(iter(self._entries)))
+        self._counters.evictions += 1
+
+    def remove(self, key: ImageFingerprint, /) -> None:
+        entry = self._entries.pop(key)
+        del self._recency[key]
+        self._lookup.remove(key, entry.fingerprint)
+
+    def _touch(self, key: ImageFingerprint, /) -> None:
+        self._entries.move_to_end(key)
+        self._recency[key] = next(self._ticks)
+
+    def _is_similar(
+        self,
+        fingerprint1: ImageFingerprint,
+        fingerprint2: ImageFingerprint,
+        /
+    ) -> bool:
+        return any(
+            (h1 ^ h2).bit_count() <= threshold
+            for h1, h2, threshold in zip(
+                fingerprint1,
+                fingerprint2,
+                self._thresholds,
+                strict=True
+            )
+        )
+
+
 class SimilarityImageCache(Generic[_T], ImageCache[_T]):
+    """
+    In-memory image cache with one LRU segment per partition.
+
+    Counters live in their segment and move to a bounded LRU of idle
+    counters when the segment empties, so expirations and evictions stay
+    visible. Lookups on partitions without a segment are counted there too,
+    and client-supplied partition keys cannot grow the stats.
+    """
+
+    _max_idle_counters: int = 1024
+
     __slots__ = (
         "_max_size",
+        "_partition_max_size",
         "_tolerance",
         "_similarity",
+        "_bits",
+        "_thresholds",
         "_lock",
-        "_entries",
+        "_segments",
+        "_size",
+        "_idle_counters",
     )
 
     def __init__(
         self,
         *,
         max_size: int,
+        partition_max_size: int | None = None,
         tolerance: float,
         similarity: ImageSimilarity,
     ) -> None:
         if max_size <= 0:
             raise ValueError("max_size must be positive")
 
+        if partition_max_size is not None and partition_max_size <= 0:
+            raise ValueError("partition_max_size must be positive")
+
         self._max_size = max_size
+        self._partition_max_size = min(
+            partition_max_size
+            if partition_max_size is not None
+            else max_size,
+            max_size
+        )
         self._tolerance = tolerance
         self._similarity = similarity
+        self._bits = similarity.fingerprint_bits()
+        self._thresholds = similarity.fingerprint_thresholds(tolerance)
         self._lock = Lock()
-        self._entries: OrderedDict[
-            int,
-            _SimilarityImageCacheEntry[_T]
+        self._segments: OrderedDict[
+            str | None,
+            _SimilarityImageCacheSegment[_T]
         ] = OrderedDict()
+        self._size = 0
+        self._idle_counters: OrderedDict[str | None, ImageCacheCounters] = OrderedDict()
 
-    async def get(self, image: Image, /) -> _T | None:
+    async def get(
+        self,
+        image: Image,
+        /,
+        partition: str | None = None
+    ) -> _T | None:
+        started = time.perf_counter()
+        fingerprint = await self._similarity.fingerprint(image)
         now = self._now()
+
         async with self._lock:
-            keys = tuple(self._entries.keys())
+            counters = self._counters_for(partition)
+            segment = self._find_segment(partition)
 
-        for key in reversed(keys):
-            async with self._lock:
-                entry = self._entries.get(key)
-                if entry is None:
-                    continue
+            value: _T | None = None
+            if segment is not None:
+                value = self._select(
+                    partition,
+                    segment,
+                    fingerprint,
+                    segment.match([fingerprint])[0],
+                    now
+                )
+            else:
+                counters.misses += 1
+
+            counters.latency += time.perf_counter() - started
+
+            return value
+
+    async def get_many(
+        self,
+        images: tuple[Image, ...],
+        /,
+        partitions: tuple[str | None, ...] | None = None
+    ) -> tuple[_T | None, ...]:
+        started = time.perf_counter()
+        fingerprints = [
+            await self._similarity.fingerprint(image)
+            for image in images
+        ]
+        now = self._now()
+
+        grouped: dict[str | None, list[int]] = {}
+        for i, partition in enumerate(self._partitions(partitions, len(images))):
+            grouped.setdefault(partition, []).append(i)
 
-                if entry.expires_at is not None and entry.expires_at <= now:
-                    del self._entries[key]
+        results: list[_T | None] = [None] * len(images)
+
+        async with self._lock:
+            for partition, indexes in grouped.items():
+                segment = self._find_segment(partition)
+                if segment is None:
+                    self._counters_for(partition).misses += len(indexes)
                     continue
 
-            is_similar = await self._similarity.similar(
-                image,
-                entry.image,
-                tolerance=self._tolerance
-            )
-            if is_similar:
-                async with self._lock:
-                    current = self._entries.get(key)
-                    if current is None or not entry is current:
-                        continue
+                matches = segment.match([fingerprints[i] for i in indexes])
+                for i, keys in zip(indexes, matches, strict=True):
+                    results[i] = self._select(partition, segment, fingerprints[i], keys, now)
 
-                    self._entries.move_to_end(key)
-                    return entry.value
+            latency = (time.perf_counter() - started) / max(len(images), 1)
+            for partition, indexes in grouped.items():
+                self._counters_for(partition).latency += latency * len(indexes)
 
-        return None
+        return tuple(results)
 
     async def put(
         self,
         image: Image,
         value: _T,
         /,
-        ttl: timedelta | None = None
+        ttl: timedelta | None = None,
+        partition: str | None = None
     ) -> None:
-        key = self._get_key(image)
-        entry = _SimilarityImageCacheEntry(
-            image=image,
+        entry = await self._make_entry(image, value, ttl)
+
+        async with self._lock:
+            self._insert(partition, entry)
+
+    async def put_many(
+        self,
+        items: tuple[tuple[Image, _T], ...],
+        /,
+        ttl: timedelta | None = None,
+        partitions: tuple[str | None, ...] | None = None
+    ) -> None:
+        entries = [
+            await self._make_entry(image, value, ttl)
+            for image, value in items
+        ]
+
+        async with self._lock:
+            for partition, entry in zip(
+                self._partitions(partitions, len(items)),
+                entries,
+                strict=True
+            ):
+                self._insert(partition, entry)
+
+    async def dump(self) -> tuple[ImageCacheRecord[_T], ...]:
+        now = self._now()
+
+        async with self._lock:
+            return tuple(
+                ImageCacheRecord(
+                    fingerprint=entry.fingerprint,
+                    value=entry.value,
+                    partition=partition,
+                    expires_at=entry.expires_at
+                )
+                for partition, segment in self._segments.items()
+                for entry in segment
+                if entry.expires_at is None or entry.expires_at > now
+            )
+
+    async def load(self, records: tuple[ImageCacheRecord[_T], ...], /) -> None:
+        now = self._now()
+
+        async with self._lock:
+            for record in records:
+                if not self._is_compatible(record.fingerprint):
+                    continue
+
+                if record.expires_at is not None and record.expires_at <= now:
+                    continue
+
+                self._insert(
+                    record.partition,
+                    _SimilarityImageCacheEntry(
+                        fingerprint=record.fingerprint,
+                        value=record.value,
+                        expires_at=record.expires_at
+                    )
+                )
+
+    async def stats(self) -> tuple[ImageCacheStats, ...]:
+        async with self._lock:
+            return tuple(
+                segment.counters.make_stats(partition, len(segment))
+                for partition, segment in self._segments.items()
+            ) + tuple(
+                counters.make_stats(partition, 0)
+                for partition, counters in self._idle_counters.items()
+            )
+
+    async def _make_entry(
+        self,
+        image: Image,
+        value: _T,
+        ttl: timedelta | None,
+        /
+    ) -> _SimilarityImageCacheEntry[_T]:
+        fingerprint = await self._similarity.fingerprint(image)
+
+        return _SimilarityImageCacheEntry(
+            fingerprint=fingerprint,
             value=value,
             expires_at=(
                 self._now() + ttl
@@ -94,15 +380,120 @@ class SimilarityImageCache(Generic[_T], ImageCache[_T]):
             )
         )
 
-        async with self._lock:
-            self._entries[key] = entry
-            self._entries.move_to_end(key)
+    def _select(
+        self,
+        partition: str | None,
+        segment: _SimilarityImageCacheSegment[_T],
+        fingerprint: ImageFingerprint,
+        candidates: Iterable[ImageFingerprint],
+        now: datetime,
+        /
+    ) -> _T | None:
+        size = len(segment)
+        value = segment.select(fingerprint, candidates, now)
+        self._size -= size - len(segment)
+        if not segment:
+            self._drop_segment(partition)
+
+        return value
+
+    def _insert(
+        self,
+        partition: str | None,
+        entry: _SimilarityImageCacheEntry[_T],
+        /
+    ) -> None:
+        segment = self._ensure_segment(partition)
+        size = len(segment)
+        segment.insert(entry)
+        if len(segment) > self._partition_max_size:
+            segment.evict()
+        self._size += len(segment) - size
+
+        while self._size > self._max_size:
+            oldest_partition, oldest = next(iter(self._segments.items()))
+            oldest.evict()
+            self._size -= 1
+            if not oldest:
+                self._drop_segment(oldest_partition)
+
+    def _is_compatible(self, fingerprint: ImageFingerprint, /) -> bool:
+        return len(fingerprint) == len(self._bits) and all(
+            0 <= component < 1 << bits
+            for component, bits in zip(fingerprint, self._bits)
+        )
+
+    def _find_segment(
+        self,
+        partition: str | None,
+        /
+    ) -> _SimilarityImageCacheSegment[_T] | None:
+        segment = self._segments.get(partition)
+        if segment is not None:
+            self._segments.move_to_end(partition)
+
+        return segment
+
+    def _ensure_segment(
+        self,
+        partition: str | None,
+        /
+    ) -> _SimilarityImageCacheSegment[_T]:
+        segment = self._find_segment(partition)
+        if segment is None:
+            segment = _SimilarityImageCacheSegment(
+                self._bits,
+                self._thresholds,
+                self._idle_counters.pop(partition, ImageCacheCounters()),
+                capacity=self._partition_max_size
+            )
+            self._segments[partition] = segment
+
+        return segment
+
+    def _drop_segment(self, partition: str | None, /) -> None:
+        segment = self._segments.pop(partition)
+        self._keep_idle_counters(partition, segment.counters)
+
+    def _counters_for(self, partition: str | None, /) -> ImageCacheCounters:
+        segment = self._segments.get(partition)
+        if segment is not None:
+            return segment.counters
+
+        counters = self._idle_counters.get(partition)
+        if counters is not None:
+            self._idle_counters.move_to_end(partition)
+            return counters
+
+        counters = ImageCacheCounters()
+        self._keep_idle_counters(partition, counters)
+
+        return counters
+
+    def _keep_idle_counters(
+        self,
+        partition: str | None,
+        counters: ImageCacheCounters,
+        /
+    ) -> None:
+        self._idle_counters[partition] = counters
+        self._idle_counters.move_to_end(partition)
+        if len(self._idle_counters) > self._max_idle_counters:
+            self._idle_counters.popitem(last=False)
+
+    def _partitions(
+        self,
+        partitions: tuple[str | None, ...] | None,
+        size: int,
+        /
+    ) -> tuple[str | None, ...]:
+        if partitions is None:
+            return (None,) * size
 
-            if len(self._entries) > self._max_size:
-                self._entries.popitem(last=False)
+        if len(partitions) != size:
+            raise ValueError("partitions must match the number of images")
 
-    def _get_key(self, image: Image, /) -> int:
-        return id(image)
+        return partitions
 
     def _now(self) -> datetime:
         return datetime.now(UTC)
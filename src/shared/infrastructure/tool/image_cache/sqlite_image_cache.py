@@ -0,0 +1,653 @@
+import time
+import sqlite3
+import logging
+import threading
+from dataclasses import dataclass
+from contextlib import contextmanager
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from typing import Generic, TypeVar
+from datetime import timedelta, datetime, UTC
+from pathlib import Path
+
+from pydantic import TypeAdapter, ValidationError
+
+from shared.domain.aggregate.image import Image
+from shared.application.tool.image_cache import ImageCache, ImageCacheRecord, ImageCacheStats
+from shared.application.tool.image_similarity import ImageSimilarity, ImageFingerprint
+from shared.application.tool.worker_pool import WorkerPool
+
+from shared.infrastructure.tool.image_cache.fingerprint_matrix import FingerprintMatrix
+from shared.infrastructure.tool.image_cache.image_cache_counters import ImageCacheCounters
+
+_T = TypeVar("_T")
+
+_Row = tuple[str, bytes, bytes, float | None]
+
+_logger = logging.getLogger(__name__)
+
+class _SqliteDatabase:
+    """
+    Lazily opened SQLite connection in WAL mode, shared by the worker threads
+    of one process under a lock.
+
+    The schema is versioned through PRAGMA user_version; a file written by an
+    older version is cleared on open instead of being read.
+    """
+
+    _busy_timeout: timedelta = timedelta(seconds=5)
+    _schema_version: int = 3
+    _pragmas: tuple[str, ...] = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+    )
+    _schema: tuple[str, ...] = (
+        "DROP TABLE IF EXISTS image_cache",
+        "DROP TABLE IF EXISTS image_cache_partition",
+        """
+        CREATE TABLE image_cache (
+            cache TEXT NOT NULL,
+            partition TEXT NOT NULL,
+            fingerprint BLOB NOT NULL,
+            value BLOB NOT NULL,
+            expires_at REAL,
+            used_at INTEGER NOT NULL,
+            PRIMARY KEY (cache, partition, fingerprint)
+        )
+        """,
+        "CREATE INDEX image_cache_used_at ON image_cache (cache, used_at)",
+        "CREATE INDEX image_cache_expires_at ON image_cache (cache, expires_at)",
+        """
+        CREATE TABLE image_cache_partition (
+            cache TEXT NOT NULL,
+            partition TEXT NOT NULL,
+            version INTEGER NOT NULL,
+            PRIMARY KEY (cache, partition)
+        )
+        """,
+    )
+
+    __slots__ = (
+        "_path",
+        "_lock",
+        "_connection",
+    )
+
+    def __init__(self, path: Path, /) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            connection = self._open()
+            with connection:
+                yield connection
+
+    def _open(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+
+            connection = sqlite3.connect(
+                self._path,
+                timeout=self._busy_timeout.total_seconds(),
+                isolation_level=None,
+                check_same_thread=False
+            )
+            for statement in self._pragmas:
+                connection.execute(statement)
+
+            # Checked inside a write transaction so only one process migrates.
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                if connection.execute("PRAGMA user_version").fetchone()[0] != self._schema_version:
+                    for statement in self._schema:
+                        connection.execute(statement)
+                    connection.execute(f"PRAGMA user_version = {self._schema_version}")
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+            connection.isolation_level = "DEFERRED"
+            self._connection = connection
+
+        return self._connection
+
+
+@dataclass(slots=True)
+class _SqlitePartition:
+    version: int
+    matrix: FingerprintMatrix[int]
+    fingerprints: dict[int, bytes]
+    used_at: dict[int, int]
+    expires_at: dict[int, float | None]
+
+
+class _SqliteFingerprints:
+    """
+    Encodes fingerprints for storage and mirrors every looked up partition in
+    a FingerprintMatrix, so a lookup is one vectorized match instead of
+    reading and decoding the whole partition.
+
+    Every write bumps the version of the partitions it changed. A mirror is
+    dropped when this process writes its partition, or when PRAGMA
+    data_version shows a commit from another connection and the stored
+    version of the partition moved on, so other partitions stay warm.
+    """
+
+    __slots__ = (
+        "_bits",
+        "_thresholds",
+        "_data_version",
+        "_partitions",
+    )
+
+    def __init__(self, bits: tuple[int, ...], thresholds: tuple[int, ...], /) -> None:
+        self._bits = bits
+        self._thresholds = thresholds
+        self._data_version: int | None = None
+        self._partitions: dict[str, _SqlitePartition] = {}
+
+    def sync(self, connection: sqlite3.Connection, cache: str, /) -> None:
+        data_version: int = connection.execute("PRAGMA data_version").fetchone()[0]
+        if data_version == self._data_version:
+            return
+
+        self._data_version = data_version
+        if not self._partitions:
+            return
+
+        versions: dict[str, int] = dict(connection.execute(
+            "SELECT partition, version FROM image_cache_partition WHERE cache = ?",
+            (cache,)
+        ).fetchall())
+        for partition in [
+            partition
+            for partition, mirrored in self._partitions.items()
+            if versions.get(partition, 0) != mirrored.version
+        ]:
+            del self._partitions[partition]
+
+    def invalidate(self, partitions: Iterable[str], /) -> None:
+        for partition in partitions:
+            self._partitions.pop(partition, None)
+
+    def partition(
+        self,
+        connection: sqlite3.Connection,
+        cache: str,
+        partition: str,
+        /
+    ) -> _SqlitePartition:
+        mirrored = self._partitions.get(partition)
+        if mirrored is not None:
+            return mirrored
+
+        version = connection.execute(
+            "SELECT version FROM image_cache_partition WHERE cache = ? AND partition = ?",
+            (cache, partition)
+        ).fetchone()
+        rows = connection.execute(
+            "SELECT rowid, fingerprint, used_at, expires_at FROM image_cache"
+            " WHERE cache = ? AND partition = ?",
+            (cache, partition)
+        ).fetchall()
+
+        matrix: FingerprintMatrix[int] = FingerprintMatrix(
+            self._bits,
+            self._thresholds,
+            capacity=max(len(rows), 1)
+        )
+        for rowid, fingerprint, _, _ in rows:
+            matrix.add(rowid, self.decode(fingerprint))
+
+        mirrored = _SqlitePartition(
+            version=version[0] if version is not None else 0,
+            matrix=matrix,
+            fingerprints={rowid: fingerprint for rowid, fingerprint, _, _ in rows},
+            used_at={rowid: used_at for rowid, _, used_at, _ in rows},
+            expires_at={rowid: expires_at for rowid, _, _, expires_at in rows}
+        )
+        # Empty partitions are not kept, so unknown keys cannot grow the mirror.
+        if rows:
+            self._partitions[partition] = mirrored
+
+        return mirrored
+
+    def encode(self, fingerprint: ImageFingerprint, /) -> bytes:
+        return b"".join(
+            component.to_bytes(-(-bits // 8), "little")
+            for component, bits in zip(fingerprint, self._bits, strict=True)
+        )
+
+    def decode(self, data: bytes, /) -> ImageFingerprint:
+        fingerprint: list[int] = []
+        start = 0
+        for bits in self._bits:
+            end = start - (-bits // 8)
+            fingerprint.append(int.from_bytes(data[start:end], "little"))
+            start = end
+
+        return tuple(fingerprint)
+
+    def is_compatible(self, fingerprint: ImageFingerprint, /) -> bool:
+        return len(fingerprint) == len(self._bits) and all(
+            0 <= component < 1 << bits
+            for component, bits in zip(fingerprint, self._bits)
+        )
+
+
+class SqliteImageCache(Generic[_T], ImageCache[_T]):
+    """
+    Image cache stored in a local SQLite database in WAL mode.
+
+    Every worker process on the host opening the same file shares the entries,
+    so a lookup hits whatever any worker has already identified. Several caches
+    can live in one file, they are told apart by name.
+
+    Lookups only read: recency updates are buffered and expired rows purged
+    on the next write. Values are stored as JSON of the declared value type.
+    """
+
+    _max_counters: int = 1024
+
+    __slots__ = (
+        "_name",
+        "_max_size",
+        "_partition_max_size",
+        "_similarity",
+        "_worker_pool",
+        "_values",
+        "_database",
+        "_fingerprints",
+        "_touched",
+        "_counters",
+    )
+
+    def __init__(
+        self,
+        *,
+        path: Path,
+        name: str,
+        value_type: type[_T],
+        max_size: int,
+        partition_max_size: int | None = None,
+        tolerance: float,
+        similarity: ImageSimilarity,
+        worker_pool: WorkerPool,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+
+        if partition_max_size is not None and partition_max_size <= 0:
+            raise ValueError("partition_max_size must be positive")
+
+        self._name = name
+        self._max_size = max_size
+        self._partition_max_size = min(
+            partition_max_size
+            if partition_max_size is not None
+            else max_size,
+            max_size
+        )
+        self._similarity = similarity
+        self._worker_pool = worker_pool
+        self._values: TypeAdapter[_T] = TypeAdapter(value_type)
+        self._database = _SqliteDatabase(path)
+        self._fingerprints = _SqliteFingerprints(
+            similarity.fingerprint_bits(),
+            similarity.fingerprint_thresholds(tolerance)
+        )
+        self._touched: dict[tuple[str, bytes], int] = {}
+        self._counters: OrderedDict[str | None, ImageCacheCounters] = OrderedDict()
+
+    async def get(
+        self,
+        image: Image,
+        /,
+        partition: str | None = None
+    ) -> _T | None:
+        return (await self.get_many((image,), partitions=(partition,)))[0]
+
+    async def get_many(
+        self,
+        images: tuple[Image, ...],
+        /,
+        partitions: tuple[str | None, ...] | None = None
+    ) -> tuple[_T | None, ...]:
+        started = time.perf_counter()
+        fingerprints = [
+            await self._similarity.fingerprint(image)
+            for image in images
+        ]
+        partitions = self._partitions(partitions, len(images))
+
+        found = await self._worker_pool.run(
+            self._do_get_many,
+            fingerprints,
+            partitions,
+            self._now()
+        )
+
+        latency = (time.perf_counter() - started) / max(len(images), 1)
+        results: list[_T | None] = []
+        for partition, (value, comparisons) in zip(partitions, found, strict=True):
+            counters = self._counters_for(partition)
+            counters.comparisons += comparisons
+            counters.latency += latency
+            if value is None:
+                counters.misses += 1
+            else:
+                counters.hits += 1
+
+            results.append(value)
+
+        return tuple(results)
+
+    async def put(
+        self,
+        image: Image,
+        value: _T,
+        /,
+        ttl: timedelta | None = None,
+        partition: str | None = None
+    ) -> None:
+        await self.put_many(((image, value),), ttl=ttl, partitions=(partition,))
+
+    async def put_many(
+        self,
+        items: tuple[tuple[Image, _T], ...],
+        /,
+        ttl: timedelta | None = None,
+        partitions: tuple[str | None, ...] | None = None
+    ) -> None:
+        fingerprints = [
+            await self._similarity.fingerprint(image)
+            for image, _ in items
+        ]
+        now = self._now()
+
+        await self._put_records(tuple(
+            ImageCacheRecord(
+                fingerprint=fingerprint,
+                value=value,
+                partition=partition,
+                expires_at=now + ttl if ttl is not None else None
+            )
+            for (_, value), fingerprint, partition in zip(
+                items,
+                fingerprints,
+                self._partitions(partitions, len(items)),
+                strict=True
+            )
+        ))
+
+    async def dump(self) -> tuple[ImageCacheRecord[_T], ...]:
+        return await self._worker_pool.run(self._do_dump, self._now())
+
+    async def load(self, records: tuple[ImageCacheRecord[_T], ...], /) -> None:
+        now = self._now()
+
+        await self._put_records(tuple(
+            record for record in records
+            if self._fingerprints.is_compatible(record.fingerprint)
+            and (record.expires_at is None or record.expires_at > now)
+        ))
+
+    async def stats(self) -> tuple[ImageCacheStats, ...]:
+        sizes = await self._worker_pool.run(self._do_sizes)
+
+        return tuple(
+            self._counters_for(partition).make_stats(partition, sizes.get(partition, 0))
+            for partition in dict.fromkeys((*self._counters, *sizes))
+        )
+
+    async def _put_records(self, records: tuple[ImageCacheRecord[_T], ...], /) -> None:
+        if not records:
+            return
+
+        evicted, expired = await self._worker_pool.run(
+            self._do_put_many,
+            records,
+            self._now()
+        )
+        for partition, evictions in evicted.items():
+            self._counters_for(partition).evictions += evictions
+        for partition, expirations in expired.items():
+            self._counters_for(partition).expirations += expirations
+
+    def _do_get_many(
+        self,
+        fingerprints: list[ImageFingerprint],
+        partitions: tuple[str | None, ...],
+        now: datetime,
+        /
+    ) -> list[tuple[_T | None, int]]:
+        grouped: dict[str, list[int]] = {}
+        for i, partition in enumerate(partitions):
+            grouped.setdefault(self._encode_partition(partition), []).append(i)
+
+        results: list[tuple[_T | None, int]] = [(None, 0)] * len(fingerprints)
+
+        with self._database.transaction() as connection:
+            self._fingerprints.sync(connection, self._name)
+
+            for partition, indexes in grouped.items():
+                mirrored = self._fingerprints.partition(connection, self._name, partition)
+                matches = mirrored.matrix.match([fingerprints[i] for i in indexes])
+
+                for i, rowids in zip(indexes, matches, strict=True):
+                    found_rowid: int | None = None
+                    found_used_at = -1
+                    comparisons = 0
+                    for rowid in rowids:
+                        expires_at = mirrored.expires_at[rowid]
+                        if expires_at is not None and expires_at <= now.timestamp():
+                            continue
+
+                        comparisons += 1
+                        if mirrored.used_at[rowid] > found_used_at:
+                            found_rowid = rowid
+                            found_used_at = mirrored.used_at[rowid]
+
+                    value: _T | None = None
+                    if found_rowid is not None:
+                        value = self._read_value(connection, partition, mirrored, found_rowid)
+
+                    results[i] = (value, comparisons)
+
+        return results
+
+    def _read_value(
+        self,
+        connection: sqlite3.Connection,
+        partition: str,
+        mirrored: _SqlitePartition,
+        rowid: int,
+        /
+    ) -> _T | None:
+        row = connection.execute(
+            "SELECT value FROM image_cache WHERE rowid = ? AND fingerprint = ?",
+            (rowid, mirrored.fingerprints[rowid])
+        ).fetchone()
+        if row is None:
+            return None
+
+        try:
+            value = self._values.validate_json(row[0])
+        except ValidationError:
+            _logger.warning("Skipping unreadable image cache entry %s", rowid, exc_info=True)
+            return None
+
+        used_at = mirrored.used_at[rowid] = time.time_ns()
+        self._touched[(partition, mirrored.fingerprints[rowid])] = used_at
+
+        return value
+
+    def _do_put_many(
+        self,
+        records: tuple[ImageCacheRecord[_T], ...],
+        now: datetime,
+        /
+    ) -> tuple[dict[str | None, int], dict[str | None, int]]:
+        evicted: dict[str | None, int] = {}
+        expired: dict[str | None, int] = {}
+
+        with self._database.transaction() as connection:
+            self._flush_touched(connection)
+
+            for (expired_partition,) in connection.execute(
+                "DELETE FROM image_cache"
+                " WHERE cache = ? AND expires_at <= ?"
+                " RETURNING partition",
+                (self._name, now.timestamp())
+            ).fetchall():
+                key = self._decode_partition(expired_partition)
+                expired[key] = expired.get(key, 0) + 1
+
+            connection.executemany(
+                "INSERT INTO image_cache"
+                " (cache, partition, fingerprint, value, expires_at, used_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (cache, partition, fingerprint) DO UPDATE SET"
+                " value = excluded.value,"
+                " expires_at = excluded.expires_at,"
+                " used_at = excluded.used_at",
+                [
+                    (
+                        self._name,
+                        self._encode_partition(record.partition),
+                        self._fingerprints.encode(record.fingerprint),
+                        self._values.dump_json(record.value),
+                        (
+                            record.expires_at.timestamp()
+                            if record.expires_at is not None
+                            else None
+                        ),
+                        time.time_ns()
+                    )
+                    for record in records
+                ]
+            )
+
+            for partition in dict.fromkeys(record.partition for record in records):
+                for (evicted_partition,) in connection.execute(
+                    "DELETE FROM image_cache WHERE rowid IN ("
+                    " SELECT rowid FROM image_cache WHERE cache = ? AND partition = ?"
+                    " ORDER BY used_at DESC LIMIT -1 OFFSET ?"
+                    ") RETURNING partition",
+                    (self._name, self._encode_partition(partition), self._partition_max_size)
+                ).fetchall():
+                    key = self._decode_partition(evicted_partition)
+                    evicted[key] = evicted.get(key, 0) + 1
+
+            for (evicted_partition,) in connection.execute(
+                "DELETE FROM image_cache WHERE rowid IN ("
+                " SELECT rowid FROM image_cache WHERE cache = ?"
+                " ORDER BY used_at DESC LIMIT -1 OFFSET ?"
+                ") RETURNING partition",
+                (self._name, self._max_size)
+            ).fetchall():
+                key = self._decode_partition(evicted_partition)
+                evicted[key] = evicted.get(key, 0) + 1
+
+            changed = list(dict.fromkeys((
+                *(self._encode_partition(record.partition) for record in records),
+                *(self._encode_partition(partition) for partition in (*evicted, *expired)),
+            )))
+            connection.executemany(
+                "INSERT INTO image_cache_partition (cache, partition, version)"
+                " VALUES (?, ?, 1)"
+                " ON CONFLICT (cache, partition) DO UPDATE SET version = version + 1",
+                [(self._name, partition) for partition in changed]
+            )
+            self._fingerprints.invalidate(changed)
+
+        return evicted, expired
+
+    def _do_dump(self, now: datetime, /) -> tuple[ImageCacheRecord[_T], ...]:
+        rows: list[_Row]
+        with self._database.transaction() as connection:
+            self._flush_touched(connection)
+            rows = connection.execute(
+                "SELECT partition, fingerprint, value, expires_at FROM image_cache"
+                " WHERE cache = ? AND (expires_at IS NULL OR expires_at > ?)"
+                " ORDER BY used_at",
+                (self._name, now.timestamp())
+            ).fetchall()
+
+        return tuple(
+            ImageCacheRecord(
+                fingerprint=self._fingerprints.decode(fingerprint),
+                value=self._values.validate_json(value),
+                partition=self._decode_partition(partition),
+                expires_at=(
+                    datetime.fromtimestamp(expires_at, UTC)
+                    if expires_at is not None
+                    else None
+                )
+            )
+            for partition, fingerprint, value, expires_at in rows
+        )
+
+    def _do_sizes(self) -> dict[str | None, int]:
+        with self._database.transaction() as connection:
+            return {
+                self._decode_partition(partition): size
+                for partition, size in connection.execute(
+                    "SELECT partition, COUNT(*) FROM image_cache"
+                    " WHERE cache = ? GROUP BY partition",
+                    (self._name,)
+                )
+            }
+
+    def _flush_touched(self, connection: sqlite3.Connection, /) -> None:
+        if not self._touched:
+            return
+
+        connection.executemany(
+            "UPDATE image_cache SET used_at = MAX(used_at, ?)"
+            " WHERE cache = ? AND partition = ? AND fingerprint = ?",
+            [
+                (used_at, self._name, partition, fingerprint)
+                for (partition, fingerprint), used_at in self._touched.items()
+            ]
+        )
+        self._touched.clear()
+
+    def _encode_partition(self, partition: str | None, /) -> str:
+        return partition if partition is not None else ""
+
+    def _decode_partition(self, partition: str, /) -> str | None:
+        return partition if partition else None
+
+    def _counters_for(self, partition: str | None, /) -> ImageCacheCounters:
+        counters = self._counters.get(partition)
+        if counters is not None:
+            self._counters.move_to_end(partition)
+            return counters
+
+        counters = self._counters[partition] = ImageCacheCounters()
+        if len(self._counters) > self._max_counters:
+            self._counters.popitem(last=False)
+
+        return counters
+
+    def _partitions(
+        self,
+        partitions: tuple[str | None, ...] | None,
+        size: int,
+        /
+    ) -> tuple[str | None, ...]:
+        if partitions is None:
+            return (None,) * size
+
+        if len(partitions) != size:
+            raise ValueError("partitions must match the number of images")
+
+        return partitions
+
+    def _now(self) -> datetime:
+        return datetime.now(UTC)
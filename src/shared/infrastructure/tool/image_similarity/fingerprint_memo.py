@@ -0,0 +1,26 @@
+from collections.abc import Callable, Hashable
+
+from shared.domain.aggregate.image import Image
+from shared.application.tool.image_similarity import ImageFingerprint
+
+from shared.infrastructure.dto.vo.data import Cv2ImageBinary
+
+def memoized_fingerprint(image: Image, key: Hashable, /) -> ImageFingerprint | None:
+    if isinstance(image.data, Cv2ImageBinary):
+        fingerprint: ImageFingerprint | None = image.data.memoized(key)
+
+        return fingerprint
+
+    return None
+
+
+def memoize_fingerprint(
+    image: Image,
+    key: Hashable,
+    factory: Callable[[], ImageFingerprint],
+    /
+) -> ImageFingerprint:
+    if isinstance(image.data, Cv2ImageBinary):
+        return image.data.memoize(key, factory)
+
+    return factory()
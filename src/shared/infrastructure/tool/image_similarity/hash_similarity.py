@@ -1,14 +1,21 @@
 from abc import ABC, abstractmethod
+from collections.abc import Hashable
 from cv2.typing import MatLike
 
 from shared.domain.aggregate.image import Image
 
 from shared.application.tool.worker_pool import WorkerPool
-from shared.application.tool.image_similarity import ImageSimilarity
+from shared.application.tool.image_similarity import ImageSimilarity, ImageFingerprint
 
 from shared.infrastructure.dto.vo.data import Cv2ImageBinary
+from shared.infrastructure.tool.image_similarity.fingerprint_memo import (
+    memoized_fingerprint,
+    memoize_fingerprint
+)
 
 class HashSimilarity(ImageSimilarity, ABC):
+    _hash_bits: int
+
     def __init__(self, worker_pool: WorkerPool, /) -> None:
         self._worker_pool = worker_pool
 
@@ -26,6 +33,38 @@ class HashSimilarity(ImageSimilarity, ABC):
             tolerance=tolerance
         )
 
+    async def fingerprint(self, image: Image, /) -> ImageFingerprint:
+        fingerprint = memoized_fingerprint(image, self._memo_key())
+        if fingerprint is not None:
+            return fingerprint
+
+        return await self._worker_pool.run(
+            self.compute_fingerprint,
+            image
+        )
+
+    def compute_fingerprint(self, image: Image, /) -> ImageFingerprint:
+        return memoize_fingerprint(
+            image,
+            self._memo_key(),
+            lambda: (self._get_image_hash(image),)
+        )
+
+    def fingerprint_bits(self) -> tuple[int, ...]:
+        return (self._hash_bits,)
+
+    def fingerprint_thresholds(self, tolerance: float, /) -> tuple[int, ...]:
+        threshold = self._distance_threshold(tolerance)
+        max_bits = max(
+            (
+                bits for bits in range(self._hash_bits + 1)
+                if bits / self._hash_bits <= threshold
+            ),
+            default=-1
+        )
+
+        return (max_bits,)
+
     def _do_similar(
         self,
         image1: Image,
@@ -33,25 +72,31 @@ class HashSimilarity(ImageSimilarity, ABC):
         /,
         tolerance: float
     ) -> bool:
-        h1 = self._get_image_hash(image1)
-        h2 = self._get_image_hash(image2)
+        h1, = self.compute_fingerprint(image1)
+        h2, = self.compute_fingerprint(image2)
 
         distance = self._hamming_distance(h1, h2)
         threshold = self._distance_threshold(tolerance)
 
         return distance <= threshold
 
-    def _extract_frame(self, image: Image, /) -> MatLike:
+    def _hamming_distance(self, h1: int, h2: int, /) -> float:
+        return (h1 ^ h2).bit_count() / self._hash_bits
+
+    def _memo_key(self) -> Hashable:
+        return ("fingerprint", type(self))
+
+    def _get_image_hash(self, image: Image, /) -> int:
+        return self._get_gray_hash(self._extract_gray(image))
+
+    def _extract_gray(self, image: Image, /) -> MatLike:
         if isinstance(image.data, Cv2ImageBinary):
-            return image.data.frame()
+            return image.data.gray()
 
         raise TypeError("Unsupported image data type for frame extraction.")
 
     @abstractmethod
-    def _get_image_hash(self, image: Image, /) -> int: ...
-
-    @abstractmethod
-    def _hamming_distance(self, h1: int, h2: int, /) -> float: ...
+    def _get_gray_hash(self, gray: MatLike, /) -> int: ...
 
     @abstractmethod
     def _distance_threshold(self, tolerance: float) -> float: ...
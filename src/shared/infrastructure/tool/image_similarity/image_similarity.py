@@ -1,12 +1,39 @@
+from collections.abc import Hashable
+
 from shared.domain.aggregate.image import Image
-from shared.application.tool.image_similarity import ImageSimilarity
+from shared.application.tool.worker_pool import WorkerPool
+from shared.application.tool.image_similarity import ImageSimilarity, ImageFingerprint
+
+from shared.infrastructure.tool.image_similarity.hash_similarity import HashSimilarity
+from shared.infrastructure.tool.image_similarity.fingerprint_memo import (
+    memoized_fingerprint,
+    memoize_fingerprint
+)
 
 class ImageSimilarityEvaluator(ImageSimilarity):
-    def __init__(self, strategies: tuple[ImageSimilarity, ...]) -> None:
+    def __init__(
+        self,
+        strategies: tuple[ImageSimilarity, ...],
+        worker_pool: WorkerPool | None = None
+    ) -> None:
         if not strategies:
             raise ValueError("Requires at least one strategy")
 
         self._strategies = strategies
+        self._worker_pool = worker_pool
+        self._hash_strategies: tuple[HashSimilarity, ...] | None = (
+            tuple(
+                strategy for strategy in strategies
+                if isinstance(strategy, HashSimilarity)
+            )
+            if worker_pool is not None
+            and all(isinstance(strategy, HashSimilarity) for strategy in strategies)
+            else None
+        )
+        self._memo_key: Hashable = (
+            "fingerprint",
+            tuple(type(strategy) for strategy in strategies)
+        )
 
     async def similar(
         self,
@@ -15,8 +42,67 @@ class ImageSimilarityEvaluator(ImageSimilarity):
         /,
         tolerance: float
     ) -> bool:
+        if self._hash_strategies is not None:
+            return any(
+                (h1 ^ h2).bit_count() <= threshold
+                for h1, h2, threshold in zip(
+                    await self.fingerprint(image1),
+                    await self.fingerprint(image2),
+                    self.fingerprint_thresholds(tolerance),
+                    strict=True
+                )
+            )
+
         for strategy in self._strategies:
             if await strategy.similar(image1, image2, tolerance=tolerance):
                 return True
 
         return False
+
+    async def fingerprint(self, image: Image, /) -> ImageFingerprint:
+        if self._hash_strategies is not None and self._worker_pool is not None:
+            fingerprint = memoized_fingerprint(image, self._memo_key)
+            if fingerprint is not None:
+                return fingerprint
+
+            return await self._worker_pool.run(
+                self._do_fingerprint,
+                image,
+                self._hash_strategies
+            )
+
+        components: list[int] = []
+        for strategy in self._strategies:
+            components.extend(await strategy.fingerprint(image))
+
+        return tuple(components)
+
+    def fingerprint_bits(self) -> tuple[int, ...]:
+        return tuple(
+            bits
+            for strategy in self._strategies
+            for bits in strategy.fingerprint_bits()
+        )
+
+    def fingerprint_thresholds(self, tolerance: float, /) -> tuple[int, ...]:
+        return tuple(
+            threshold
+            for strategy in self._strategies
+            for threshold in strategy.fingerprint_thresholds(tolerance)
+        )
+
+    def _do_fingerprint(
+        self,
+        image: Image,
+        strategies: tuple[HashSimilarity, ...],
+        /
+    ) -> ImageFingerprint:
+        return memoize_fingerprint(
+            image,
+            self._memo_key,
+            lambda: tuple(
+                component
+                for strategy in strategies
+                for component in strategy.compute_fingerprint(image)
+            )
+        )
@@ -0,0 +1,144 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Generic, TypeVar
+from collections.abc import Callable
+
+import cv2
+import numpy as np
+from cv2.typing import MatLike
+
+_M = TypeVar("_M")
+_R = TypeVar("_R")
+
+_logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True, slots=True)
+class SharedFrame:
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+@dataclass(slots=True)
+class _Worker:
+    model: Any = None
+
+
+# Holds the model built by the initializer of the current worker process.
+_worker = _Worker()
+
+
+class ProcessModelPool(Generic[_M]):
+    """
+    Runs a model in dedicated worker processes.
+
+    Each process builds its own model once with the given factory. Frames are
+    handed over through shared memory instead of being pickled, so only the
+    small call arguments and results cross the process boundary. The factory
+    and the functions passed to run() must be picklable module-level callables.
+
+    A worker that dies breaks the whole executor: the calls in flight fail
+    and the pool is rebuilt, so the following calls get fresh workers.
+    """
+
+    def __init__(self, factory: Callable[[], _M], /, processes: int) -> None:
+        if processes <= 0:
+            raise ValueError("processes must be positive")
+
+        self._factory = factory
+        self._processes = processes
+        self._executor = self._make_executor()
+
+    async def run(
+        self,
+        func: Callable[..., _R],
+        frame: MatLike,
+        /,
+        *args: Any
+    ) -> _R:
+        data = np.ascontiguousarray(frame)
+        memory = SharedMemory(create=True, size=max(data.nbytes, 1))
+        executor = self._executor
+        future: Future[_R] | None = None
+        try:
+            np.ndarray(data.shape, dtype=data.dtype, buffer=memory.buf)[...] = data
+
+            future = executor.submit(
+                _call,
+                func,
+                SharedFrame(
+                    name=memory.name,
+                    shape=data.shape,
+                    dtype=data.dtype.str
+                ),
+                args
+            )
+
+            return await asyncio.wrap_future(future)
+        except BrokenProcessPool:
+            self._restart(executor)
+            raise
+        finally:
+            if future is None or future.done():
+                _release(memory)
+            else:
+                # A cancelled caller leaves the call running in the worker,
+                # which may still have to attach to the frame.
+                future.add_done_callback(lambda _: _release(memory))
+
+    async def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def _restart(self, executor: ProcessPoolExecutor, /) -> None:
+        # Every call in flight on a broken executor fails, only the first
+        # one to notice replaces it.
+        if self._executor is not executor:
+            return
+
+        _logger.error("A model worker process died, restarting the process pool")
+        self._executor = self._make_executor()
+        executor.shutdown(wait=False)
+
+    def _make_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self._processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize,
+            initargs=(self._factory,)
+        )
+
+
+def _release(memory: SharedMemory, /) -> None:
+    memory.close()
+    memory.unlink()
+
+
+def _initialize(factory: Callable[[], Any], /) -> None:
+    # Frames are only touched by the model here, which gets its own share
+    # of the cores from the factory.
+    cv2.setNumThreads(1)
+    _worker.model = factory()
+
+
+def _call(
+    func: Callable[..., _R],
+    shared_frame: SharedFrame,
+    args: tuple[Any, ...],
+    /
+) -> _R:
+    memory = SharedMemory(name=shared_frame.name)
+    try:
+        frame = np.ndarray(
+            shared_frame.shape,
+            dtype=np.dtype(shared_frame.dtype),
+            buffer=memory.buf
+        ).copy()
+    finally:
+        memory.close()
+
+    return func(_worker.model, frame, *args)
@@ -0,0 +1,14 @@
+from shared.application.tool.readiness import Readiness, ReadinessState
+
+class DefaultReadiness(Readiness):
+    def __init__(self) -> None:
+        self._state = ReadinessState.WARMING_UP
+
+    def state(self) -> ReadinessState:
+        return self._state
+
+    def mark_ready(self) -> None:
+        self._state = ReadinessState.READY
+
+    def mark_failed(self) -> None:
+        self._state = ReadinessState.FAILED
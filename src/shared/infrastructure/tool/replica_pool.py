@@ -0,0 +1,51 @@
+import asyncio
+
+from contextlib import asynccontextmanager, contextmanager
+from typing import Generic, TypeVar
+from collections.abc import AsyncIterator, Iterator, Sequence
+
+_T = TypeVar("_T")
+
+class ReplicaPool(Generic[_T]):
+    """
+    Hands out interchangeable replicas, one caller at a time per replica.
+
+    Idle replicas are kept in LIFO order, so under light load the most
+    recently used replica, whose weights are still warm in the CPU caches,
+    is picked again. acquire_nowait() is for synchronous callers that own
+    the pool exclusively, such as a process pool worker, and fails instead
+    of waiting when every replica is busy.
+    """
+
+    def __init__(self, replicas: Sequence[_T], /) -> None:
+        if not replicas:
+            raise ValueError("replicas must not be empty")
+
+        self._replicas = tuple(replicas)
+        self._idle: asyncio.LifoQueue[_T] = asyncio.LifoQueue()
+        for replica in reversed(self._replicas):
+            self._idle.put_nowait(replica)
+
+    @property
+    def replicas(self) -> tuple[_T, ...]:
+        return self._replicas
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[_T]:
+        replica = await self._idle.get()
+        try:
+            yield replica
+        finally:
+            self._idle.put_nowait(replica)
+
+    @contextmanager
+    def acquire_nowait(self) -> Iterator[_T]:
+        try:
+            replica = self._idle.get_nowait()
+        except asyncio.QueueEmpty as exc:
+            raise RuntimeError("No idle replica") from exc
+
+        try:
+            yield replica
+        finally:
+            self._idle.put_nowait(replica)
@@ -0,0 +1,11 @@
+from collections.abc import Mapping
+
+from shared.application.tool.tier_stats import TierStatsSource
+from shared.application.tool.tier_stats_registry import TierStatsRegistry
+
+class DefaultTierStatsRegistry(TierStatsRegistry):
+    def __init__(self, sources: Mapping[str, TierStatsSource], /) -> None:
+        self._sources = dict(sources)
+
+    def sources(self) -> Mapping[str, TierStatsSource]:
+        return self._sources
@@ -0,0 +1,35 @@
+from shared.application.tool.tier_stats import TierStats, TierStatsSource
+
+class TierCounters(TierStatsSource):
+    """
+    Counts how far requests travel through an escalating chain of tiers.
+
+    A request that stops at tier n has run every tier up to n, so each of
+    them gets a run, and tier n also gets a hit when it produced a result.
+    Counters are only updated from the event loop, so no locking is needed.
+    """
+
+    def __init__(self, tiers: tuple[str, ...], /) -> None:
+        if not tiers:
+            raise ValueError("tiers must not be empty")
+
+        self._tiers = tiers
+        self._runs = [0] * len(tiers)
+        self._hits = [0] * len(tiers)
+
+    @property
+    def tiers(self) -> tuple[str, ...]:
+        return self._tiers
+
+    def record(self, tier: int, hit: bool, /) -> None:
+        for index in range(tier + 1):
+            self._runs[index] += 1
+
+        if hit:
+            self._hits[tier] += 1
+
+    def tier_stats(self) -> tuple[TierStats, ...]:
+        return tuple(
+            TierStats(tier=tier, runs=runs, hits=hits)
+            for tier, runs, hits in zip(self._tiers, self._runs, self._hits, strict=True)
+        )
@@ -12,7 +12,7 @@ _R = TypeVar("_R")
 
 class AsyncIOThreadWorkerPool(WorkerPool):
     def __init__(self, *, max_workers: int) -> None:
-        self._executor = ThreadPoolExecutor()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
         self._semaphore = asyncio.Semaphore(max_workers)
 
     async def run(
@@ -0,0 +1,124 @@
+import argparse
+import timeit
+
+from pathlib import Path
+
+import numpy as np
+import torch
+
+from ultralytics.engine.results import Results
+
+from shared.domain.aggregate.image import Image
+from shared.domain.vo.coordinate import BoundingBox
+from shared.application.service.ml.dto import detection
+from shared.infrastructure.dto.vo.data import Cv2ImageBinary
+from shared.infrastructure.factory.tool.worker_pool import DefaultWorkerPoolFactory
+from shared.infrastructure.service.ml.provider.yolo_provider import YOLOMlDetectionProvider
+
+MODELS_DIR = Path("./models/ul")
+
+IMAGE_WIDTH = 1920
+IMAGE_HEIGHT = 1080
+
+def make_results(count: int, names: dict[int, str], seed: int = 0) -> Results:
+    rng = np.random.default_rng(seed)
+
+    x1 = rng.uniform(0, IMAGE_WIDTH - 200, count)
+    y1 = rng.uniform(0, IMAGE_HEIGHT - 200, count)
+    data = np.stack([
+        x1,
+        y1,
+        x1 + rng.uniform(20, 200, count),
+        y1 + rng.uniform(20, 200, count),
+        rng.uniform(0.05, 1.0, count),
+        rng.choice(list(names), count),
+    ], axis=1)
+
+    return Results(
+        orig_img=np.zeros((IMAGE_HEIGHT, IMAGE_WIDTH, 3), dtype=np.uint8),
+        path="benchmark.jpg",
+        names=names,
+        boxes=torch.tensor(data, dtype=torch.float32)
+    )
+
+
+def process_results_per_box(
+    request: detection.Request,
+    results: list[Results]
+) -> detection.Response:
+    boxes = results[0].boxes
+    conf_scores = boxes.conf.detach().cpu().numpy()
+    class_ids = boxes.cls.detach().cpu().numpy().astype(int)
+
+    mask = np.ones_like(conf_scores, dtype=bool)
+    if request.score_threshold is not None:
+        mask &= (conf_scores >= request.score_threshold)
+
+    response_boxes: list[detection.Box] = []
+    for box_idx in np.where(mask)[0]:
+        box = boxes[box_idx]
+        xyxy = box.xyxy.cpu().numpy()[0]
+        class_id = class_ids[box_idx]
+
+        response_boxes.append(detection.Box(
+            type=detection.Type(
+                id=class_id,
+                name=results[0].names.get(class_id, "unknown")
+            ),
+            score=float(conf_scores[box_idx]),
+            coordinate=BoundingBox.from_xyxy(*map(int, xyxy.tolist()))
+        ))
+
+    return detection.Response(
+        id=None,
+        boxes=tuple(response_boxes)
+    )
+
+
+def run_benchmark(model: Path, counts: tuple[int, ...], number: int) -> None:
+    provider = YOLOMlDetectionProvider(
+        DefaultWorkerPoolFactory(),
+        model,
+        "detect"
+    )
+    names = provider._model.names # pylint: disable=protected-access
+    request = detection.Request(
+        source=Image(
+            data=Cv2ImageBinary(image=np.zeros((1, 1, 3), dtype=np.uint8)),
+            coordinate=BoundingBox.from_xyxy(0, 0, 1, 1)
+        ),
+        score_threshold=0.0
+    )
+
+    print(f"{'boxes':>6} {'per box, us':>12} {'vectorized, us':>15} {'speedup':>8}")
+    for count in counts:
+        results = [make_results(count, names)]
+
+        expected = process_results_per_box(request, results)
+        actual = provider._process_results(request, results) # pylint: disable=protected-access
+        assert actual == expected, "vectorized conversion differs from the per-box one"
+
+        per_box = min(timeit.repeat(
+            lambda: process_results_per_box(request, results), # pylint: disable=cell-var-from-loop
+            number=number,
+            repeat=5
+        )) / number
+        vectorized = min(timeit.repeat(
+            lambda: provider._process_results(request, results), # pylint: disable=protected-access,cell-var-from-loop
+            number=number,
+            repeat=5
+        )) / number
+
+        print(
+            f"{count:>6} {per_box * 1e6:>12.1f} {vectorized * 1e6:>15.1f} "
+            f"{per_box / vectorized:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="YOLO result conversion benchmark")
+    parser.add_argument("--model", required=True, help="YOLO model filename")
+    parser.add_argument("--number", type=int, default=200, help="Calls per measurement")
+    args = parser.parse_args()
+
+    run_benchmark(MODELS_DIR / args.model, (1, 10, 100), args.number)
@@ -0,0 +1,100 @@
+# pylint: disable=unused-import,redefined-outer-name,too-many-positional-arguments,wrong-import-position
+from typing import Any
+from pathlib import Path
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("ultralytics")
+
+from app.cli import quantize
+from shared.infrastructure.service.ml.backend.yolo_backend import YOLOArtifact, YOLO_BACKENDS
+from shared.infrastructure.service.ml.backend.yolo_quantizer import YOLOQuantizationReport
+
+def make_report(model: Path, /) -> YOLOQuantizationReport:
+    return YOLOQuantizationReport(
+        model=model,
+        reference=YOLOArtifact(backend=YOLO_BACKENDS["onnx"], path=model.with_suffix(".onnx")),
+        quantized=YOLOArtifact(
+            backend=YOLO_BACKENDS["openvino_int8"],
+            path=model.with_name(f"{model.stem}_int8_openvino_model")
+        ),
+        calibration_frames=8,
+        evaluation_frames=2,
+        reference_latency=timedelta(milliseconds=20),
+        quantized_latency=timedelta(milliseconds=10),
+        precision=0.75,
+        recall=1.0
+    )
+
+
+@pytest.fixture
+def quantizer(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Any:
+    monkeypatch.setenv("ML_YOLO_MODEL_DEVICE", "cpu")
+    monkeypatch.setenv("ML_YOLO_BACKEND_CACHE_PATH", str(tmp_path / "cache"))
+    monkeypatch.delenv("ML_FRAME_CAPTURE_PATH", raising=False)
+
+    quantizer = MagicMock()
+    quantizer.quantize.side_effect = lambda model, *_: make_report(model)
+    with patch.object(quantize, "YOLOQuantizer", return_value=quantizer) as factory:
+        quantizer.factory = factory
+        yield quantizer
+
+
+@pytest.mark.unit
+class TestQuantizeCli:
+    """Test cases for the quantize command"""
+
+    def test_main_quantizes_each_model_once(
+        self,
+        quantizer: Any,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test main quantizes every distinct model and prints its report"""
+        status = quantize.main([
+            "models/vehicle.pt",
+            "models/plate.pt",
+            "models/vehicle.pt",
+            "--frames", str(tmp_path),
+            "--holdout", "0.25",
+        ])
+
+        assert status == 0
+        assert [call.args for call in quantizer.quantize.call_args_list] == [
+            (Path("models/vehicle.pt"), "detect", tmp_path),
+            (Path("models/plate.pt"), "detect", tmp_path),
+        ]
+
+        registry = quantizer.factory.call_args.args[0]
+        assert registry.artifact_path("onnx", Path("models/vehicle.pt")) \
+            == tmp_path / "cache" / "models" / "vehicle.onnx"
+        assert quantizer.factory.call_args.kwargs == {"holdout": 0.25, "iou_threshold": 0.5}
+
+        output = capsys.readouterr().out
+        assert "models/vehicle_int8_openvino_model" in output
+        assert "onnx 20.0 ms, int8 10.0 ms (2.00x)" in output
+        assert "agreement:         0.857 (precision 0.750, recall 1.000)" in output
+
+    def test_main_reads_frames_from_config(
+        self,
+        quantizer: Any,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path
+    ) -> None:
+        """Test main falls back to the frame capture directory"""
+        monkeypatch.setenv("ML_FRAME_CAPTURE_PATH", str(tmp_path))
+
+        quantize.main(["models/vehicle.pt"])
+
+        assert quantizer.quantize.call_args.args == (Path("models/vehicle.pt"), "detect", tmp_path)
+
+    def test_main_requires_frames(self, quantizer: Any, tmp_path: Path) -> None:
+        """Test main exits with a usage error without a captured frames directory"""
+        with pytest.raises(SystemExit) as exc:
+            quantize.main(["models/vehicle.pt", "--frames", str(tmp_path / "missing")])
+
+        assert exc.value.code == 2
+        quantizer.quantize.assert_not_called()
@@ -0,0 +1,43 @@
+# pylint: disable=unused-import,redefined-outer-name,too-many-positional-arguments,wrong-import-position
+import logging
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("ultralytics")
+pytest.importorskip("openai")
+
+from shared.application.tool.readiness import ReadinessState
+from shared.infrastructure.tool.readiness import DefaultReadiness
+
+from app.rest.bootstrap import _warm_up
+
+@pytest.mark.unit
+class TestWarmUp:
+    """Test cases for the startup warm-up task"""
+
+    @pytest.mark.asyncio
+    async def test_warm_up_marks_ready(self) -> None:
+        """Test the warm-up task marks the service ready once the models ran"""
+        warmup = AsyncMock()
+        readiness = DefaultReadiness()
+
+        await _warm_up(warmup, readiness)
+
+        warmup.warm_up.assert_awaited_once_with()
+        assert readiness.state() == ReadinessState.READY
+
+    @pytest.mark.asyncio
+    async def test_warm_up_marks_failed(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test the warm-up task marks the service failed and logs when a model raises"""
+        warmup = AsyncMock()
+        warmup.warm_up.side_effect = RuntimeError("model failed")
+        readiness = DefaultReadiness()
+
+        with caplog.at_level(logging.ERROR):
+            await _warm_up(warmup, readiness)
+
+        assert readiness.state() == ReadinessState.FAILED
+        assert "Model warm-up failed" in caplog.text
@@ -0,0 +1,81 @@
+# pylint: disable=unused-import,redefined-outer-name,too-many-positional-arguments,wrong-import-position
+from collections.abc import Iterator
+
+import pytest
+
+from dishka import Provider, Scope, make_async_container, provide
+from dishka.integrations.fastapi import setup_dishka
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# The action injects through di.container, which imports every provider.
+pytest.importorskip("torch")
+pytest.importorskip("ultralytics")
+pytest.importorskip("openai")
+
+from shared.domain.factory.dt import DateTimeFactory
+from shared.application.tool.readiness import Readiness
+from shared.infrastructure.factory.dt import DefaultDateTimeFactory
+from shared.infrastructure.tool.readiness import DefaultReadiness
+
+from kernel.application.system.handler import check_health
+from kernel.ui.rest.system.action.health import router
+
+class HealthProvider(Provider):
+    scope = Scope.APP
+
+    datetime_factory = provide(source=DefaultDateTimeFactory, provides=DateTimeFactory)
+    handler = provide(check_health.Handler)
+
+    def __init__(self, readiness: Readiness) -> None:
+        super().__init__()
+        self._readiness = readiness
+
+    @provide
+    def make_readiness(self) -> Readiness:
+        return self._readiness
+
+
+@pytest.fixture
+def readiness() -> DefaultReadiness:
+    return DefaultReadiness()
+
+
+@pytest.fixture
+def client(readiness: DefaultReadiness) -> Iterator[TestClient]:
+    app = FastAPI()
+    app.include_router(router)
+    setup_dishka(make_async_container(HealthProvider(readiness)), app)
+
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.mark.unit
+class TestHealthAction:
+    """Test cases for the health action"""
+
+    def test_health_while_warming_up(self, client: TestClient) -> None:
+        """Test health responds 503 not_ready until the warm-up finishes"""
+        response = client.get("/health")
+
+        assert response.status_code == 503
+        assert response.json()["data"]["status"] == "not_ready"
+
+    def test_health_when_ready(self, client: TestClient, readiness: DefaultReadiness) -> None:
+        """Test health responds 200 success once the models are warmed up"""
+        readiness.mark_ready()
+
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        assert response.json()["data"]["status"] == "success"
+
+    def test_health_after_failure(self, client: TestClient, readiness: DefaultReadiness) -> None:
+        """Test health responds 503 failure when the warm-up failed"""
+        readiness.mark_failed()
+
+        response = client.get("/health")
+
+        assert response.status_code == 503
+        assert response.json()["data"]["status"] == "failure"
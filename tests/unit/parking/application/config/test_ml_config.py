@@ -0,0 +1,50 @@
+# pylint: disable=unused-import,redefined-outer-name,too-many-positional-arguments
+from typing import Any
+from pathlib import Path
+
+import pytest
+
+from pydantic import ValidationError
+
+from tests.unit.parking.fixtures.application.config.fixtures import dynamic_config_ml
+
+@pytest.mark.unit
+class TestMl:
+    """Test cases for Ml config"""
+
+    def test_hyperlpr_detect_levels_default(self, dynamic_config_ml: Any) -> None:
+        """Test config keeps the default HyperLPR detect levels"""
+        assert dynamic_config_ml().plate_identifier_hyperlpr_detect_levels == ("high",)
+
+    def test_hyperlpr_detect_levels_from_env(
+        self,
+        dynamic_config_ml: Any,
+        monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test config splits HyperLPR detect levels from a comma separated variable"""
+        monkeypatch.setenv("ML_PLATE_IDENTIFIER_HYPERLPR_DETECT_LEVELS", " low, high ,")
+
+        assert dynamic_config_ml().plate_identifier_hyperlpr_detect_levels == ("low", "high")
+
+    @pytest.mark.parametrize("detect_levels", ["medium", ("low", "medium")])
+    def test_hyperlpr_detect_levels_rejects_unknown_level(
+        self,
+        dynamic_config_ml: Any,
+        detect_levels: Any
+    ) -> None:
+        """Test config rejects an unknown HyperLPR detect level"""
+        with pytest.raises(ValidationError):
+            dynamic_config_ml(plate_identifier_hyperlpr_detect_levels=detect_levels)
+
+    @pytest.mark.parametrize(("value", "expected"), [("", None), ("snapshots", Path("snapshots"))])
+    def test_identifier_cache_snapshot_path_from_env(
+        self,
+        dynamic_config_ml: Any,
+        monkeypatch: pytest.MonkeyPatch,
+        value: str,
+        expected: Path | None
+    ) -> None:
+        """Test config disables cache snapshots when the path variable is empty"""
+        monkeypatch.setenv("ML_IDENTIFIER_CACHE_SNAPSHOT_PATH", value)
+
+        assert dynamic_config_ml().identifier_cache_snapshot_path == expected
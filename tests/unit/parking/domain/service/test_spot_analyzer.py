@@ -121,3 +121,50 @@ class TestSpotAnalyzer:
             assert spots_results[i].spot == spot
 
         assert mock_vehicle_recognizer.recognize.call_count == len(spots)
+
+    @pytest.mark.asyncio
+    async def test_analyze_many_with_mixed_spots(
+        self,
+        mock_vehicle_recognizer: Any,
+        sample_image: Any,
+        dynamic_spots: Any,
+        sample_vehicle: Any
+    ) -> Any:
+        """Test analyze_many method when only some spots are occupied"""
+        analyzer = SpotAnalyzer(mock_vehicle_recognizer)
+        spots = tuple(dynamic_spots(3))
+        mock_vehicle_recognizer.recognize_many.return_value = (sample_vehicle, None, sample_vehicle)
+
+        results = await analyzer.analyze_many(sample_image, spots)
+
+        assert len(results) == len(spots)
+        for result, spot in zip(results, spots):
+            assert isinstance(result, ParkingSpot)
+            assert result.spot == spot
+
+        assert results[0].occupied is True
+        assert results[0].vehicle == sample_vehicle
+        assert results[1].occupied is False
+        assert results[1].vehicle is None
+        assert results[2].occupied is True
+
+        mock_vehicle_recognizer.recognize_many.assert_called_once_with(
+            sample_image,
+            tuple(spot.coordinate for spot in spots),
+            spot_ids=tuple(spot.id for spot in spots)
+        )
+        mock_vehicle_recognizer.recognize.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_analyze_many_handles_recognizer_exception(
+        self,
+        mock_vehicle_recognizer: Any,
+        sample_image: Any,
+        dynamic_spots: Any
+    ) -> Any:
+        """Test analyze_many method handles VehicleRecognizer exceptions"""
+        analyzer = SpotAnalyzer(mock_vehicle_recognizer)
+        mock_vehicle_recognizer.recognize_many.side_effect = Exception("Recognition failed")
+
+        with pytest.raises(Exception, match="Recognition failed"):
+            await analyzer.analyze_many(sample_image, tuple(dynamic_spots(2)))
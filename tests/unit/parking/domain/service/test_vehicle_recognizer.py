@@ -17,6 +17,7 @@ from tests.unit.parking.fixtures.domain.service.vehicle.fixtures import (
     mock_plate_identifier
 )
 from tests.unit.parking.fixtures.domain.aggregate.fixtures import (
+    dynamic_spots,
     sample_spot,
     sample_vehicle_details,
     sample_vehicle_observed,
@@ -54,9 +55,14 @@ class TestVehicleRecognizer:
 
         mock_vehicle_identifier.identify.assert_called_once_with(
             sample_image,
-            sample_spot.coordinate
+            sample_spot.coordinate,
+            spot_id=None
+        )
+        mock_plate_identifier.identify.assert_called_once_with(
+            sample_image,
+            result.coordinate,
+            spot_id=None
         )
-        mock_plate_identifier.identify.assert_called_once_with(sample_image, result.coordinate)
 
     @pytest.mark.asyncio
     async def test_recognize_with_vehicle_no_plate(
@@ -82,9 +88,14 @@ class TestVehicleRecognizer:
 
         mock_vehicle_identifier.identify.assert_called_once_with(
             sample_image,
-            sample_spot.coordinate
+            sample_spot.coordinate,
+            spot_id=None
+        )
+        mock_plate_identifier.identify.assert_called_once_with(
+            sample_image,
+            result.coordinate,
+            spot_id=None
         )
-        mock_plate_identifier.identify.assert_called_once_with(sample_image, result.coordinate)
 
     @pytest.mark.asyncio
     async def test_recognize_no_vehicle_detected(
@@ -104,7 +115,8 @@ class TestVehicleRecognizer:
 
         mock_vehicle_identifier.identify.assert_called_once_with(
             sample_image,
-            sample_spot.coordinate
+            sample_spot.coordinate,
+            spot_id=None
         )
         mock_plate_identifier.identify.assert_not_called()
 
@@ -154,7 +166,8 @@ class TestVehicleRecognizer:
 
         mock_vehicle_identifier.identify.assert_called_once_with(
             sample_image,
-            sample_spot.coordinate
+            sample_spot.coordinate,
+            spot_id=None
         )
         mock_plate_identifier.identify.assert_not_called()
 
@@ -177,11 +190,13 @@ class TestVehicleRecognizer:
 
         mock_vehicle_identifier.identify.assert_called_once_with(
             sample_image,
-            sample_spot.coordinate
+            sample_spot.coordinate,
+            spot_id=None
         )
         mock_plate_identifier.identify.assert_called_once_with(
             sample_image,
-            sample_vehicle_observed.coordinate
+            sample_vehicle_observed.coordinate,
+            spot_id=None
         )
 
 
@@ -203,6 +218,141 @@ class TestVehicleRecognizer:
 
         mock_vehicle_identifier.identify.assert_called_once_with(
             sample_image,
-            sample_spot.coordinate
+            sample_spot.coordinate,
+            spot_id=None
+        )
+        mock_plate_identifier.identify.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_recognize_many_with_mixed_spots(
+        self,
+        mock_vehicle_identifier: Any,
+        mock_plate_identifier: Any,
+        sample_image: Any,
+        dynamic_spots: Any,
+        sample_vehicle_observed: Any,
+        sample_vehicle_details: Any,
+        sample_plate: Any
+    ) -> Any:
+        """Test recognize_many method when only some spots have vehicles"""
+        recognizer = VehicleRecognizer(mock_vehicle_identifier, mock_plate_identifier)
+        coordinates = tuple(spot.coordinate for spot in dynamic_spots(3))
+        mock_vehicle_identifier.identify_many.return_value = (
+            sample_vehicle_observed,
+            None,
+            sample_vehicle_observed
+        )
+        mock_plate_identifier.identify_many.return_value = (sample_plate, sample_plate)
+
+        results = await recognizer.recognize_many(sample_image, coordinates)
+
+        assert len(results) == len(coordinates)
+        assert results[1] is None
+        for result in (results[0], results[2]):
+            assert isinstance(result, Vehicle)
+            assert result.details == sample_vehicle_details
+            assert result.plate == sample_plate
+            assert result.coordinate == sample_vehicle_observed.coordinate
+
+        mock_vehicle_identifier.identify_many.assert_called_once_with(
+            sample_image,
+            coordinates,
+            spot_ids=None
+        )
+        mock_vehicle_identifier.identify.assert_not_called()
+        mock_plate_identifier.identify_many.assert_called_once_with(
+            sample_image,
+            (sample_vehicle_observed.coordinate,) * 2,
+            spot_ids=None
         )
         mock_plate_identifier.identify.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_recognize_many_no_vehicles_detected(
+        self,
+        mock_vehicle_identifier: Any,
+        mock_plate_identifier: Any,
+        sample_image: Any,
+        dynamic_spots: Any
+    ) -> Any:
+        """Test recognize_many method when no vehicle is detected on any spot"""
+        recognizer = VehicleRecognizer(mock_vehicle_identifier, mock_plate_identifier)
+        coordinates = tuple(spot.coordinate for spot in dynamic_spots(4))
+        mock_vehicle_identifier.identify_many.return_value = (None,) * len(coordinates)
+
+        results = await recognizer.recognize_many(sample_image, coordinates)
+
+        assert results == (None,) * len(coordinates)
+
+        mock_vehicle_identifier.identify_many.assert_called_once_with(
+            sample_image,
+            coordinates,
+            spot_ids=None
+        )
+        mock_plate_identifier.identify_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_recognize_forwards_spot_id(
+        self,
+        mock_vehicle_identifier: Any,
+        mock_plate_identifier: Any,
+        sample_image: Any,
+        sample_spot: Any,
+        sample_vehicle_observed: Any,
+        sample_plate: Any
+    ) -> Any:
+        """Test recognize method passes the spot id to both identifiers"""
+        recognizer = VehicleRecognizer(mock_vehicle_identifier, mock_plate_identifier)
+        mock_vehicle_identifier.identify.return_value = sample_vehicle_observed
+        mock_plate_identifier.identify.return_value = sample_plate
+
+        await recognizer.recognize(
+            sample_image,
+            sample_spot.coordinate,
+            spot_id=sample_spot.id
+        )
+
+        mock_vehicle_identifier.identify.assert_called_once_with(
+            sample_image,
+            sample_spot.coordinate,
+            spot_id=sample_spot.id
+        )
+        mock_plate_identifier.identify.assert_called_once_with(
+            sample_image,
+            sample_vehicle_observed.coordinate,
+            spot_id=sample_spot.id
+        )
+
+    @pytest.mark.asyncio
+    async def test_recognize_many_forwards_spot_ids(
+        self,
+        mock_vehicle_identifier: Any,
+        mock_plate_identifier: Any,
+        sample_image: Any,
+        dynamic_spots: Any,
+        sample_vehicle_observed: Any,
+        sample_plate: Any
+    ) -> Any:
+        """Test recognize_many method passes occupied spot ids to the plate identifier"""
+        recognizer = VehicleRecognizer(mock_vehicle_identifier, mock_plate_identifier)
+        spots = dynamic_spots(2)
+        coordinates = tuple(spot.coordinate for spot in spots)
+        spot_ids = tuple(spot.id for spot in spots)
+        mock_vehicle_identifier.identify_many.return_value = (
+            None,
+            sample_vehicle_observed
+        )
+        mock_plate_identifier.identify_many.return_value = (sample_plate,)
+
+        await recognizer.recognize_many(sample_image, coordinates, spot_ids=spot_ids)
+
+        mock_vehicle_identifier.identify_many.assert_called_once_with(
+            sample_image,
+            coordinates,
+            spot_ids=spot_ids
+        )
+        mock_plate_identifier.identify_many.assert_called_once_with(
+            sample_image,
+            (sample_vehicle_observed.coordinate,),
+            spot_ids=(spot_ids[1],)
+        )
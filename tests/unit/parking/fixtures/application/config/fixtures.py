@@ -0,0 +1,22 @@
+# pylint: disable=redefined-outer-name
+from typing import Any
+from pathlib import Path
+from functools import partial
+
+import pytest
+
+from parking.application import config
+
+def create_config_ml(path: Path, **kwargs: Any) -> config.Ml:
+    return config.Ml(**{
+        "vehicle_identifiers": ("yolo",),
+        "vehicle_identifier_yolo_model_path": path,
+        "plate_identifiers": ("yolo",),
+        "plate_identifier_yolo_model_path": path,
+        **kwargs,
+    })
+
+
+@pytest.fixture
+def dynamic_config_ml(tmp_path: Path) -> Any:
+    return partial(create_config_ml, tmp_path)
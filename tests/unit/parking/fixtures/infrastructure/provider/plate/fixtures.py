@@ -0,0 +1,106 @@
+# pylint: disable=redefined-outer-name,wrong-import-position
+from typing import Any
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("onnxruntime")
+pytest.importorskip("hyperlpr3")
+
+from hyperlpr3.common.tokenize import token # type: ignore
+from hyperlpr3.inference.pipeline import LPRMultiTaskPipeline # type: ignore
+from hyperlpr3.inference.multitask_detect import MultiTaskDetectorORT # type: ignore
+from hyperlpr3.inference.recognition import PPRCNNRecognitionORT # type: ignore
+
+class FakeDetectorSession:
+    """Detects bright rectangles at least min_width letterboxed pixels wide."""
+
+    def __init__(self, min_width: int = 0) -> None:
+        self._min_width = min_width
+
+    def get_inputs(self) -> list[Any]:
+        return [SimpleNamespace(shape=["batch", 3, 320, 320])]
+
+    def run(self, names: list[str], feeds: dict[str, Any]) -> list[Any]:
+        batch = next(iter(feeds.values()))
+        outputs = np.zeros((len(batch), 1, 15), dtype=np.float32)
+        for i, data in enumerate(batch):
+            ys, xs = np.nonzero(data.mean(axis=0) > 0.7)
+            if len(xs) == 0 or xs.max() - xs.min() < self._min_width:
+                continue
+
+            x1, y1, x2, y2 = xs.min(), ys.min(), xs.max(), ys.max()
+            outputs[i, 0] = (
+                (x1 + x2) / 2, (y1 + y2) / 2, x2 - x1, y2 - y1, 0.9,
+                x1, y1, x2, y1, x2, y2, x1, y2,
+                0.9, 0.05
+            )
+
+        return [outputs]
+
+
+class FakeRecognizerSession:
+    """Reads a seven character code whose last digit is the plate brightness."""
+
+    def get_inputs(self) -> list[Any]:
+        return [SimpleNamespace(shape=["batch", 3, 48, 160])]
+
+    def run(self, names: list[str], feeds: dict[str, Any]) -> list[Any]:
+        batch = next(iter(feeds.values()))
+        outputs = np.full((len(batch), 14, len(token)), 0.05 / len(token), dtype=np.float32)
+        for i, data in enumerate(batch):
+            digit = int(round((float(data[:, 16:32, 60:100].mean()) + 1) * 127.5)) % 10
+            # Blanks between the characters keep repeated ones apart.
+            for step, index in enumerate((12, 13, 14, 15, 16, 17, 2 + digit)):
+                outputs[i, 2 * step, index] = 0.95
+                outputs[i, 2 * step + 1, 0] = 0.95
+
+        return [outputs]
+
+
+class FakeCatcher:
+    def __init__(self, pipeline: Any) -> None:
+        self.pipeline = pipeline
+
+    def __call__(self, frame: Any) -> Any:
+        return self.pipeline(frame)
+
+
+def create_recognizer() -> Any:
+    recognizer = PPRCNNRecognitionORT.__new__(PPRCNNRecognitionORT)
+    recognizer.input_size = [48, 160]
+    recognizer.session = FakeRecognizerSession()
+    recognizer.input_config = SimpleNamespace(name="x")
+    recognizer.output_config = SimpleNamespace(name="y")
+    recognizer.character_list = token
+
+    return recognizer
+
+
+def create_catcher(min_width: int = 0) -> FakeCatcher:
+    detector = MultiTaskDetectorORT.__new__(MultiTaskDetectorORT)
+    detector.input_size = (320, 320)
+    detector.session = FakeDetectorSession(min_width)
+    detector.outputs_option = [SimpleNamespace(name="output")]
+    detector.input_name = "images"
+
+    return FakeCatcher(LPRMultiTaskPipeline(
+        detector=detector,
+        recognizer=create_recognizer(),
+        classifier=lambda image: np.array([[1.0, 0.0, 0.0]])
+    ))
+
+
+@pytest.fixture
+def hyperlpr_catchers() -> Any:
+    # The low level only finds large plates, the high level finds all of them.
+    return {
+        "low": create_catcher(min_width=60),
+        "high": create_catcher(),
+    }
+
+
+@pytest.fixture
+def hyperlpr_recognizer() -> Any:
+    return create_recognizer()
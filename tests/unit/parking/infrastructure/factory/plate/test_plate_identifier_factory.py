@@ -0,0 +1,52 @@
+# pylint: disable=unused-import,redefined-outer-name,too-many-positional-arguments
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from shared.infrastructure.tool.noop_worker_pool import NoopWorkerPool
+from shared.infrastructure.tool.tier_stats.tier_counters import TierCounters
+
+from tests.unit.parking.fixtures.application.config.fixtures import dynamic_config_ml
+
+pytest.importorskip("ultralytics")
+pytest.importorskip("onnxruntime")
+pytest.importorskip("hyperlpr3")
+
+from parking.infrastructure.factory.plate.identifier import ( # pylint: disable=wrong-import-position
+    PlateIdentifierFactory
+)
+
+@pytest.mark.unit
+class TestPlateIdentifierFactory:
+    """Test cases for PlateIdentifierFactory"""
+
+    def test_make_yolo_hyperlpr_reuses_yolo_and_loads_recognizer_only(
+        self,
+        dynamic_config_ml: Any
+    ) -> None:
+        """Test make_all method shares one YOLO plate model and skips the HyperLPR detector"""
+        config_ml = dynamic_config_ml(plate_identifiers=("yolo", "yolo_hyperlpr"))
+        yolo_ml_detection_factory = MagicMock()
+        factory = PlateIdentifierFactory(
+            config_ml,
+            yolo_ml_detection_factory,
+            NoopWorkerPool(),
+            MagicMock(threads=MagicMock(return_value=2)),
+            TierCounters(("high",))
+        )
+
+        with (
+            patch(
+                "parking.infrastructure.provider.plate.hyperlpr_recognizer.make_recognizer"
+            ) as mock_make_recognizer,
+            patch(
+                "parking.infrastructure.provider.plate.hyperlpr_identifier.make_catcher"
+            ) as mock_make_catcher
+        ):
+            identifiers = factory.make_all()
+
+        assert len(identifiers) == 2
+        yolo_ml_detection_factory.make.assert_called_once()
+        mock_make_recognizer.assert_called_once_with(2)
+        mock_make_catcher.assert_not_called()
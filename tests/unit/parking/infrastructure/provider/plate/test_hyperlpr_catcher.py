@@ -0,0 +1,105 @@
+# pylint: disable=unused-import,redefined-outer-name,too-many-positional-arguments,wrong-import-position
+from typing import Any
+from types import SimpleNamespace
+from os.path import join
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("onnxruntime")
+pytest.importorskip("hyperlpr3")
+
+from hyperlpr3.config.settings import _DEFAULT_FOLDER_, onnx_runtime_config # type: ignore
+
+from parking.infrastructure.provider.plate import hyperlpr_catcher
+from parking.infrastructure.provider.plate.hyperlpr_catcher import make_catcher, make_recognizer
+
+class FakeCatcher:
+    """Holds a pipeline of components with their default sessions."""
+
+    def __init__(self, detect_level: int) -> None:
+        self.detect_level = detect_level
+        self.pipeline = SimpleNamespace(
+            detector=SimpleNamespace(session="default"),
+            recognizer=SimpleNamespace(session="default"),
+            classifier=SimpleNamespace(session="default"),
+        )
+
+
+@pytest.fixture
+def ort() -> Any:
+    ort = MagicMock()
+    ort.InferenceSession.side_effect = lambda path, options, providers: SimpleNamespace(
+        path=path,
+        options=options,
+        providers=providers
+    )
+    ort.SessionOptions.side_effect = SimpleNamespace
+
+    with patch.object(hyperlpr_catcher, "ort", ort), \
+            patch.object(hyperlpr_catcher.lpr3, "LicensePlateCatcher", FakeCatcher):
+        yield ort
+
+
+def model_path(model: str) -> str:
+    return join(_DEFAULT_FOLDER_, onnx_runtime_config[model])
+
+
+@pytest.mark.unit
+class TestMakeCatcher:
+    """Test cases for make_catcher"""
+
+    def test_make_catcher_keeps_default_sessions(self, ort: Any) -> None:
+        """Test make_catcher function leaves the hyperlpr3 sessions alone without threads"""
+        catcher = make_catcher("low")
+
+        assert catcher.detect_level == hyperlpr_catcher.lpr3.DETECT_LEVEL_LOW
+        assert catcher.pipeline.detector.session == "default"
+        ort.InferenceSession.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "detect_level, detector_model",
+        [("low", "det_model_path_320x"), ("high", "det_model_path_640x")]
+    )
+    def test_make_catcher_replaces_sessions(
+        self,
+        ort: Any,
+        detect_level: str,
+        detector_model: str
+    ) -> None:
+        """Test make_catcher function rebuilds every session with the configured threads"""
+        catcher = make_catcher(detect_level, 2)
+
+        sessions = {
+            component: getattr(catcher.pipeline, component).session
+            for component in ("detector", "recognizer", "classifier")
+        }
+        assert {component: session.path for component, session in sessions.items()} == {
+            "detector": model_path(detector_model),
+            "recognizer": model_path("rec_model_path"),
+            "classifier": model_path("cls_model_path"),
+        }
+        for session in sessions.values():
+            assert session.options.intra_op_num_threads == 2
+            assert session.options.inter_op_num_threads == 1
+            assert session.options.execution_mode == ort.ExecutionMode.ORT_SEQUENTIAL
+            assert session.providers == ["CPUExecutionProvider"]
+
+    def test_make_catcher_rejects_unknown_level(self, ort: Any) -> None:
+        """Test make_catcher function rejects a detect level hyperlpr3 does not have"""
+        with pytest.raises(ValueError, match="Unknown HyperLPR detect level"):
+            make_catcher("medium", 2)
+
+    def test_make_recognizer_replaces_session(self, ort: Any) -> None:
+        """Test make_recognizer function rebuilds the recognizer session with the threads"""
+        with patch.object(
+            hyperlpr_catcher,
+            "PPRCNNRecognitionORT",
+            side_effect=lambda path, input_size: SimpleNamespace(session=path)
+        ):
+            default = make_recognizer()
+            pinned = make_recognizer(2)
+
+        assert default.session == model_path("rec_model_path")
+        assert pinned.session.path == model_path("rec_model_path")
+        assert pinned.session.options.intra_op_num_threads == 2
@@ -0,0 +1,160 @@
+# pylint: disable=unused-import,redefined-outer-name,too-many-positional-arguments
+from typing import Any
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from shared.domain.aggregate.image import Image
+from shared.domain.vo.coordinate import BoundingBox, Polygon
+from shared.infrastructure.dto.vo.data import Cv2ImageBinary
+from shared.application.tool.tier_stats import TierStats
+from shared.infrastructure.tool.noop_worker_pool import NoopWorkerPool
+from shared.infrastructure.tool.tier_stats.tier_counters import TierCounters
+
+from tests.unit.parking.fixtures.application.config.fixtures import dynamic_config_ml
+from tests.unit.parking.fixtures.infrastructure.provider.plate.fixtures import hyperlpr_catchers
+
+from parking.infrastructure.provider.plate.hyperlpr_identifier import HyperlprPlateIdentifier
+
+def make_polygon(x1: int, y1: int, x2: int, y2: int) -> Polygon:
+    return Polygon.from_bbox(BoundingBox.from_xyxy(x1, y1, x2, y2))
+
+
+def create_plate_frame() -> tuple[Image, tuple[Polygon, ...]]:
+    frame = np.random.default_rng(0).integers(0, 100, (600, 900, 3), dtype=np.uint8)
+    # A large plate, a small one only the high level finds, no plate and a medium one.
+    for (x1, y1, x2, y2), value in (
+        ((90, 120, 210, 160), 201),
+        ((390, 150, 440, 166), 203),
+        ((60, 400, 160, 430), 207),
+    ):
+        frame[y1:y2, x1:x2] = value
+
+    return (
+        Image(data=Cv2ImageBinary(image=frame), coordinate=make_polygon(0, 0, 900, 600)),
+        (
+            make_polygon(0, 0, 300, 200),
+            make_polygon(300, 0, 600, 200),
+            make_polygon(600, 0, 900, 200),
+            make_polygon(0, 300, 300, 500),
+        )
+    )
+
+
+def make_identifier(config_ml: Any, catchers: Any, tier_counters: TierCounters) -> Any:
+    with patch(
+        "parking.infrastructure.provider.plate.hyperlpr_identifier.make_catcher",
+        side_effect=lambda detect_level, threads: catchers[detect_level]
+    ):
+        return HyperlprPlateIdentifier(config_ml, NoopWorkerPool(), tier_counters)
+
+
+@pytest.mark.unit
+class TestHyperlprPlateIdentifier:
+    """Test cases for HyperlprPlateIdentifier"""
+
+    def test_init_builds_a_catcher_per_level_and_replica(self, dynamic_config_ml: Any) -> None:
+        """Test constructor gives every replica its own catchers in the configured level order"""
+        config_ml = dynamic_config_ml(plate_identifier_hyperlpr_detect_levels=("high", "low"))
+
+        with patch(
+            "parking.infrastructure.provider.plate.hyperlpr_identifier.make_catcher",
+            side_effect=lambda detect_level, threads: (detect_level, threads, object())
+        ) as make_catcher:
+            identifier = HyperlprPlateIdentifier(
+                config_ml,
+                NoopWorkerPool(),
+                TierCounters(("high", "low")),
+                replicas=2,
+                threads=3
+            )
+
+        replicas = identifier._catchers.replicas # pylint: disable=protected-access
+        assert [
+            [catcher[:2] for catcher in catchers]
+            for catchers in replicas
+        ] == [[("high", 3), ("low", 3)], [("high", 3), ("low", 3)]]
+        assert replicas[0][0] is not replicas[1][0]
+        assert make_catcher.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_identify_many_matches_identify(
+        self,
+        dynamic_config_ml: Any,
+        hyperlpr_catchers: Any
+    ) -> None:
+        """Test identify_many method batches to the same plates as identify per vehicle"""
+        config_ml = dynamic_config_ml(plate_identifier_hyperlpr_detect_levels=("low", "high"))
+        image, vehicle_coordinates = create_plate_frame()
+
+        single = [
+            await make_identifier(
+                config_ml,
+                hyperlpr_catchers,
+                TierCounters(("low", "high"))
+            ).identify(image, vehicle_coordinate)
+            for vehicle_coordinate in vehicle_coordinates
+        ]
+        many = await make_identifier(
+            config_ml,
+            hyperlpr_catchers,
+            TierCounters(("low", "high"))
+        ).identify_many(image, vehicle_coordinates)
+
+        assert many == tuple(single)
+        assert [plate.value if plate is not None else None for plate in many] == [
+            "ABCDEF1", "ABCDEF3", None, "ABCDEF7"
+        ]
+        assert many[0] is not None
+        # Plates are mapped back from the vehicle crop onto the frame.
+        assert 0 <= many[0].coordinate.x1 <= 90 and 209 <= many[0].coordinate.x2 <= 300
+        assert 0 <= many[0].coordinate.y1 <= 120 and 159 <= many[0].coordinate.y2 <= 200
+
+    @pytest.mark.asyncio
+    async def test_identify_sync_escalates_to_next_level(
+        self,
+        dynamic_config_ml: Any,
+        hyperlpr_catchers: Any
+    ) -> None:
+        """Test identify_sync and identify_many_sync methods stop at the first level with a plate"""
+        config_ml = dynamic_config_ml(plate_identifier_hyperlpr_detect_levels=("low", "high"))
+        image, vehicle_coordinates = create_plate_frame()
+        identifier = make_identifier(config_ml, hyperlpr_catchers, TierCounters(("low", "high")))
+        vehicle_images = tuple([
+            await image.crop(vehicle_coordinate)
+            for vehicle_coordinate in vehicle_coordinates
+        ])
+
+        single = [
+            identifier.identify_sync(vehicle_image, vehicle_coordinate)
+            for vehicle_image, vehicle_coordinate in zip(vehicle_images, vehicle_coordinates)
+        ]
+        many = identifier.identify_many_sync(vehicle_images, vehicle_coordinates)
+
+        assert many == tuple(single)
+        assert [identification.tier for identification in many] == [0, 1, 1, 0]
+        assert [identification.plate is not None for identification in many] == [
+            True, True, False, True
+        ]
+
+    @pytest.mark.asyncio
+    async def test_identify_many_records_tier_stats(
+        self,
+        dynamic_config_ml: Any,
+        hyperlpr_catchers: Any
+    ) -> None:
+        """Test identify_many method counts runs and hits per detect level"""
+        config_ml = dynamic_config_ml(plate_identifier_hyperlpr_detect_levels=("low", "high"))
+        image, vehicle_coordinates = create_plate_frame()
+        tier_counters = TierCounters(("low", "high"))
+
+        await make_identifier(config_ml, hyperlpr_catchers, tier_counters).identify_many(
+            image,
+            vehicle_coordinates
+        )
+
+        assert tier_counters.tier_stats() == (
+            TierStats(tier="low", runs=4, hits=2),
+            TierStats(tier="high", runs=2, hits=1),
+        )
@@ -0,0 +1,80 @@
+# pylint: disable=unused-import,redefined-outer-name,too-many-positional-arguments
+from typing import Any
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from shared.domain.aggregate.image import Image
+from shared.domain.vo.coordinate import BoundingBox, Polygon
+from shared.infrastructure.dto.vo.data import Cv2ImageBinary
+from shared.infrastructure.tool.noop_worker_pool import NoopWorkerPool
+
+from tests.unit.parking.fixtures.application.config.fixtures import dynamic_config_ml
+from tests.unit.parking.fixtures.infrastructure.provider.plate.fixtures import hyperlpr_recognizer
+
+from parking.infrastructure.provider.plate.hyperlpr_recognizer import HyperlprPlateRecognizer
+
+def make_polygon(x1: int, y1: int, x2: int, y2: int) -> Polygon:
+    return Polygon.from_bbox(BoundingBox.from_xyxy(x1, y1, x2, y2))
+
+
+def create_plate_image() -> Image:
+    frame = np.zeros((200, 300, 3), dtype=np.uint8)
+    frame[20:60, 20:140] = 201
+    frame[120:150, 150:250] = 207
+
+    return Image(data=Cv2ImageBinary(image=frame), coordinate=make_polygon(0, 0, 300, 200))
+
+
+def make_recognizer(config_ml: Any, recognizer: Any) -> HyperlprPlateRecognizer:
+    with patch(
+        "parking.infrastructure.provider.plate.hyperlpr_recognizer.make_recognizer",
+        return_value=recognizer
+    ) as mock_make_recognizer:
+        plate_recognizer = HyperlprPlateRecognizer(config_ml, NoopWorkerPool(), threads=2)
+
+    mock_make_recognizer.assert_called_once_with(2)
+
+    return plate_recognizer
+
+
+@pytest.mark.unit
+class TestHyperlprPlateRecognizer:
+    """Test cases for HyperlprPlateRecognizer"""
+
+    @pytest.mark.asyncio
+    async def test_recognize_many_reads_plate_crops(
+        self,
+        dynamic_config_ml: Any,
+        hyperlpr_recognizer: Any
+    ) -> None:
+        """Test recognize_many method reads every plate crop in one batch"""
+        plate_recognizer = make_recognizer(dynamic_config_ml(), hyperlpr_recognizer)
+
+        values = await plate_recognizer.recognize_many(
+            create_plate_image(),
+            (make_polygon(20, 20, 140, 60), make_polygon(150, 120, 250, 150))
+        )
+
+        assert values == ("ABCDEF1", "ABCDEF7")
+        assert await plate_recognizer.recognize_many(create_plate_image(), ()) == ()
+
+    @pytest.mark.asyncio
+    async def test_recognize_many_rejects_low_confidence(
+        self,
+        dynamic_config_ml: Any,
+        hyperlpr_recognizer: Any
+    ) -> None:
+        """Test recognize_many method drops readings below the threshold"""
+        plate_recognizer = make_recognizer(
+            dynamic_config_ml(plate_identifier_hyperlpr_threshold=0.99),
+            hyperlpr_recognizer
+        )
+
+        values = await plate_recognizer.recognize_many(
+            create_plate_image(),
+            (make_polygon(20, 20, 140, 60),)
+        )
+
+        assert values == (None,)
@@ -0,0 +1,141 @@
+# pylint: disable=unused-import,redefined-outer-name,too-many-positional-arguments
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from pydantic import ValidationError
+
+from shared.domain.vo.coordinate import BoundingBox, Polygon
+from shared.application.service.ml.dto import detection
+
+from parking.infrastructure.provider.plate.yolo_identifier import YOLOPlateIdentifier
+
+from tests.unit.shared.fixtures.infrastructure.dto.vo.fixtures import dynamic_cv2_images
+from tests.unit.parking.fixtures.application.config.fixtures import dynamic_config_ml
+
+def make_polygon(x1: int, y1: int, x2: int, y2: int) -> Polygon:
+    return Polygon.from_bbox(BoundingBox.from_xyxy(x1, y1, x2, y2))
+
+
+def make_box(x1: int, y1: int, x2: int, y2: int, score: float = 0.9) -> detection.Box:
+    return detection.Box(
+        type=detection.Type(id=0, name="license_plate"),
+        score=score,
+        coordinate=BoundingBox.from_xyxy(x1, y1, x2, y2)
+    )
+
+
+def make_identifier(config_ml: Any, *boxes: detection.Box) -> tuple[YOLOPlateIdentifier, AsyncMock]:
+    mock_predict = AsyncMock(return_value=detection.Response(boxes=boxes))
+
+    return YOLOPlateIdentifier(config_ml, AsyncMock(predict=mock_predict)), mock_predict
+
+
+@pytest.mark.unit
+class TestYOLOPlateIdentifier:
+    """Test cases for YOLOPlateIdentifier"""
+
+    @pytest.mark.asyncio
+    async def test_locate_many_in_frame_assigns_plates_to_vehicles(
+        self,
+        dynamic_config_ml: Any,
+        dynamic_cv2_images: Any
+    ) -> None:
+        """Test locate_many method in frame mode gives each vehicle the best plate inside it"""
+        identifier, mock_predict = make_identifier(
+            dynamic_config_ml(
+                plate_identifier_yolo_mode="frame",
+                plate_identifier_yolo_frame_image_size=1280
+            ),
+            make_box(50, 150, 90, 170, score=0.5),
+            make_box(40, 160, 100, 180, score=0.8),
+            make_box(350, 150, 390, 170),
+        )
+
+        plates = await identifier.locate_many(
+            dynamic_cv2_images(1, size=1000)[0],
+            (
+                make_polygon(0, 0, 200, 200),
+                make_polygon(600, 0, 800, 200),
+                make_polygon(300, 0, 500, 200)
+            )
+        )
+
+        request = mock_predict.call_args.args[0]
+        assert mock_predict.await_count == 1
+        assert request.image_size == 1280
+        assert plates == (
+            make_polygon(40, 160, 100, 180),
+            None,
+            make_polygon(350, 150, 390, 170),
+        )
+
+    @pytest.mark.asyncio
+    async def test_locate_many_in_frame_drops_plates_outside_vehicles(
+        self,
+        dynamic_config_ml: Any,
+        dynamic_cv2_images: Any
+    ) -> None:
+        """Test locate_many method in frame mode ignores plates mostly outside every vehicle"""
+        identifier, _ = make_identifier(
+            dynamic_config_ml(plate_identifier_yolo_mode="frame"),
+            make_box(500, 500, 540, 520),
+            make_box(180, 100, 240, 120),
+        )
+
+        plates = await identifier.locate_many(
+            dynamic_cv2_images(1, size=1000)[0],
+            (make_polygon(0, 0, 200, 200),)
+        )
+
+        assert plates == (None,)
+
+    @pytest.mark.asyncio
+    async def test_locate_many_in_frame_breaks_ties_by_vehicle_order(
+        self,
+        dynamic_config_ml: Any,
+        dynamic_cv2_images: Any
+    ) -> None:
+        """Test locate_many method in frame mode gives a plate inside two vehicles to the first"""
+        identifier, _ = make_identifier(
+            dynamic_config_ml(plate_identifier_yolo_mode="frame"),
+            make_box(120, 150, 160, 170),
+            make_box(180, 150, 220, 170),
+        )
+
+        plates = await identifier.locate_many(
+            dynamic_cv2_images(1, size=1000)[0],
+            (make_polygon(0, 0, 200, 200), make_polygon(100, 0, 300, 200))
+        )
+
+        assert plates == (make_polygon(120, 150, 160, 170), make_polygon(180, 150, 220, 170))
+
+    @pytest.mark.asyncio
+    async def test_identify_many_in_frame_matches_identify(
+        self,
+        dynamic_config_ml: Any,
+        dynamic_cv2_images: Any
+    ) -> None:
+        """Test identify_many method in frame mode matches identify per vehicle"""
+        identifier, _ = make_identifier(
+            dynamic_config_ml(plate_identifier_yolo_mode="frame"),
+            make_box(40, 160, 100, 180),
+            make_box(350, 150, 390, 170),
+        )
+        image = dynamic_cv2_images(1, size=1000)[0]
+        vehicle_coordinates = (make_polygon(0, 0, 200, 200), make_polygon(300, 0, 500, 200))
+
+        plates = await identifier.identify_many(image, vehicle_coordinates)
+
+        assert plates == tuple([
+            await identifier.identify(image, vehicle_coordinate)
+            for vehicle_coordinate in vehicle_coordinates
+        ])
+        assert plates[0] is not None
+        assert plates[0].coordinate == make_polygon(20, 140, 120, 200)
+
+    def test_config_rejects_unknown_mode(self, dynamic_config_ml: Any) -> None:
+        """Test config rejects an unknown plate identifier mode"""
+        with pytest.raises(ValidationError):
+            dynamic_config_ml(plate_identifier_yolo_mode="vehicles")
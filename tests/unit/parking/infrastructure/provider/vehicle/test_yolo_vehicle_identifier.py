@@ -0,0 +1,105 @@
+# pylint: disable=unused-import,redefined-outer-name,too-many-positional-arguments
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from shared.domain.vo.coordinate import BoundingBox, Polygon
+from shared.application.service.ml.dto import detection
+
+from parking.domain.enum.vehicle import VehicleType
+from parking.infrastructure.provider.vehicle.yolo_identifier import YOLOVehicleIdentifier
+
+from tests.unit.shared.fixtures.infrastructure.dto.vo.fixtures import dynamic_cv2_images
+from tests.unit.parking.fixtures.application.config.fixtures import dynamic_config_ml
+
+def make_polygon(x1: int, y1: int, x2: int, y2: int) -> Polygon:
+    return Polygon.from_bbox(BoundingBox.from_xyxy(x1, y1, x2, y2))
+
+
+def make_box(x1: int, y1: int, x2: int, y2: int, name: str = "car") -> detection.Box:
+    return detection.Box(
+        type=detection.Type(id=2, name=name),
+        score=0.9,
+        coordinate=BoundingBox.from_xyxy(x1, y1, x2, y2)
+    )
+
+
+@pytest.mark.unit
+class TestYOLOVehicleIdentifier:
+    """Test cases for YOLOVehicleIdentifier"""
+
+    @pytest.mark.asyncio
+    async def test_identify_in_roi_shifts_boxes_to_frame(
+        self,
+        dynamic_config_ml: Any,
+        dynamic_cv2_images: Any
+    ) -> None:
+        """Test identify method in spot_roi mode maps ROI boxes back to frame coordinates"""
+        mock_predict = AsyncMock(return_value=detection.Response(boxes=(
+            make_box(100, 100, 300, 300),
+        )))
+        identifier = YOLOVehicleIdentifier(
+            dynamic_config_ml(
+                vehicle_identifier_yolo_mode="spot_roi",
+                vehicle_identifier_yolo_roi_image_size=320,
+                vehicle_identifier_yolo_roi_margin=0.5
+            ),
+            AsyncMock(predict=mock_predict)
+        )
+        image = dynamic_cv2_images(1, size=1000)[0]
+
+        vehicle = await identifier.identify(image, make_polygon(400, 400, 600, 600))
+
+        request = mock_predict.call_args.args[0]
+        assert request.image_size == 320
+        assert request.source.coordinate == make_polygon(300, 300, 700, 700)
+        assert vehicle is not None
+        assert vehicle.details.type == VehicleType.CAR
+        assert vehicle.coordinate == make_polygon(360, 360, 640, 640)
+
+    @pytest.mark.asyncio
+    async def test_identify_in_roi_rejects_boxes_outside_spot(
+        self,
+        dynamic_config_ml: Any,
+        dynamic_cv2_images: Any
+    ) -> None:
+        """Test identify method in spot_roi mode drops ROI boxes that miss the spot in the frame"""
+        identifier = YOLOVehicleIdentifier(
+            dynamic_config_ml(vehicle_identifier_yolo_mode="spot_roi"),
+            AsyncMock(predict=AsyncMock(return_value=detection.Response(boxes=(
+                make_box(0, 0, 90, 90),
+            ))))
+        )
+        image = dynamic_cv2_images(1, size=1000)[0]
+
+        assert await identifier.identify(image, make_polygon(400, 400, 600, 600)) is None
+
+    @pytest.mark.asyncio
+    async def test_identify_many_in_roi_matches_identify(
+        self,
+        dynamic_config_ml: Any,
+        dynamic_cv2_images: Any
+    ) -> None:
+        """Test identify_many method in spot_roi mode runs one ROI request per spot"""
+        mock_predict = AsyncMock(return_value=detection.Response(boxes=(
+            make_box(100, 100, 300, 300),
+        )))
+        identifier = YOLOVehicleIdentifier(
+            dynamic_config_ml(vehicle_identifier_yolo_mode="spot_roi"),
+            AsyncMock(predict=mock_predict)
+        )
+        image = dynamic_cv2_images(1, size=1000)[0]
+        spots = (make_polygon(400, 400, 600, 600), make_polygon(100, 100, 300, 300))
+
+        vehicles = await identifier.identify_many(image, spots)
+
+        assert mock_predict.call_count == 2
+        assert vehicles == tuple([await identifier.identify(image, spot) for spot in spots])
+        assert vehicles[0] is not None
+        assert vehicles[0].coordinate == make_polygon(360, 360, 640, 640)
+
+    def test_config_rejects_unknown_mode(self, dynamic_config_ml: Any) -> None:
+        """Test config rejects an unknown vehicle identifier mode"""
+        with pytest.raises(ValueError):
+            dynamic_config_ml(vehicle_identifier_yolo_mode="roi")
@@ -0,0 +1,32 @@
+# pylint: disable=redefined-outer-name
+from typing import Any
+
+import numpy as np
+import pytest
+
+from shared.domain.aggregate.image import Image
+from shared.domain.vo.coordinate import BoundingBox, Polygon
+from shared.infrastructure.dto.vo.data import Cv2ImageBinary
+
+def create_cv2_images(count: int, size: int = 64, seed: int = 0) -> list[Image]:
+    rng = np.random.default_rng(seed)
+    images = []
+
+    for _ in range(count):
+        frame = rng.integers(0, 256, size=(size, size, 3), dtype=np.uint8)
+        images.append(Image(
+            data=Cv2ImageBinary(image=frame),
+            coordinate=Polygon.from_bbox(BoundingBox.from_xyxy(0, 0, size, size))
+        ))
+
+    return images
+
+
+@pytest.fixture
+def dynamic_cv2_images() -> Any:
+    return create_cv2_images
+
+
+@pytest.fixture
+def sample_cv2_image() -> Any:
+    return create_cv2_images(1)[0]
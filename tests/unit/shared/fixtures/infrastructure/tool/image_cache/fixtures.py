@@ -0,0 +1,99 @@
+# pylint: disable=redefined-outer-name
+import random
+
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from shared.domain.aggregate.image import Image
+from shared.domain.vo.coordinate import BoundingBox, Polygon
+from shared.domain.vo.data import ImageBinary
+
+def flip_bits(value: int, bits: int, distance: int, rng: random.Random) -> int:
+    for position in rng.sample(range(bits), distance):
+        value ^= 1 << position
+
+    return value
+
+
+def create_fingerprints(
+    bits: tuple[int, ...],
+    thresholds: tuple[int, ...],
+    count: int,
+    seed: int
+) -> tuple[list[tuple[int, ...]], list[tuple[int, ...]]]:
+    """Random fingerprints plus probes placed around the threshold of stored ones"""
+    rng = random.Random(seed)
+    stored = [
+        tuple(rng.getrandbits(component_bits) for component_bits in bits)
+        for _ in range(count)
+    ]
+
+    probes = []
+    for fingerprint in rng.choices(stored, k=200):
+        probes.append(tuple(
+            flip_bits(
+                value,
+                component_bits,
+                min(component_bits, rng.randint(max(0, threshold - 2), threshold + 2)),
+                rng
+            )
+            for value, component_bits, threshold in zip(fingerprint, bits, thresholds)
+        ))
+
+    return stored, probes
+
+
+def brute_force(
+    stored: list[tuple[int, ...]],
+    probe: tuple[int, ...],
+    thresholds: tuple[int, ...]
+) -> set[tuple[int, ...]]:
+    return {
+        fingerprint
+        for fingerprint in stored
+        if any(
+            (h1 ^ h2).bit_count() <= threshold
+            for h1, h2, threshold in zip(fingerprint, probe, thresholds)
+        )
+    }
+
+
+class FakeImageSimilarity:
+    """Reads a 64-bit fingerprint straight from the image bytes"""
+
+    def __init__(self, threshold: int = 4, bits: int = 64) -> None:
+        self._threshold = threshold
+        self._bits = bits
+
+    async def similar(self, image1: Image, image2: Image, /, tolerance: float) -> bool:
+        return (
+            (await self.fingerprint(image1))[0] ^ (await self.fingerprint(image2))[0]
+        ).bit_count() <= self._threshold
+
+    async def fingerprint(self, image: Image, /) -> tuple[int, ...]:
+        return (int.from_bytes(image.data.data(), "little"),)
+
+    def fingerprint_bits(self) -> tuple[int, ...]:
+        return (self._bits,)
+
+    def fingerprint_thresholds(self, tolerance: float, /) -> tuple[int, ...]:
+        return (self._threshold,)
+
+
+def create_fingerprint_image(value: int) -> Image:
+    return Image(
+        data=Mock(spec=ImageBinary, data=Mock(return_value=value.to_bytes(8, "little"))),
+        coordinate=Polygon.from_bbox(BoundingBox.from_xyxy(0, 0, 8, 8))
+    )
+
+
+@pytest.fixture
+def fake_image_similarity() -> Any:
+    return FakeImageSimilarity()
+
+
+@pytest.fixture
+def dynamic_fingerprint_images() -> Any:
+    return create_fingerprint_image
@@ -0,0 +1,255 @@
+# pylint: disable=unused-import,redefined-outer-name,too-many-positional-arguments,wrong-import-position
+import os
+import logging
+
+from typing import Any
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("ultralytics")
+
+from shared.infrastructure.service.ml.backend import yolo_backend
+from shared.infrastructure.service.ml.backend.yolo_backend import (
+    YOLOBackend,
+    YOLOBackendRegistry,
+    YOLO_BACKENDS,
+)
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (
+        YOLOBackend(name="pytorch", runtime="numpy", suffix=".pt"),
+        YOLOBackend(name="static", runtime="numpy", suffix=".static", export_format="static"),
+        YOLOBackend(
+            name="dynamic",
+            runtime="numpy",
+            suffix=".dynamic",
+            export_format="dynamic",
+            dynamic=True
+        ),
+        YOLOBackend(
+            name="missing",
+            runtime="missing_runtime",
+            suffix=".missing",
+            export_format="missing",
+            dynamic=True
+        ),
+        YOLOBackend(
+            name="int8",
+            runtime="numpy",
+            suffix="_int8.dynamic",
+            export_format="dynamic",
+            dynamic=True,
+            int8=True
+        ),
+    )
+}
+
+
+class FakeYOLO:
+    """Writes an empty artifact where the exporter would put it."""
+
+    exports: list[tuple[Path, str, int]] = []
+    error: Exception | None = None
+
+    def __init__(self, model: Path, task: str) -> None:
+        self.model = Path(model)
+        self.task = task
+
+    def export(self, format: str, imgsz: int, **_: Any) -> str: # pylint: disable=redefined-builtin
+        if self.error is not None:
+            raise self.error
+
+        self.exports.append((self.model, format, imgsz))
+        path = self.model.with_name(f"{self.model.stem}.{format}")
+        path.write_bytes(b"")
+
+        return str(path)
+
+
+@pytest.fixture
+def fake_yolo() -> Any:
+    FakeYOLO.exports = []
+    FakeYOLO.error = None
+    with patch.object(yolo_backend, "YOLO", FakeYOLO):
+        yield FakeYOLO
+
+
+@pytest.fixture
+def model(tmp_path: Path) -> Path:
+    path = tmp_path / "models" / "detector.pt"
+    path.parent.mkdir()
+    path.write_bytes(b"")
+
+    return path
+
+
+@pytest.mark.unit
+class TestYOLOBackendRegistry:
+    """Test cases for YOLOBackendRegistry"""
+
+    def test_artifact_path(self, tmp_path: Path, model: Path) -> None:
+        """Test artifact_path method names static exports per image size and honours cache_path"""
+        registry = YOLOBackendRegistry(YOLO_BACKENDS)
+        cached = YOLOBackendRegistry(YOLO_BACKENDS, cache_path=tmp_path / "cache")
+
+        assert registry.artifact_path("pytorch", model) == model
+        assert registry.artifact_path("onnx", model, image_size=320) \
+            == model.with_name("detector.onnx")
+        assert registry.artifact_path("torchscript", model, image_size=320) \
+            == model.with_name("detector_320.torchscript")
+        assert cached.artifact_path("onnx", model) \
+            == tmp_path / "cache" / "models" / "detector.onnx"
+
+    def test_unknown_backend(self) -> None:
+        """Test constructor rejects a backend that is not registered"""
+        with pytest.raises(ValueError, match="Unknown YOLO backend"):
+            YOLOBackendRegistry(YOLO_BACKENDS, backend="tensorrt")
+
+    def test_resolve_is_memoized_per_key(self, model: Path) -> None:
+        """Test resolve method selects once per model, task, device and set of image sizes"""
+        registry = YOLOBackendRegistry(BACKENDS, backend="pytorch")
+
+        original = registry._select # pylint: disable=protected-access
+        with patch.object(registry, "_select", wraps=original) as select:
+            first = registry.resolve(model, "detect", None, image_sizes=(640, 320, 640))
+            second = registry.resolve(model, "detect", None, image_sizes=(320, 640))
+            registry.resolve(model, "detect", "cuda:0", image_sizes=(320, 640))
+            registry.resolve(model, "segment", None, image_sizes=(320, 640))
+
+        assert first is second
+        assert [call.args for call in select.call_args_list] == [
+            (model, "detect", None, (320, 640)),
+            (model, "detect", "cuda:0", (320, 640)),
+            (model, "segment", None, (320, 640)),
+        ]
+
+    def test_resolve_keeps_pytorch_on_accelerators(self, fake_yolo: Any, model: Path) -> None:
+        """Test resolve method never exports a model served on an accelerator"""
+        registry = YOLOBackendRegistry(BACKENDS, backend="dynamic")
+
+        artifact = registry.resolve(model, "detect", "cuda:0")
+
+        assert artifact.backend.name == "pytorch"
+        assert artifact.path == model
+        assert not fake_yolo.exports
+
+    def test_resolve_forced_backend(self, fake_yolo: Any, model: Path) -> None:
+        """Test resolve method exports the forced backend at the served image size"""
+        registry = YOLOBackendRegistry(BACKENDS, backend="static")
+
+        artifact = registry.resolve(model, "detect", image_sizes=(320,))
+
+        assert artifact.backend.name == "static"
+        assert artifact.path == model.with_name("detector_320.static")
+        assert artifact.path.exists()
+        assert fake_yolo.exports == [(model, "static", 320)]
+
+    def test_resolve_skips_static_backend_for_many_sizes(
+        self,
+        fake_yolo: Any,
+        model: Path
+    ) -> None:
+        """Test resolve method keeps PyTorch when a static backend is forced for many sizes"""
+        registry = YOLOBackendRegistry(BACKENDS, backend="static")
+
+        artifact = registry.resolve(model, "detect", image_sizes=(320, 640))
+
+        assert artifact.backend.name == "pytorch"
+        assert not fake_yolo.exports
+
+    def test_resolve_reuses_up_to_date_artifact(self, fake_yolo: Any, model: Path) -> None:
+        """Test resolve method reuses an artifact until the model file changes"""
+        artifact = YOLOBackendRegistry(BACKENDS, backend="dynamic").resolve(model, "detect")
+        os.utime(model, (0, artifact.path.stat().st_mtime - 10))
+
+        reused = YOLOBackendRegistry(BACKENDS, backend="dynamic").resolve(model, "detect")
+        os.utime(model, (0, artifact.path.stat().st_mtime + 10))
+        refreshed = YOLOBackendRegistry(BACKENDS, backend="dynamic").resolve(model, "detect")
+
+        assert reused.path == refreshed.path == artifact.path
+        assert len(fake_yolo.exports) == 2
+
+    def test_resolve_exports_to_cache_path(
+        self,
+        fake_yolo: Any,
+        tmp_path: Path,
+        model: Path
+    ) -> None:
+        """Test resolve method copies the model to cache_path and exports it there"""
+        registry = YOLOBackendRegistry(BACKENDS, backend="dynamic", cache_path=tmp_path / "cache")
+
+        artifact = registry.resolve(model, "detect")
+
+        source = tmp_path / "cache" / "models" / "detector.pt"
+        assert source.exists()
+        assert artifact.path == source.with_name("detector.dynamic")
+        assert fake_yolo.exports == [(source, "dynamic", 640)]
+
+    def test_resolve_auto_picks_fastest_backend(self, fake_yolo: Any, model: Path) -> None:
+        """Test resolve method benchmarks available non-INT8 backends and picks the fastest"""
+        registry = YOLOBackendRegistry(BACKENDS)
+        timings = {"pytorch": 0.03, "static": 0.01, "dynamic": 0.02}
+
+        with patch.object(
+            registry,
+            "_benchmark",
+            side_effect=lambda artifact, *_: timings[artifact.backend.name]
+        ) as benchmark:
+            artifact = registry.resolve(model, "detect", image_sizes=(320,))
+
+        assert artifact.backend.name == "static"
+        assert sorted(call.args[0].backend.name for call in benchmark.call_args_list) \
+            == ["dynamic", "pytorch", "static"]
+
+    def test_resolve_auto_skips_failed_benchmark(self, fake_yolo: Any, model: Path) -> None:
+        """Test resolve method drops a backend whose benchmark fails"""
+        registry = YOLOBackendRegistry(BACKENDS)
+
+        def benchmark(artifact: Any, *_: Any) -> float:
+            if artifact.backend.name == "dynamic":
+                raise RuntimeError("unsupported operator")
+
+            return {"pytorch": 0.02, "static": 0.03}[artifact.backend.name]
+
+        with patch.object(registry, "_benchmark", side_effect=benchmark):
+            artifact = registry.resolve(model, "detect", image_sizes=(320,))
+
+        assert artifact.backend.name == "pytorch"
+
+    def test_resolve_falls_back_to_pytorch_when_export_fails(
+        self,
+        fake_yolo: Any,
+        model: Path,
+        caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test resolve method keeps PyTorch and logs when the export fails"""
+        fake_yolo.error = RuntimeError("export failed")
+        registry = YOLOBackendRegistry(BACKENDS, backend="dynamic")
+
+        with caplog.at_level(logging.WARNING):
+            artifact = registry.resolve(model, "detect")
+
+        assert artifact.backend.name == "pytorch"
+        assert artifact.path == model
+        assert "Failed to export" in caplog.text
+
+    def test_resolve_warns_without_writable_cache(
+        self,
+        fake_yolo: Any,
+        model: Path,
+        caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test resolve method keeps PyTorch and asks for a cache path on a read-only model dir"""
+        registry = YOLOBackendRegistry(BACKENDS, backend="dynamic")
+
+        with patch.object(yolo_backend.os, "access", return_value=False), \
+                caplog.at_level(logging.WARNING):
+            artifact = registry.resolve(model, "detect")
+
+        assert artifact.backend.name == "pytorch"
+        assert not fake_yolo.exports
+        assert "ML_YOLO_BACKEND_CACHE_PATH" in caplog.text
@@ -0,0 +1,162 @@
+# pylint: disable=unused-import,redefined-outer-name,too-many-positional-arguments,wrong-import-position
+import json
+
+from typing import Any
+from types import SimpleNamespace
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import cv2
+import numpy as np
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("ultralytics")
+
+from shared.infrastructure.service.ml.backend import yolo_quantizer
+from shared.infrastructure.service.ml.backend.yolo_backend import YOLOArtifact, YOLO_BACKENDS
+from shared.infrastructure.service.ml.backend.yolo_quantizer import YOLOQuantizer
+
+class FakeTensor:
+    def __init__(self, *values: Any) -> None:
+        self.value = np.array(values, dtype=np.float32)
+
+    def cpu(self) -> "FakeTensor":
+        return self
+
+    def numpy(self) -> Any:
+        return self.value
+
+
+class FakeBoxes(SimpleNamespace):
+    def __len__(self) -> int:
+        return len(self.cls.value)
+
+
+class FakeYOLO:
+    """Detects fixed boxes, the INT8 model confuses the class of the second one."""
+
+    names: dict[int, str] = {0: "car", 1: "truck", 2: "bus"}
+    boxes: dict[str, tuple[list[list[float]], list[int]]] = {
+        ".onnx": ([[0, 0, 10, 10], [20, 20, 30, 30]], [0, 1]),
+        "_int8_openvino_model": ([[0, 0, 10, 11], [20, 20, 30, 30]], [0, 2]),
+    }
+
+    def __init__(self, model: Path, task: str) -> None:
+        self.model = Path(model)
+        self.task = task
+
+    def predict(self, source: Any, verbose: bool) -> list[Any]:
+        assert source.ndim == 3
+        assert not verbose
+
+        xyxy, cls = next(
+            boxes for suffix, boxes in self.boxes.items()
+            if self.model.name.endswith(suffix)
+        )
+
+        return [SimpleNamespace(boxes=FakeBoxes(xyxy=FakeTensor(*xyxy), cls=FakeTensor(*cls)))]
+
+
+@pytest.fixture
+def frames(tmp_path: Path) -> Path:
+    path = tmp_path / "frames"
+    path.mkdir()
+    for index in range(10):
+        cv2.imwrite(str(path / f"{index}.jpg"), np.full((32, 32, 3), index * 20, dtype=np.uint8))
+
+    (path / "notes.txt").write_text("not a frame")
+
+    return path
+
+
+@pytest.fixture
+def registry(tmp_path: Path) -> Any:
+    datasets: list[dict[str, Any]] = []
+
+    def export(backend: str, model: Path, task: str, **options: Any) -> YOLOArtifact:
+        dataset = json.loads(Path(options["data"]).read_text(encoding="utf-8"))
+        images = Path(dataset["path"], dataset["train"])
+        dataset["images"] = images.read_text(encoding="utf-8").split()
+        datasets.append(dataset)
+
+        return YOLOArtifact(
+            backend=YOLO_BACKENDS[backend],
+            path=model.with_name(f"{model.stem}_int8_openvino_model")
+        )
+
+    return MagicMock(
+        resolve=MagicMock(return_value=YOLOArtifact(
+            backend=YOLO_BACKENDS["onnx"],
+            path=tmp_path / "detector.onnx"
+        )),
+        export=MagicMock(side_effect=export),
+        datasets=datasets
+    )
+
+
+@pytest.mark.unit
+class TestYOLOQuantizer:
+    """Test cases for YOLOQuantizer"""
+
+    def test_quantize(self, registry: Any, frames: Path, tmp_path: Path) -> None:
+        """Test quantize method calibrates on captured frames and compares to the served model"""
+        model = tmp_path / "detector.pt"
+
+        with patch.object(yolo_quantizer, "YOLO", FakeYOLO):
+            report = YOLOQuantizer(registry, holdout=0.2).quantize(model, "detect", frames)
+
+        registry.resolve.assert_called_once_with(model, "detect", "cpu")
+        assert registry.export.call_args.args == ("openvino_int8", model, "detect")
+        assert registry.datasets[0]["names"] == {"0": "car", "1": "truck", "2": "bus"}
+        assert len(registry.datasets[0]["images"]) == 8
+        assert report.reference.backend.name == "onnx"
+        assert report.quantized.backend.name == "openvino_int8"
+        assert report.calibration_frames == 8
+        assert report.evaluation_frames == 2
+        assert report.precision == report.recall == report.agreement == 0.5
+
+    def test_quantize_holds_out_frames_from_calibration(
+        self,
+        registry: Any,
+        frames: Path,
+        tmp_path: Path
+    ) -> None:
+        """Test quantize method never calibrates on the frames it evaluates with"""
+        model = tmp_path / "detector.pt"
+        evaluated: list[Any] = []
+
+        class RecordingYOLO(FakeYOLO):
+            def predict(self, source: Any, verbose: bool) -> list[Any]:
+                evaluated.append(int(source[0, 0, 0]))
+                return super().predict(source, verbose)
+
+        with patch.object(yolo_quantizer, "YOLO", RecordingYOLO):
+            YOLOQuantizer(registry, holdout=0.3).quantize(model, "detect", frames)
+
+        calibration = {int(Path(image).stem) * 20 for image in registry.datasets[0]["images"]}
+        assert len(calibration) == 7
+        assert len(set(evaluated)) == 3
+        assert not calibration & set(evaluated)
+
+    def test_quantize_rejects_non_pytorch_models(
+        self,
+        registry: Any,
+        frames: Path,
+        tmp_path: Path
+    ) -> None:
+        """Test quantize method only accepts .pt models"""
+        with pytest.raises(ValueError, match="Only PyTorch"):
+            YOLOQuantizer(registry).quantize(tmp_path / "detector.onnx", "detect", frames)
+
+    def test_quantize_needs_two_frames(self, registry: Any, tmp_path: Path) -> None:
+        """Test quantize method rejects a frames directory without a holdout to evaluate on"""
+        cv2.imwrite(str(tmp_path / "0.jpg"), np.zeros((8, 8, 3), dtype=np.uint8))
+
+        with pytest.raises(ValueError, match="Not enough captured frames"):
+            YOLOQuantizer(registry).quantize(tmp_path / "detector.pt", "detect", tmp_path)
+
+    def test_rejects_invalid_holdout(self, registry: Any) -> None:
+        """Test constructor rejects a holdout outside of (0, 1)"""
+        with pytest.raises(ValueError, match="holdout"):
+            YOLOQuantizer(registry, holdout=1)
@@ -0,0 +1,186 @@
+# pylint: disable=unused-import,redefined-outer-name,too-many-positional-arguments
+import asyncio
+
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from shared.application.service.ml.dto import detection
+from shared.infrastructure.tool.noop_worker_pool import NoopWorkerPool
+from shared.infrastructure.service.ml.provider.caching_provider import CachingMlDetectionProvider
+
+from tests.unit.shared.fixtures.infrastructure.dto.vo.fixtures import (
+    dynamic_cv2_images,
+    sample_cv2_image
+)
+
+def make_response(request: detection.Request) -> detection.Response:
+    return detection.Response(id=str(request.image_size), boxes=())
+
+
+@pytest.fixture
+def mock_detection_provider() -> Any:
+    return AsyncMock(side_effect=make_response)
+
+
+@pytest.mark.unit
+class TestCachingMlDetectionProvider:
+    """Test cases for CachingMlDetectionProvider"""
+
+    @pytest.mark.asyncio
+    async def test_predict_returns_cached_response(
+        self,
+        mock_detection_provider: Any,
+        sample_cv2_image: Any
+    ) -> None:
+        """Test predict method reuses the response for the same frame and options"""
+        provider = CachingMlDetectionProvider(
+            AsyncMock(predict=mock_detection_provider),
+            NoopWorkerPool(),
+            max_size=4
+        )
+        request = detection.Request(source=sample_cv2_image, image_size=640)
+
+        first = await provider.predict(request)
+        second = await provider.predict(request)
+
+        assert second is first
+        assert mock_detection_provider.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_predict_separates_keys_by_options(
+        self,
+        mock_detection_provider: Any,
+        sample_cv2_image: Any
+    ) -> None:
+        """Test predict method does not share responses across request options"""
+        provider = CachingMlDetectionProvider(
+            AsyncMock(predict=mock_detection_provider),
+            NoopWorkerPool(),
+            max_size=8
+        )
+        requests = (
+            detection.Request(source=sample_cv2_image, image_size=640),
+            detection.Request(source=sample_cv2_image, image_size=320),
+            detection.Request(source=sample_cv2_image, image_size=640, score_threshold=0.5),
+            detection.Request(source=sample_cv2_image, image_size=640, max_detections=1),
+            detection.Request(
+                source=sample_cv2_image,
+                image_size=640,
+                target_types=(detection.Type(id=0, name="license_plate"),)
+            ),
+        )
+
+        responses = [await provider.predict(request) for request in requests]
+
+        assert responses[1].id == "320"
+        assert mock_detection_provider.call_count == len(requests)
+        for request in requests:
+            await provider.predict(request)
+        assert mock_detection_provider.call_count == len(requests)
+
+    @pytest.mark.asyncio
+    async def test_predict_separates_keys_by_frame(
+        self,
+        mock_detection_provider: Any,
+        dynamic_cv2_images: Any
+    ) -> None:
+        """Test predict method keys responses by frame content"""
+        provider = CachingMlDetectionProvider(
+            AsyncMock(predict=mock_detection_provider),
+            NoopWorkerPool(),
+            max_size=4
+        )
+        images = dynamic_cv2_images(2)
+
+        for image in images:
+            await provider.predict(detection.Request(source=image))
+
+        assert mock_detection_provider.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_predict_evicts_least_recently_used(
+        self,
+        mock_detection_provider: Any,
+        dynamic_cv2_images: Any
+    ) -> None:
+        """Test predict method evicts the least recently used response when full"""
+        provider = CachingMlDetectionProvider(
+            AsyncMock(predict=mock_detection_provider),
+            NoopWorkerPool(),
+            max_size=2
+        )
+        first, second, third = (
+            detection.Request(source=image)
+            for image in dynamic_cv2_images(3)
+        )
+
+        await provider.predict(first)
+        await provider.predict(second)
+        await provider.predict(first)
+        await provider.predict(third)
+        assert mock_detection_provider.call_count == 3
+
+        await provider.predict(first)
+        assert mock_detection_provider.call_count == 3
+
+        await provider.predict(second)
+        assert mock_detection_provider.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_predict_shares_in_flight_misses(
+        self,
+        sample_cv2_image: Any
+    ) -> None:
+        """Test predict method runs concurrent misses for the same key once"""
+        release = asyncio.Event()
+
+        async def predict(request: detection.Request) -> detection.Response:
+            await release.wait()
+            return make_response(request)
+
+        mock_predict = AsyncMock(side_effect=predict)
+        provider = CachingMlDetectionProvider(
+            AsyncMock(predict=mock_predict),
+            NoopWorkerPool(),
+            max_size=4
+        )
+        request = detection.Request(source=sample_cv2_image, image_size=640)
+
+        tasks = [asyncio.create_task(provider.predict(request)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        responses = await asyncio.gather(*tasks)
+
+        assert all(response is responses[0] for response in responses)
+        assert mock_predict.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_predict_does_not_cache_failures(
+        self,
+        sample_cv2_image: Any
+    ) -> None:
+        """Test predict method propagates provider errors without caching them"""
+        mock_predict = AsyncMock(side_effect=[
+            RuntimeError("failed"),
+            detection.Response(boxes=())
+        ])
+        provider = CachingMlDetectionProvider(
+            AsyncMock(predict=mock_predict),
+            NoopWorkerPool(),
+            max_size=4
+        )
+        request = detection.Request(source=sample_cv2_image)
+
+        with pytest.raises(RuntimeError):
+            await provider.predict(request)
+        response = await provider.predict(request)
+
+        assert response.boxes == ()
+        assert mock_predict.call_count == 2
+
+    def test_init_rejects_non_positive_size(self) -> None:
+        """Test constructor rejects a non-positive max_size"""
+        with pytest.raises(ValueError):
+            CachingMlDetectionProvider(AsyncMock(), NoopWorkerPool(), max_size=0)
@@ -0,0 +1,219 @@
+# pylint: disable=unused-import,redefined-outer-name,too-many-positional-arguments,wrong-import-position
+import asyncio
+import logging
+
+from typing import Any
+from types import SimpleNamespace
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("ultralytics")
+
+from shared.application.service.ml.dto import detection
+from shared.infrastructure.tool.noop_worker_pool import NoopWorkerPool
+from shared.infrastructure.service.ml.provider.yolo_provider import YOLOMlDetectionProvider
+
+from tests.unit.shared.fixtures.infrastructure.dto.vo.fixtures import dynamic_cv2_images
+
+class FakeBoxes(SimpleNamespace):
+    def __len__(self) -> int:
+        return len(self.conf)
+
+
+class FakeModel:
+    """Detects one box per frame, scored by the mean of the frame."""
+
+    names: dict[int, str] = {0: "person", 2: "car", 7: "truck"}
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.error = error
+        self.calls: list[dict[str, Any]] = []
+
+    def predict(self, source: Any, **options: Any) -> list[Any]:
+        frames = source if isinstance(source, list) else [source]
+        self.calls.append({"frames": len(frames), **options})
+        if self.error is not None:
+            raise self.error
+
+        return [
+            SimpleNamespace(
+                names=self.names,
+                boxes=FakeBoxes(
+                    conf=np.array([frame.mean() / 255], dtype=np.float32),
+                    cls=np.array([2], dtype=np.float32),
+                    xyxy=np.array([[1, 2, 10, 20]], dtype=np.float32)
+                )
+            )
+            for frame in frames
+        ]
+
+
+def make_provider(model: FakeModel, **kwargs: Any) -> YOLOMlDetectionProvider:
+    with patch.object(YOLOMlDetectionProvider, "_make_model", return_value=model):
+        return YOLOMlDetectionProvider(
+            MagicMock(make_with_limits=MagicMock(return_value=NoopWorkerPool())),
+            Path("model.pt"),
+            "detect",
+            **kwargs
+        )
+
+
+def make_request(image: Any, **kwargs: Any) -> detection.Request:
+    return detection.Request(source=image, **kwargs)
+
+
+@pytest.mark.unit
+class TestYOLOMlDetectionProvider:
+    """Test cases for YOLOMlDetectionProvider"""
+
+    @pytest.mark.asyncio
+    async def test_predict_batches_concurrent_requests(self, dynamic_cv2_images: Any) -> None:
+        """Test predict method runs requests arriving within the window as one model call"""
+        model = FakeModel()
+        provider = make_provider(
+            model,
+            batch_max_size=8,
+            batch_window=timedelta(milliseconds=10)
+        )
+        images = dynamic_cv2_images(3)
+
+        responses = await asyncio.gather(*(
+            provider.predict(make_request(image, image_size=640))
+            for image in images
+        ))
+
+        assert model.calls == [{"frames": 3, "imgsz": 640}]
+        assert [len(response.boxes) for response in responses] == [1, 1, 1]
+        assert [response.boxes[0].score for response in responses] == [
+            pytest.approx(image.data.frame().mean() / 255)
+            for image in images
+        ]
+
+    @pytest.mark.asyncio
+    async def test_predict_flushes_full_batch(self, dynamic_cv2_images: Any) -> None:
+        """Test predict method flushes a full batch without waiting for the window"""
+        model = FakeModel()
+        provider = make_provider(model, batch_max_size=2, batch_window=timedelta(hours=1))
+
+        await asyncio.wait_for(asyncio.gather(*(
+            provider.predict(make_request(image))
+            for image in dynamic_cv2_images(4)
+        )), timeout=1)
+
+        assert [call["frames"] for call in model.calls] == [2, 2]
+
+    @pytest.mark.asyncio
+    async def test_predict_splits_batch_by_options(self, dynamic_cv2_images: Any) -> None:
+        """Test predict method groups a batch into one model call per option set"""
+        model = FakeModel()
+        provider = make_provider(model, batch_max_size=4, batch_window=timedelta(hours=1))
+
+        await asyncio.gather(*(
+            provider.predict(make_request(image, image_size=size))
+            for image, size in zip(dynamic_cv2_images(4), (320, 640, 320, 640))
+        ))
+
+        assert sorted((call["imgsz"], call["frames"]) for call in model.calls) == [
+            (320, 2),
+            (640, 2),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_predict_rejects_every_request_of_failed_batch(
+        self,
+        dynamic_cv2_images: Any
+    ) -> None:
+        """Test predict method passes a failed model call to every waiting request"""
+        provider = make_provider(
+            FakeModel(error=RuntimeError("failed")),
+            batch_max_size=3,
+            batch_window=timedelta(hours=1)
+        )
+
+        results = await asyncio.gather(
+            *(provider.predict(make_request(image)) for image in dynamic_cv2_images(3)),
+            return_exceptions=True
+        )
+
+        assert [str(result) for result in results] == ["failed"] * 3
+
+    @pytest.mark.asyncio
+    async def test_predict_survives_cancelled_waiter(self, dynamic_cv2_images: Any) -> None:
+        """Test predict method still answers the other requests of a batch with a cancelled one"""
+        model = FakeModel()
+        provider = make_provider(
+            model,
+            batch_max_size=8,
+            batch_window=timedelta(milliseconds=10)
+        )
+        tasks = [
+            asyncio.create_task(provider.predict(make_request(image)))
+            for image in dynamic_cv2_images(3)
+        ]
+        await asyncio.sleep(0)
+
+        tasks[1].cancel()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert isinstance(results[1], asyncio.CancelledError)
+        assert isinstance(results[0], detection.Response)
+        assert isinstance(results[2], detection.Response)
+        assert model.calls == [{"frames": 3}]
+        await asyncio.sleep(0)
+        assert not provider._batch_tasks # pylint: disable=protected-access
+
+    @pytest.mark.asyncio
+    async def test_predict_maps_target_types_by_name(self, dynamic_cv2_images: Any) -> None:
+        """Test predict method passes options and the model class ids of the target names"""
+        model = FakeModel()
+        provider = make_provider(model)
+
+        response = await provider.predict(make_request(
+            dynamic_cv2_images(1)[0],
+            image_size=320,
+            score_threshold=0.1,
+            max_detections=5,
+            target_types=(
+                detection.Type(id=7, name="car"),
+                detection.Type(id=3, name="truck"),
+                detection.Type(id=0, name="bicycle"),
+            )
+        ))
+
+        assert model.calls == [{
+            "frames": 1,
+            "imgsz": 320,
+            "conf": 0.1,
+            "max_det": 5,
+            "classes": (2, 7),
+        }]
+        assert [box.type for box in response.boxes] == [detection.Type(id=2, name="car")]
+
+    @pytest.mark.asyncio
+    async def test_predict_without_matching_target_types(
+        self,
+        dynamic_cv2_images: Any,
+        caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test predict method skips the model and warns once when no target type is a class"""
+        model = FakeModel()
+        provider = make_provider(model)
+        request = make_request(
+            dynamic_cv2_images(1)[0],
+            target_types=(detection.Type(id=2, name="vehicle"),)
+        )
+
+        with caplog.at_level(logging.WARNING):
+            responses = [await provider.predict(request) for _ in range(3)]
+
+        assert not model.calls
+        assert [response.boxes for response in responses] == [(), (), ()]
+        assert len([
+            record for record in caplog.records
+            if "None of the target types" in record.getMessage()
+        ]) == 1
@@ -0,0 +1,133 @@
+# pylint: disable=unused-import,redefined-outer-name,too-many-positional-arguments
+import asyncio
+
+from typing import Any, ParamSpec, TypeVar
+from pathlib import Path
+from collections.abc import Callable
+from unittest.mock import patch
+
+import pytest
+
+from shared.application.tool.worker_pool import WorkerPool
+from shared.infrastructure.tool.noop_worker_pool import NoopWorkerPool
+from shared.infrastructure.tool.frame_capture import file_frame_capture
+from shared.infrastructure.tool.frame_capture.file_frame_capture import FileFrameCapture
+
+from tests.unit.shared.fixtures.infrastructure.dto.vo.fixtures import dynamic_cv2_images
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+class GatedWorkerPool(WorkerPool):
+    """Holds every job until the gate is opened."""
+
+    def __init__(self) -> None:
+        self.gate = asyncio.Event()
+
+    async def run(
+        self,
+        func: Callable[_P, _R],
+        /,
+        *args: _P.args,
+        **kwargs: _P.kwargs,
+    ) -> _R:
+        await self.gate.wait()
+
+        return func(*args, **kwargs)
+
+    async def shutdown(self) -> None:
+        pass
+
+
+def captured(path: Path) -> list[Path]:
+    return sorted(path.glob("*.jpg"))
+
+
+@pytest.mark.unit
+class TestFileFrameCapture:
+    """Test cases for FileFrameCapture"""
+
+    @pytest.mark.asyncio
+    async def test_capture_writes_sampled_frames(
+        self,
+        tmp_path: Path,
+        dynamic_cv2_images: Any
+    ) -> None:
+        """Test capture method writes only the frames drawn below the rate"""
+        frame_capture = FileFrameCapture(tmp_path, NoopWorkerPool(), rate=0.5, max_frames=10)
+
+        with patch.object(file_frame_capture.random, "random", side_effect=[0.1, 0.5, 0.9, 0.4]):
+            for image in dynamic_cv2_images(4):
+                await frame_capture.capture(image)
+
+            await frame_capture.shutdown()
+
+        assert len(captured(tmp_path)) == 2
+        assert not list(tmp_path.glob(".*.tmp"))
+
+    @pytest.mark.asyncio
+    async def test_capture_stops_at_max_frames(
+        self,
+        tmp_path: Path,
+        dynamic_cv2_images: Any
+    ) -> None:
+        """Test capture method counts existing frames and stops once the directory is full"""
+        (tmp_path / "existing.jpg").write_bytes(b"")
+        frame_capture = FileFrameCapture(tmp_path, NoopWorkerPool(), rate=1, max_frames=3)
+
+        for image in dynamic_cv2_images(5):
+            await frame_capture.capture(image)
+            await frame_capture.shutdown()
+
+        assert len(captured(tmp_path)) == 3
+
+    @pytest.mark.asyncio
+    async def test_capture_does_not_wait_for_the_write(
+        self,
+        tmp_path: Path,
+        dynamic_cv2_images: Any
+    ) -> None:
+        """Test capture method returns before the frame is written and bounds pending writes"""
+        worker_pool = GatedWorkerPool()
+        frame_capture = FileFrameCapture(
+            tmp_path,
+            worker_pool,
+            rate=1,
+            max_frames=10,
+            max_pending=2
+        )
+
+        for image in dynamic_cv2_images(4):
+            await asyncio.wait_for(frame_capture.capture(image), timeout=1)
+
+        assert not captured(tmp_path)
+
+        worker_pool.gate.set()
+        await frame_capture.shutdown()
+
+        assert len(captured(tmp_path)) == 2
+
+    @pytest.mark.asyncio
+    async def test_capture_releases_failed_writes(
+        self,
+        tmp_path: Path,
+        dynamic_cv2_images: Any
+    ) -> None:
+        """Test capture method does not count a frame whose write failed"""
+        frame_capture = FileFrameCapture(tmp_path, NoopWorkerPool(), rate=1, max_frames=1)
+        image, other = dynamic_cv2_images(2)
+
+        with patch.object(file_frame_capture.os, "replace", side_effect=OSError("disk full")):
+            await frame_capture.capture(image)
+            await frame_capture.shutdown()
+
+        await frame_capture.capture(other)
+        await frame_capture.shutdown()
+
+        assert len(captured(tmp_path)) == 1
+        assert not list(tmp_path.glob(".*.tmp"))
+
+    def test_rejects_invalid_rate(self, tmp_path: Path) -> None:
+        """Test constructor rejects a rate outside of [0, 1]"""
+        with pytest.raises(ValueError, match="rate"):
+            FileFrameCapture(tmp_path, NoopWorkerPool(), rate=1.5, max_frames=1)
@@ -0,0 +1,163 @@
+# pylint: disable=unused-import,redefined-outer-name,too-many-positional-arguments
+import asyncio
+
+from typing import Any
+from dataclasses import dataclass
+from datetime import timedelta, datetime, UTC
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from shared.application.tool.image_cache import ImageCacheRecord
+from shared.infrastructure.tool.noop_worker_pool import NoopWorkerPool
+from shared.infrastructure.tool.image_cache.similarity_image_cache import SimilarityImageCache
+from shared.infrastructure.tool.image_cache.default_image_cache_registry import (
+    DefaultImageCacheRegistry
+)
+from shared.infrastructure.tool.image_cache.file_image_cache_snapshot import FileImageCacheSnapshot
+
+from tests.unit.shared.fixtures.infrastructure.tool.image_cache.fixtures import FakeImageSimilarity
+
+@dataclass(frozen=True, slots=True)
+class SnapshotValue:
+    label: str
+    score: float | None
+
+
+def make_cache(bits: int = 64) -> SimilarityImageCache[SnapshotValue]:
+    return SimilarityImageCache(
+        max_size=100,
+        partition_max_size=10,
+        tolerance=0.1,
+        similarity=FakeImageSimilarity(bits=bits)
+    )
+
+
+def make_snapshot(path: Path, cache: Any) -> FileImageCacheSnapshot:
+    return FileImageCacheSnapshot(
+        path,
+        DefaultImageCacheRegistry({"test": cache}),
+        NoopWorkerPool(),
+        interval=timedelta(seconds=60),
+        value_types={"test": SnapshotValue}
+    )
+
+
+def create_records(bits: int, count: int) -> tuple[ImageCacheRecord[SnapshotValue], ...]:
+    expires_at = datetime.now(UTC) + timedelta(hours=1)
+
+    return tuple(
+        ImageCacheRecord(
+            fingerprint=(((i + 1) * 0x9E3779B97F4A7C15) ** 4 % (1 << bits),),
+            value=SnapshotValue(label=f"value-{i}", score=i / 10 if i % 2 else None),
+            partition=f"spot-{i % 3}" if i % 4 else None,
+            expires_at=expires_at if i % 2 else None
+        )
+        for i in range(count)
+    )
+
+
+@pytest.mark.unit
+class TestFileImageCacheSnapshot:
+    """Test cases for FileImageCacheSnapshot"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("bits", [63, 64, 256])
+    async def test_restore_round_trip(self, tmp_path: Path, bits: int) -> None:
+        """Test restore method loads exactly the records that were persisted"""
+        cache = make_cache(bits)
+        records = create_records(bits, 12)
+        await cache.load(records)
+        await make_snapshot(tmp_path, cache).persist()
+
+        restored = make_cache(bits)
+        await make_snapshot(tmp_path, restored).restore()
+
+        assert set(await restored.dump()) == set(records)
+        assert all(
+            isinstance(record.value, SnapshotValue)
+            for record in await restored.dump()
+        )
+
+    @pytest.mark.asyncio
+    async def test_restore_empty_cache(self, tmp_path: Path) -> None:
+        """Test restore method with a snapshot of an empty cache"""
+        await make_snapshot(tmp_path, make_cache()).persist()
+
+        restored = make_cache()
+        await make_snapshot(tmp_path, restored).restore()
+
+        assert await restored.dump() == ()
+
+    @pytest.mark.asyncio
+    async def test_restore_skips_expired_records(self, tmp_path: Path) -> None:
+        """Test restore method drops records that expired after being persisted"""
+        cache = make_cache()
+        expired = ImageCacheRecord(
+            fingerprint=(1,),
+            value=SnapshotValue(label="expired", score=None),
+            partition=None,
+            expires_at=datetime.now(UTC) - timedelta(seconds=1)
+        )
+        await make_snapshot(tmp_path, AsyncMock(dump=AsyncMock(return_value=(expired,)))).persist()
+
+        await make_snapshot(tmp_path, cache).restore()
+
+        assert await cache.dump() == ()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"",
+            b"not a snapshot",
+            b"SPCSNAP2" + (5).to_bytes(8, "little") + b"{bad}",
+        ]
+    )
+    async def test_restore_skips_unreadable_file(self, tmp_path: Path, data: bytes) -> None:
+        """Test restore method ignores files that are not valid snapshots"""
+        (tmp_path / "test.snapshot").write_bytes(data)
+        cache = make_cache()
+
+        await make_snapshot(tmp_path, cache).restore()
+
+        assert await cache.dump() == ()
+
+    @pytest.mark.asyncio
+    async def test_restore_rejects_values_of_another_type(self, tmp_path: Path) -> None:
+        """Test restore method skips snapshots whose values do not match the value type"""
+        cache = make_cache()
+        await cache.load(create_records(64, 3))
+        snapshot = make_snapshot(tmp_path, cache)
+        await snapshot.persist()
+        path = tmp_path / "test.snapshot"
+        path.write_bytes(path.read_bytes().replace(b'"label"', b'"other"'))
+
+        restored = make_cache()
+        await make_snapshot(tmp_path, restored).restore()
+
+        assert await restored.dump() == ()
+
+    @pytest.mark.asyncio
+    async def test_persist_periodically_survives_failures(self, tmp_path: Path) -> None:
+        """Test persist_periodically method keeps running after a failed persist"""
+        mock_cache = AsyncMock()
+        mock_cache.dump.side_effect = [RuntimeError("failed"), (), ()]
+        snapshot = FileImageCacheSnapshot(
+            tmp_path,
+            DefaultImageCacheRegistry({"test": mock_cache}),
+            NoopWorkerPool(),
+            interval=timedelta(0),
+            value_types={"test": SnapshotValue}
+        )
+
+        task = asyncio.create_task(snapshot.persist_periodically())
+        for _ in range(10):
+            await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert mock_cache.dump.call_count >= 2
+        assert (tmp_path / "test.snapshot").is_file()
@@ -0,0 +1,89 @@
+# pylint: disable=unused-import,redefined-outer-name,too-many-positional-arguments
+import random
+
+import pytest
+
+from shared.infrastructure.tool.image_cache.fingerprint_matrix import FingerprintMatrix
+
+from tests.unit.shared.fixtures.infrastructure.tool.image_cache.fixtures import (
+    brute_force,
+    create_fingerprints
+)
+
+@pytest.mark.unit
+class TestFingerprintMatrix:
+    """Test cases for FingerprintMatrix"""
+
+    @pytest.mark.parametrize(
+        ("bits", "thresholds", "capacity"),
+        [
+            ((64,), (0,), 64),
+            ((63,), (9,), 200),
+            ((256,), (51,), 100),
+            ((63, 64), (2, 5), 300),
+            ((35, 256), (7, 51), 64),
+        ]
+    )
+    def test_match_equals_brute_force(
+        self,
+        bits: tuple[int, ...],
+        thresholds: tuple[int, ...],
+        capacity: int
+    ) -> None:
+        """Test match method returns exactly the fingerprints within the threshold"""
+        matrix: FingerprintMatrix[tuple[int, ...]] = FingerprintMatrix(
+            bits,
+            thresholds,
+            capacity=capacity
+        )
+        stored, probes = create_fingerprints(bits, thresholds, capacity, seed=capacity)
+        for fingerprint in stored:
+            matrix.add(fingerprint, fingerprint)
+
+        matches = matrix.match(probes)
+
+        assert len(matrix) == len(set(stored))
+        assert len(matches) == len(probes)
+        for probe, keys in zip(probes, matches):
+            assert len(keys) == len(set(keys))
+            assert set(keys) == brute_force(stored, probe, thresholds)
+
+    def test_match_reuses_removed_slots(self) -> None:
+        """Test match method skips removed fingerprints and reuses their slots"""
+        bits, thresholds = (64,), (4,)
+        matrix: FingerprintMatrix[tuple[int, ...]] = FingerprintMatrix(
+            bits,
+            thresholds,
+            capacity=64
+        )
+        stored, probes = create_fingerprints(bits, thresholds, 64, seed=2)
+        for fingerprint in stored:
+            matrix.add(fingerprint, fingerprint)
+
+        for fingerprint in stored[:32]:
+            matrix.remove(fingerprint, fingerprint)
+        replacements = [
+            (random.Random(i).getrandbits(64),)
+            for i in range(32)
+        ]
+        for fingerprint in replacements:
+            matrix.add(fingerprint, fingerprint)
+
+        kept = stored[32:] + replacements
+        for probe, keys in zip(probes, matrix.match(probes)):
+            assert set(keys) == brute_force(kept, probe, thresholds)
+
+    def test_add_rejects_overflow(self) -> None:
+        """Test add method raises when the matrix is full"""
+        matrix: FingerprintMatrix[int] = FingerprintMatrix((64,), (4,), capacity=2)
+        matrix.add(1, (1,))
+        matrix.add(2, (2,))
+
+        with pytest.raises(OverflowError):
+            matrix.add(3, (3,))
+
+    def test_match_empty(self) -> None:
+        """Test match method with no probes"""
+        matrix: FingerprintMatrix[int] = FingerprintMatrix((64,), (4,), capacity=2)
+
+        assert matrix.match([]) == ()
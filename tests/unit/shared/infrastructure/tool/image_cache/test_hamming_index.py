@@ -0,0 +1,71 @@
+# pylint: disable=unused-import,redefined-outer-name,too-many-positional-arguments
+import pytest
+
+from shared.infrastructure.tool.image_cache.hamming_index import HammingIndex
+
+from tests.unit.shared.fixtures.infrastructure.tool.image_cache.fixtures import (
+    brute_force,
+    create_fingerprints
+)
+
+@pytest.mark.unit
+class TestHammingIndex:
+    """Test cases for HammingIndex"""
+
+    @pytest.mark.parametrize(
+        ("bits", "thresholds", "capacity"),
+        [
+            ((64,), (0,), 256),
+            ((64,), (6,), 256),
+            ((64,), (12,), 16),
+            ((63,), (3,), 1024),
+            ((63,), (9,), 1024),
+            ((63,), (20,), 4),
+            ((63, 64), (2, 5), 1024),
+            ((63, 64), (7, 0), 64),
+            ((64,), (64,), 32),
+        ]
+    )
+    def test_candidates_contain_all_matches(
+        self,
+        bits: tuple[int, ...],
+        thresholds: tuple[int, ...],
+        capacity: int
+    ) -> None:
+        """Test candidates method returns every stored fingerprint within the threshold"""
+        index: HammingIndex[tuple[int, ...]] = HammingIndex(
+            bits,
+            thresholds,
+            capacity=capacity
+        )
+        stored, probes = create_fingerprints(bits, thresholds, capacity, seed=capacity)
+        for fingerprint in stored:
+            index.add(fingerprint, fingerprint)
+
+        assert len(index) == len(set(stored))
+        for probe in probes:
+            expected = brute_force(stored, probe, thresholds)
+
+            assert expected <= index.candidates(probe)
+
+    def test_candidates_skip_removed(self) -> None:
+        """Test candidates method does not return removed fingerprints"""
+        bits, thresholds = (63,), (4,)
+        index: HammingIndex[tuple[int, ...]] = HammingIndex(bits, thresholds, capacity=64)
+        stored, probes = create_fingerprints(bits, thresholds, 64, seed=1)
+        for fingerprint in stored:
+            index.add(fingerprint, fingerprint)
+
+        removed = set(stored[::2])
+        for fingerprint in removed:
+            index.remove(fingerprint, fingerprint)
+
+        assert len(index) == len(set(stored) - removed)
+        for probe in probes:
+            assert not removed & index.candidates(probe)
+            assert brute_force(stored[1::2], probe, thresholds) <= index.candidates(probe)
+
+    def test_init_rejects_mismatched_components(self) -> None:
+        """Test constructor rejects bits and thresholds of different lengths"""
+        with pytest.raises(ValueError):
+            HammingIndex((64, 64), (4,), capacity=16)
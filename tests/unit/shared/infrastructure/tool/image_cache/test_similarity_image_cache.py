@@ -0,0 +1,222 @@
+# pylint: disable=unused-import,redefined-outer-name,too-many-positional-arguments
+from typing import Any
+from datetime import timedelta
+
+import pytest
+
+from shared.infrastructure.tool.image_cache.similarity_image_cache import SimilarityImageCache
+
+from tests.unit.shared.fixtures.infrastructure.tool.image_cache.fixtures import (
+    fake_image_similarity,
+    dynamic_fingerprint_images
+)
+
+def sizes(stats: Any) -> dict[str | None, int]:
+    return {item.partition: item.size for item in stats}
+
+
+@pytest.mark.unit
+class TestSimilarityImageCache:
+    """Test cases for SimilarityImageCache"""
+
+    @pytest.mark.asyncio
+    async def test_get_similar_image(
+        self,
+        fake_image_similarity: Any,
+        dynamic_fingerprint_images: Any
+    ) -> None:
+        """Test get method returns values of images within the threshold only"""
+        cache: SimilarityImageCache[str] = SimilarityImageCache(
+            max_size=10,
+            tolerance=0.1,
+            similarity=fake_image_similarity
+        )
+        await cache.put(dynamic_fingerprint_images(0b1111), "stored")
+
+        assert await cache.get(dynamic_fingerprint_images(0b1110)) == "stored"
+        assert await cache.get(dynamic_fingerprint_images(0xFF00)) is None
+
+    @pytest.mark.asyncio
+    async def test_get_many_matches_get(
+        self,
+        fake_image_similarity: Any,
+        dynamic_fingerprint_images: Any
+    ) -> None:
+        """Test get_many method returns the same values as get per partition"""
+        cache: SimilarityImageCache[int] = SimilarityImageCache(
+            max_size=100,
+            partition_max_size=10,
+            tolerance=0.1,
+            similarity=fake_image_similarity
+        )
+        await cache.put_many(
+            tuple((dynamic_fingerprint_images(0xFF << 8 * i), i) for i in range(8)),
+            partitions=tuple("a" if i % 2 else "b" for i in range(8))
+        )
+        probes = tuple(dynamic_fingerprint_images((0xFF << 8 * (i % 8)) ^ 1) for i in range(10))
+        partitions = tuple("a" if i % 3 else "b" for i in range(10))
+
+        results = await cache.get_many(probes, partitions=partitions)
+
+        assert results == tuple([
+            await cache.get(probe, partition=partition)
+            for probe, partition in zip(probes, partitions)
+        ])
+        assert results[1] == 1
+        assert results[2] is None
+        assert results[6] == 6
+
+    @pytest.mark.asyncio
+    async def test_put_evicts_within_partition(
+        self,
+        fake_image_similarity: Any,
+        dynamic_fingerprint_images: Any
+    ) -> None:
+        """Test put method evicts the least recently used entry of a full partition"""
+        cache: SimilarityImageCache[int] = SimilarityImageCache(
+            max_size=10,
+            partition_max_size=2,
+            tolerance=0.1,
+            similarity=fake_image_similarity
+        )
+        images = [dynamic_fingerprint_images(0xFF << 8 * i) for i in range(3)]
+        await cache.put(images[0], 0, partition="a")
+        await cache.put(images[1], 1, partition="a")
+        await cache.put(images[2], 2, partition="b")
+        await cache.get(images[0], partition="a")
+        await cache.put(images[2], 2, partition="a")
+
+        assert await cache.get(images[1], partition="a") is None
+        assert await cache.get(images[0], partition="a") == 0
+        assert await cache.get(images[2], partition="b") == 2
+        assert sizes(await cache.stats()) == {"a": 2, "b": 1}
+
+    @pytest.mark.asyncio
+    async def test_put_evicts_across_partitions(
+        self,
+        fake_image_similarity: Any,
+        dynamic_fingerprint_images: Any
+    ) -> None:
+        """Test put method evicts from the least recently used partition when the cache is full"""
+        cache: SimilarityImageCache[int] = SimilarityImageCache(
+            max_size=3,
+            partition_max_size=2,
+            tolerance=0.1,
+            similarity=fake_image_similarity
+        )
+        images = [dynamic_fingerprint_images(0xFF << 8 * i) for i in range(4)]
+        await cache.put(images[0], 0, partition="a")
+        await cache.put(images[1], 1, partition="a")
+        await cache.put(images[2], 2, partition="b")
+        await cache.put(images[3], 3, partition="b")
+
+        assert sizes(await cache.stats()) == {"a": 1, "b": 2}
+        assert await cache.get(images[0], partition="a") is None
+        assert await cache.get(images[1], partition="a") == 1
+
+    @pytest.mark.asyncio
+    async def test_get_expires_entries(
+        self,
+        fake_image_similarity: Any,
+        dynamic_fingerprint_images: Any
+    ) -> None:
+        """Test get method drops expired entries and frees their capacity"""
+        cache: SimilarityImageCache[int] = SimilarityImageCache(
+            max_size=2,
+            tolerance=0.1,
+            similarity=fake_image_similarity
+        )
+        images = [dynamic_fingerprint_images(0xFF << 8 * i) for i in range(3)]
+        await cache.put(images[0], 0, ttl=timedelta(seconds=-1))
+        await cache.put(images[1], 1, ttl=timedelta(hours=1))
+
+        assert [record.value for record in await cache.dump()] == [1]
+        assert await cache.get(images[0]) is None
+        await cache.put(images[2], 2)
+
+        assert await cache.get(images[1]) == 1
+        assert await cache.get(images[2]) == 2
+        stats = (await cache.stats())[0]
+        assert stats.expirations == 1
+        assert stats.evictions == 0
+        assert stats.size == 2
+
+    @pytest.mark.asyncio
+    async def test_stats_bounded_for_unknown_partitions(
+        self,
+        fake_image_similarity: Any,
+        dynamic_fingerprint_images: Any
+    ) -> None:
+        """Test stats method keeps a bounded number of partitions without entries"""
+        cache: SimilarityImageCache[int] = SimilarityImageCache(
+            max_size=10,
+            tolerance=0.1,
+            similarity=fake_image_similarity
+        )
+        image = dynamic_fingerprint_images(0xFF)
+        await cache.put(image, 0, partition="stored")
+
+        await cache.get_many(
+            (image,) * 2000,
+            partitions=tuple(f"spot-{i}" for i in range(2000))
+        )
+
+        stats = await cache.stats()
+        assert len(stats) == 1 + 1024
+        assert sizes(stats)["stored"] == 1
+        assert "spot-0" not in sizes(stats)
+        assert sizes(stats)["spot-1999"] == 0
+
+    @pytest.mark.asyncio
+    async def test_stats_follow_segments(
+        self,
+        fake_image_similarity: Any,
+        dynamic_fingerprint_images: Any
+    ) -> None:
+        """Test stats method keeps misses before a put and counters of an evicted segment"""
+        cache: SimilarityImageCache[int] = SimilarityImageCache(
+            max_size=1,
+            tolerance=0.1,
+            similarity=fake_image_similarity
+        )
+        images = [dynamic_fingerprint_images(0xFF << 8 * i) for i in range(2)]
+        await cache.get(images[0], partition="a")
+        await cache.put(images[0], 0, partition="a")
+
+        stats = {item.partition: item for item in await cache.stats()}
+        assert stats["a"].misses == 1
+        assert stats["a"].size == 1
+
+        await cache.put(images[1], 1, partition="b")
+
+        stats = {item.partition: item for item in await cache.stats()}
+        assert sizes(stats.values()) == {"a": 0, "b": 1}
+        assert stats["a"].misses == 1
+        assert stats["a"].evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_stats_keep_counters_of_emptied_segments(
+        self,
+        fake_image_similarity: Any,
+        dynamic_fingerprint_images: Any
+    ) -> None:
+        """Test stats method reports expirations and evictions that emptied a partition"""
+        cache: SimilarityImageCache[int] = SimilarityImageCache(
+            max_size=1,
+            tolerance=0.1,
+            similarity=fake_image_similarity
+        )
+        images = [dynamic_fingerprint_images(0xFF << 8 * i) for i in range(3)]
+        await cache.put(images[0], 0, ttl=timedelta(seconds=-1), partition="a")
+        await cache.get(images[0], partition="a")
+        await cache.put(images[1], 1, partition="b")
+        await cache.get(images[1], partition="b")
+        await cache.put(images[2], 2, partition="c")
+
+        stats = {item.partition: item for item in await cache.stats()}
+        assert sizes(stats.values()) == {"a": 0, "b": 0, "c": 1}
+        assert stats["a"].expirations == 1
+        assert stats["a"].misses == 1
+        assert stats["a"].latency > timedelta(0)
+        assert stats["b"].evictions == 1
+        assert stats["b"].hits == 1
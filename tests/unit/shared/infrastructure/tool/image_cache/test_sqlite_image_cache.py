@@ -0,0 +1,202 @@
+# pylint: disable=unused-import,redefined-outer-name,too-many-positional-arguments
+import sqlite3
+
+from typing import Any
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from shared.infrastructure.tool.noop_worker_pool import NoopWorkerPool
+from shared.infrastructure.tool.image_cache.sqlite_image_cache import SqliteImageCache
+from shared.infrastructure.tool.image_cache.fingerprint_matrix import FingerprintMatrix
+
+from tests.unit.shared.fixtures.infrastructure.tool.image_cache.fixtures import (
+    FakeImageSimilarity,
+    dynamic_fingerprint_images
+)
+
+@dataclass(frozen=True, slots=True)
+class SqliteValue:
+    label: str
+
+
+def make_cache(path: Path, **kwargs: Any) -> SqliteImageCache[SqliteValue]:
+    return SqliteImageCache(
+        path=path / "cache.sqlite3",
+        name="test",
+        value_type=SqliteValue,
+        max_size=kwargs.pop("max_size", 10),
+        tolerance=0.1,
+        similarity=FakeImageSimilarity(),
+        worker_pool=NoopWorkerPool(),
+        **kwargs
+    )
+
+
+@pytest.mark.unit
+class TestSqliteImageCache:
+    """Test cases for SqliteImageCache"""
+
+    @pytest.mark.asyncio
+    async def test_get_returns_typed_value(
+        self,
+        tmp_path: Path,
+        dynamic_fingerprint_images: Any
+    ) -> None:
+        """Test get method returns the stored value decoded into the value type"""
+        cache = make_cache(tmp_path)
+        await cache.put(dynamic_fingerprint_images(0xFF), SqliteValue(label="stored"))
+
+        result = await cache.get(dynamic_fingerprint_images(0xFE))
+
+        assert result == SqliteValue(label="stored")
+        assert await cache.get(dynamic_fingerprint_images(0xFF00)) is None
+
+    @pytest.mark.asyncio
+    async def test_get_does_not_write(
+        self,
+        tmp_path: Path,
+        dynamic_fingerprint_images: Any
+    ) -> None:
+        """Test get method leaves the database untouched for other connections"""
+        cache = make_cache(tmp_path)
+        await cache.put(dynamic_fingerprint_images(0xFF), SqliteValue(label="stored"))
+
+        with sqlite3.connect(tmp_path / "cache.sqlite3") as connection:
+            version = connection.execute("PRAGMA data_version").fetchone()[0]
+            for _ in range(3):
+                await cache.get(dynamic_fingerprint_images(0xFF))
+                await cache.get(dynamic_fingerprint_images(0xFF00))
+
+            assert connection.execute("PRAGMA data_version").fetchone()[0] == version
+
+    @pytest.mark.asyncio
+    async def test_put_evicts_least_recently_used(
+        self,
+        tmp_path: Path,
+        dynamic_fingerprint_images: Any
+    ) -> None:
+        """Test put method evicts by recency including hits buffered since the last write"""
+        cache = make_cache(tmp_path, partition_max_size=2)
+        images = [dynamic_fingerprint_images(0xFF << 8 * i) for i in range(3)]
+        await cache.put(images[0], SqliteValue(label="0"), partition="a")
+        await cache.put(images[1], SqliteValue(label="1"), partition="a")
+        await cache.get(images[0], partition="a")
+        await cache.put(images[2], SqliteValue(label="2"), partition="a")
+
+        assert await cache.get(images[1], partition="a") is None
+        assert await cache.get(images[0], partition="a") == SqliteValue(label="0")
+        stats = (await cache.stats())[0]
+        assert stats.evictions == 1
+        assert stats.size == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_purged_on_write(
+        self,
+        tmp_path: Path,
+        dynamic_fingerprint_images: Any
+    ) -> None:
+        """Test expired entries are skipped by lookups and purged by the next write"""
+        cache = make_cache(tmp_path)
+        images = [dynamic_fingerprint_images(0xFF << 8 * i) for i in range(2)]
+        await cache.put(images[0], SqliteValue(label="0"), ttl=timedelta(seconds=-1))
+
+        assert await cache.get(images[0]) is None
+        assert (await cache.stats())[0].size == 1
+
+        await cache.put(images[1], SqliteValue(label="1"))
+
+        stats = (await cache.stats())[0]
+        assert stats.expirations == 1
+        assert stats.size == 1
+        assert [record.value for record in await cache.dump()] == [SqliteValue(label="1")]
+
+    @pytest.mark.asyncio
+    async def test_get_sees_writes_of_other_connections(
+        self,
+        tmp_path: Path,
+        dynamic_fingerprint_images: Any
+    ) -> None:
+        """Test get method picks up entries written through another connection"""
+        reader = make_cache(tmp_path)
+        writer = make_cache(tmp_path)
+        image = dynamic_fingerprint_images(0xFF)
+
+        assert await reader.get(image) is None
+        await writer.put(image, SqliteValue(label="first"))
+        assert await reader.get(image) == SqliteValue(label="first")
+
+        await writer.put(image, SqliteValue(label="second"))
+        assert await reader.get(image) == SqliteValue(label="second")
+
+    @pytest.mark.asyncio
+    async def test_get_keeps_mirrors_of_unchanged_partitions(
+        self,
+        tmp_path: Path,
+        dynamic_fingerprint_images: Any
+    ) -> None:
+        """Test get method reloads only the partitions another connection wrote to"""
+        reader = make_cache(tmp_path)
+        writer = make_cache(tmp_path)
+        images = [dynamic_fingerprint_images(0xFF << 8 * i) for i in range(3)]
+        await writer.put(images[0], SqliteValue(label="a"), partition="a")
+        await writer.put(images[1], SqliteValue(label="b"), partition="b")
+        await reader.get(images[0], partition="a")
+        await reader.get(images[1], partition="b")
+
+        with patch.object(
+            FingerprintMatrix,
+            "add",
+            autospec=True,
+            side_effect=FingerprintMatrix.add
+        ) as mock_add:
+            await writer.put(images[2], SqliteValue(label="b2"), partition="b")
+
+            assert await reader.get(images[0], partition="a") == SqliteValue(label="a")
+            assert mock_add.call_count == 0
+            assert await reader.get(images[2], partition="b") == SqliteValue(label="b2")
+            assert mock_add.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stats_count_compared_fingerprints(
+        self,
+        tmp_path: Path,
+        dynamic_fingerprint_images: Any
+    ) -> None:
+        """Test stats method counts only the fingerprints a lookup compared"""
+        cache = make_cache(tmp_path)
+        images = [dynamic_fingerprint_images(0xFF << 8 * i) for i in range(4)]
+        await cache.put_many(tuple((image, SqliteValue(label="stored")) for image in images))
+
+        await cache.get(images[0])
+        await cache.get(dynamic_fingerprint_images(0xF0F0F0F0F0F0F0F0))
+
+        stats = (await cache.stats())[0]
+        assert stats.comparisons == 1
+        assert stats.hits == 1
+        assert stats.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_clears_older_schema(
+        self,
+        tmp_path: Path,
+        dynamic_fingerprint_images: Any
+    ) -> None:
+        """Test the cache drops a database written with an older schema"""
+        with sqlite3.connect(tmp_path / "cache.sqlite3") as connection:
+            connection.execute(
+                "CREATE TABLE image_cache (cache TEXT, partition TEXT, fingerprint BLOB,"
+                " value BLOB, expires_at REAL, used_at INTEGER)"
+            )
+            connection.execute(
+                "INSERT INTO image_cache VALUES ('test', '', ?, ?, NULL, 0)",
+                ((0xFF).to_bytes(8, "little"), b"\x80\x05pickled")
+            )
+
+        cache = make_cache(tmp_path)
+
+        assert await cache.get(dynamic_fingerprint_images(0xFF)) is None
+        assert await cache.dump() == ()
@@ -0,0 +1,85 @@
+# pylint: disable=unused-import,redefined-outer-name,too-many-positional-arguments
+from typing import Any
+from unittest.mock import patch
+
+import cv2
+import pytest
+
+from shared.infrastructure.tool.noop_worker_pool import NoopWorkerPool
+from shared.infrastructure.tool.image_similarity.image_similarity import ImageSimilarityEvaluator
+from shared.infrastructure.tool.image_similarity.dhash_similarity import DHashSimilarity
+from shared.infrastructure.tool.image_similarity.phash_similarity import PHashSimilarity
+
+from tests.unit.shared.fixtures.infrastructure.dto.vo.fixtures import dynamic_cv2_images
+
+def make_evaluator(*strategies: type[Any]) -> ImageSimilarityEvaluator:
+    worker_pool = NoopWorkerPool()
+
+    return ImageSimilarityEvaluator(
+        tuple(strategy(worker_pool) for strategy in strategies),
+        worker_pool
+    )
+
+
+@pytest.mark.unit
+class TestImageSimilarityEvaluator:
+    """Test cases for ImageSimilarityEvaluator"""
+
+    @pytest.mark.asyncio
+    async def test_fingerprint_computes_bundle_once(self, dynamic_cv2_images: Any) -> None:
+        """Test fingerprint method hashes one shared grayscale frame once per image"""
+        evaluator = make_evaluator(DHashSimilarity, PHashSimilarity)
+        image1, image2 = dynamic_cv2_images(2)
+
+        with (
+            patch("cv2.cvtColor", wraps=cv2.cvtColor) as mock_cvt_color,
+            patch.object(
+                DHashSimilarity,
+                "_get_gray_hash",
+                autospec=True,
+                side_effect=DHashSimilarity._get_gray_hash # pylint: disable=protected-access
+            ) as mock_dhash,
+            patch.object(
+                PHashSimilarity,
+                "_get_gray_hash",
+                autospec=True,
+                side_effect=PHashSimilarity._get_gray_hash # pylint: disable=protected-access
+            ) as mock_phash
+        ):
+            fingerprint = await evaluator.fingerprint(image1)
+            assert await evaluator.fingerprint(image1) == fingerprint
+            await evaluator.similar(image1, image2, tolerance=0.2)
+            await evaluator.similar(image2, image1, tolerance=0.2)
+
+        assert mock_cvt_color.call_count == 2
+        assert mock_dhash.call_count == 2
+        assert mock_phash.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_fingerprint_matches_strategies(self, dynamic_cv2_images: Any) -> None:
+        """Test fingerprint method bundles the fingerprints of the strategies in order"""
+        image, = dynamic_cv2_images(1)
+        worker_pool = NoopWorkerPool()
+
+        bundle = await make_evaluator(DHashSimilarity, PHashSimilarity).fingerprint(image)
+
+        assert bundle == (
+            *await DHashSimilarity(worker_pool).fingerprint(image),
+            *await PHashSimilarity(worker_pool).fingerprint(image),
+        )
+
+    @pytest.mark.asyncio
+    async def test_fingerprint_memo_separates_configurations(
+        self,
+        dynamic_cv2_images: Any
+    ) -> None:
+        """Test fingerprint method keeps the memo of each strategy mix apart"""
+        image, = dynamic_cv2_images(1)
+
+        dhash = await make_evaluator(DHashSimilarity).fingerprint(image)
+        bundle = await make_evaluator(DHashSimilarity, PHashSimilarity).fingerprint(image)
+        reversed_bundle = await make_evaluator(PHashSimilarity, DHashSimilarity).fingerprint(image)
+
+        assert len(dhash) == 1
+        assert bundle == (*dhash, bundle[1])
+        assert reversed_bundle == (bundle[1], *dhash)
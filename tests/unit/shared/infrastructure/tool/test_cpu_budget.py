@@ -0,0 +1,60 @@
+# pylint: disable=unused-import,redefined-outer-name,too-many-positional-arguments
+import pytest
+
+pytest.importorskip("torch")
+
+from shared.infrastructure.tool.cpu_budget import CpuBudget, CpuConsumer # pylint: disable=wrong-import-position
+
+@pytest.mark.unit
+class TestCpuBudget:
+    """Test cases for CpuBudget"""
+
+    def test_threads_split_between_all_instances(self) -> None:
+        """Test threads method gives every model instance a disjoint share of the cores"""
+        budget = CpuBudget(16, worker_pool_share=0.25, consumers={
+            "yolo": CpuConsumer(instances=4),
+            "hyperlpr": CpuConsumer(instances=2),
+        })
+
+        assert budget.worker_pool_threads == 4
+        assert budget.threads("yolo") == 2
+        assert budget.threads("hyperlpr") == 2
+        assert 4 * budget.threads("yolo") + 2 * budget.threads("hyperlpr") <= 12
+
+    def test_threads_leaves_fixed_consumers_out_of_split(self) -> None:
+        """Test threads method splits only the cores not taken by fixed consumers"""
+        budget = CpuBudget(16, worker_pool_share=0.25, consumers={
+            "yolo": CpuConsumer(instances=2, threads=4),
+            "hyperlpr": CpuConsumer(instances=2),
+        })
+
+        assert budget.threads("yolo") == 4
+        assert budget.threads("hyperlpr") == 2
+
+    def test_threads_keeps_one_thread_when_oversubscribed(self) -> None:
+        """Test threads method never hands out less than one thread"""
+        budget = CpuBudget(2, worker_pool_share=0.5, consumers={
+            "yolo": CpuConsumer(instances=8),
+        })
+
+        assert budget.threads("yolo") == 1
+
+    def test_threads_rejects_unknown_consumer(self) -> None:
+        """Test threads method rejects a consumer that was not registered"""
+        with pytest.raises(ValueError):
+            CpuBudget(4).threads("yolo")
+
+    def test_with_consumers_keeps_the_split(self) -> None:
+        """Test with_consumers method adds consumers to the same cores and worker pool share"""
+        budget = CpuBudget(16, worker_pool_share=0.25, consumers={
+            "yolo": CpuConsumer(instances=2, threads=4),
+        })
+
+        registered = budget.with_consumers({"hyperlpr": CpuConsumer(instances=2)})
+
+        assert registered.cores == 16
+        assert registered.worker_pool_threads == 4
+        assert registered.threads("yolo") == 4
+        assert registered.threads("hyperlpr") == 2
+        with pytest.raises(ValueError):
+            budget.threads("hyperlpr")
@@ -0,0 +1,115 @@
+# pylint: disable=unused-import,redefined-outer-name,too-many-positional-arguments
+import os
+import time
+import asyncio
+
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.shared_memory import SharedMemory
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from cv2.typing import MatLike
+
+from shared.infrastructure.tool import process_model_pool
+from shared.infrastructure.tool.process_model_pool import ProcessModelPool
+
+def make_model() -> int:
+    return 10
+
+
+def measure(model: int, frame: MatLike, offset: int) -> tuple[int, int, tuple[int, ...]]:
+    return model + offset, int(frame.sum()), frame.shape
+
+
+def crash(model: int, frame: MatLike) -> None:
+    os._exit(1)
+
+
+def wait(model: int, frame: MatLike, seconds: float) -> int:
+    time.sleep(seconds)
+    return model
+
+
+class RecordingSharedMemory(SharedMemory):
+    names: list[str] = []
+
+    def __init__(self, name: str | None = None, create: bool = False, size: int = 0) -> None:
+        super().__init__(name, create, size)
+        self.names.append(self.name)
+
+
+def is_linked(name: str) -> bool:
+    try:
+        memory = SharedMemory(name=name)
+    except FileNotFoundError:
+        return False
+
+    memory.close()
+    return True
+
+
+@pytest.mark.unit
+class TestProcessModelPool:
+    """Test cases for ProcessModelPool"""
+
+    @pytest.mark.asyncio
+    async def test_run_passes_model_and_frame(self) -> None:
+        """Test run method calls the function with the worker model and a copy of the frame"""
+        pool: ProcessModelPool[int] = ProcessModelPool(make_model, processes=1)
+        frame = np.arange(24, dtype=np.uint8).reshape(2, 4, 3)
+
+        try:
+            result = await pool.run(measure, frame, 5)
+        finally:
+            await pool.shutdown()
+
+        assert result == (15, int(frame.sum()), (2, 4, 3))
+
+    @pytest.mark.asyncio
+    async def test_run_recovers_from_a_killed_worker(self) -> None:
+        """Test run method fails the call of a dead worker and serves the next one"""
+        pool: ProcessModelPool[int] = ProcessModelPool(make_model, processes=1)
+        frame = np.ones((2, 2, 3), dtype=np.uint8)
+
+        try:
+            with pytest.raises(BrokenProcessPool):
+                await pool.run(crash, frame)
+
+            result = await pool.run(measure, frame, 1)
+        finally:
+            await pool.shutdown()
+
+        assert result == (11, 12, (2, 2, 3))
+
+    @pytest.mark.asyncio
+    async def test_run_keeps_the_frame_of_a_cancelled_call(self) -> None:
+        """Test run method unlinks the frame of a cancelled call only once the worker is done"""
+        pool: ProcessModelPool[int] = ProcessModelPool(make_model, processes=1)
+        frame = np.ones((2, 2, 3), dtype=np.uint8)
+        RecordingSharedMemory.names = []
+
+        try:
+            await pool.run(measure, frame, 0)
+            with patch.object(process_model_pool, "SharedMemory", RecordingSharedMemory):
+                task = asyncio.create_task(pool.run(wait, frame, 1.0))
+                await asyncio.sleep(0.3)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+
+            assert len(RecordingSharedMemory.names) == 1
+            name = RecordingSharedMemory.names[0]
+            assert is_linked(name)
+
+            assert await pool.run(measure, frame, 0) == (10, 12, (2, 2, 3))
+            await asyncio.sleep(0.1)
+            assert not is_linked(name)
+        finally:
+            await pool.shutdown()
+
+    def test_init_rejects_non_positive_processes(self) -> None:
+        """Test constructor rejects a non-positive number of processes"""
+        with pytest.raises(ValueError):
+            ProcessModelPool(make_model, processes=0)
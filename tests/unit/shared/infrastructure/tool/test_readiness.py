@@ -0,0 +1,29 @@
+# pylint: disable=unused-import,redefined-outer-name,too-many-positional-arguments
+import pytest
+
+from shared.application.tool.readiness import ReadinessState
+from shared.infrastructure.tool.readiness import DefaultReadiness
+
+@pytest.mark.unit
+class TestDefaultReadiness:
+    """Test cases for DefaultReadiness"""
+
+    def test_starts_warming_up(self) -> None:
+        """Test a new readiness reports warming up"""
+        assert DefaultReadiness().state() == ReadinessState.WARMING_UP
+
+    def test_mark_ready(self) -> None:
+        """Test mark_ready method switches to ready"""
+        readiness = DefaultReadiness()
+
+        readiness.mark_ready()
+
+        assert readiness.state() == ReadinessState.READY
+
+    def test_mark_failed(self) -> None:
+        """Test mark_failed method switches to failed"""
+        readiness = DefaultReadiness()
+
+        readiness.mark_failed()
+
+        assert readiness.state() == ReadinessState.FAILED
@@ -0,0 +1,57 @@
+# pylint: disable=unused-import,redefined-outer-name,too-many-positional-arguments
+import asyncio
+
+import pytest
+
+from shared.infrastructure.tool.replica_pool import ReplicaPool
+
+@pytest.mark.unit
+class TestReplicaPool:
+    """Test cases for ReplicaPool"""
+
+    @pytest.mark.asyncio
+    async def test_acquire_reuses_last_released_replica(self) -> None:
+        """Test acquire method hands out the most recently released idle replica"""
+        pool = ReplicaPool(["a", "b"])
+
+        async with pool.acquire() as first:
+            async with pool.acquire() as second:
+                assert {first, second} == {"a", "b"}
+
+        async with pool.acquire() as replica:
+            assert replica == first
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_release(self) -> None:
+        """Test acquire method waits until a busy replica is released"""
+        pool = ReplicaPool(["a"])
+
+        async def use() -> str:
+            async with pool.acquire() as replica:
+                return replica
+
+        async with pool.acquire():
+            waiting = asyncio.create_task(use())
+            await asyncio.sleep(0)
+            assert not waiting.done()
+
+        assert await waiting == "a"
+
+    def test_acquire_nowait_shares_replicas_with_acquire(self) -> None:
+        """Test acquire_nowait method takes replicas from the same idle set"""
+        pool = ReplicaPool(["a", "b"])
+
+        with pool.acquire_nowait() as first:
+            with pool.acquire_nowait() as second:
+                assert {first, second} == {"a", "b"}
+                with pytest.raises(RuntimeError):
+                    with pool.acquire_nowait():
+                        pass
+
+        with pool.acquire_nowait() as replica:
+            assert replica == first
+
+    def test_init_rejects_empty_replicas(self) -> None:
+        """Test constructor rejects an empty list of replicas"""
+        with pytest.raises(ValueError):
+            ReplicaPool([])